@@ -1,10 +1,14 @@
 """
 Core 모듈
 - 애플리케이션 핵심 관리 클래스들
+- GUI 스택을 불러오는 ApplicationManager 등은 처음 사용할 때만 임포트 (PEP 562 모듈 __getattr__)
+  (두 번째 실행 인스턴스가 core.single_instance만 가볍게 임포트할 수 있도록)
 """
-from .application_manager import ApplicationManager
-from .updater import Updater
-from .process_manager import ProcessManager
-
-__all__ = ['ApplicationManager', 'Updater', 'ProcessManager']
+from utils.lazy_exports import lazy_exports
 
+__getattr__, __all__ = lazy_exports(__name__, {
+    "ApplicationManager": ".application_manager",
+    "Updater": ".updater",
+    "UpdateCheckWorker": ".updater",
+    "ProcessManager": ".process_manager",
+})
@@ -8,18 +8,20 @@ import signal
 import atexit
 import logging
 import shutil
-from typing import Optional
+import tempfile
+import subprocess
+import time
+from typing import Optional, TYPE_CHECKING
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QMessageBox, QProgressDialog
+from PyQt5.QtCore import QTimer, Qt
 
 from utils.version import get_version, get_version_string
 from utils.exceptions import handle_exception
-from utils.paths import resource_path, ensure_data_directory_exists
+from utils.paths import resource_path, ensure_data_directory_exists, get_app_icon_path
 from utils.settings_manager import SettingsManager
-from notifications.notification_manager import NotificationManager
-from gui.widget import Widget
-from tray_icon import TrayIcon
+from utils.startup_profiler import StartupProfiler
+from gui.warm_start import show_warm_start_window
 from utils.auto_start import (
     is_auto_start_enabled, 
     enable_auto_start, 
@@ -27,6 +29,19 @@ from utils.auto_start import (
     get_executable_path
 )
 from .process_manager import ProcessManager
+from .single_instance import (
+    SingleInstanceServer,
+    COMMAND_RELOAD,
+    get_launch_command
+)
+
+if TYPE_CHECKING:
+    # 업데이트 모듈(requests 포함)은 start_update_check에서만 임포트 (시작 경로에서 제외)
+    from .updater import Updater, UpdateCheckWorker
+    # 위젯/트레이/알림 모듈은 웜 스타트 창을 표시한 뒤 임포트 (run, 시작 단계 참고)
+    from gui.widget import Widget
+    from notifications.notification_manager import NotificationManager
+    from tray_icon import TrayIcon
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +51,20 @@ class ApplicationManager:
     
     def __init__(self):
         self._cleanup_done = False
+        self._warm_start_frame_saved = False
         self.app: Optional[QApplication] = None
-        self.widget: Optional[Widget] = None
-        self.tray_icon: Optional[TrayIcon] = None
+        self.widget: Optional["Widget"] = None
+        self.tray_icon: Optional["TrayIcon"] = None
         self.settings_manager: Optional[SettingsManager] = None
-        self.notification_manager: Optional[NotificationManager] = None
+        self.notification_manager: Optional["NotificationManager"] = None
         self.process_manager = ProcessManager()
-        self.setup_environment()
+        self.update_worker: Optional["UpdateCheckWorker"] = None
+        self.instance_server: Optional[SingleInstanceServer] = None
+        self._startup_stages = []
+        self.warm_start_window = None
+        self.profiler = StartupProfiler.get_instance()
+        with self.profiler.phase("setup_environment"):
+            self.setup_environment()
     
     def setup_environment(self) -> None:
         """실행 환경 설정"""
@@ -100,12 +122,28 @@ class ApplicationManager:
         
         logger.info("리소스 정리 시작...")
         
+        # 다음 시작 시 먼저 표시할 그리드 이미지 저장
+        # (캡처 + PNG 인코딩 + 쓰기이므로 여러 종료 경로에서 호출되어도 한 번만)
+        if self.widget and not self._warm_start_frame_saved:
+            self._warm_start_frame_saved = True
+            try:
+                self.widget.save_warm_start_frame()
+            except Exception as e:
+                logger.error(f"웜 스타트 캐시 저장 중 오류: {e}")
+        
         # 모든 QTimer 중지 시도
         try:
             self.stop_timers()
         except Exception as e:
             logger.error(f"QTimer 중지 중 오류 발생: {e}")
         
+        # 단일 인스턴스 서버 종료 (소켓 파일 정리)
+        try:
+            if self.instance_server:
+                self.instance_server.close()
+        except Exception as e:
+            logger.error(f"단일 인스턴스 서버 종료 중 오류: {e}")
+        
         # 프로세스 정리
         try:
             self.process_manager.cleanup_all()
@@ -131,6 +169,7 @@ class ApplicationManager:
     def run(self) -> int:
         """애플리케이션 실행"""
         try:
+            run_start_ns = time.perf_counter_ns()
             self.setup_signal_handlers()
             atexit.register(self.final_cleanup)
             
@@ -139,34 +178,51 @@ class ApplicationManager:
             self.app.setApplicationName("학교 시간표 위젯")
             self.app.aboutToQuit.connect(self.cleanup_resources)
             
+            # 단일 인스턴스 보장: 이미 실행 중이면 명령만 전달하고 종료
+            # (main.py에서 GUI 임포트 전에 먼저 확인하지만, 동시에 실행된 경우를 위해
+            #  잠금 파일로 확인과 서버 시작을 원자적으로 한 번 더 수행)
+            self.instance_server = SingleInstanceServer()
+            if not self.instance_server.acquire(get_launch_command(sys.argv)):
+                logger.info("이미 실행 중인 인스턴스에 명령을 전달했습니다. 종료합니다.")
+                self.instance_server = None
+                return 0
+            self.instance_server.command_received.connect(self.handle_instance_command)
+            
+            # 이전 종료 시 저장한 그리드 이미지가 있으면 위젯 모듈 임포트와 설정 로드 전에 먼저 표시
+            # (메타데이터에 저장한 키와 위치만 사용)
+            self.warm_start_window = show_warm_start_window()
+            
+            from gui.widget import Widget
             self.settings_manager = SettingsManager.get_instance()
-            self.notification_manager = NotificationManager.get_instance()
             
-            # 애플리케이션 시작 시 자동 시작 설정 동기화
-            self._sync_auto_start_setting()
+            # 그 사이 설정 파일이 바뀌어 이미지가 현재 설정과 다르면 바로 닫음
+            if self.warm_start_window and not self.warm_start_window.matches(self.settings_manager):
+                logger.info("웜 스타트 이미지가 현재 설정과 달라 닫습니다.")
+                self._close_warm_start_window()
             
-            # Widget 생성
+            # Widget 생성 및 표시 (시간표 그리드를 가장 먼저 보여줌)
             self.widget = Widget(
                 settings_manager=self.settings_manager,
-                notification_manager=self.notification_manager,
                 app_manager=self
             )
             self.widget.cleanup_on_close = self.cleanup_resources
             self.widget.show()
             
-            # 트레이 아이콘 생성
-            self.tray_icon = TrayIcon(self.widget)
-            self.tray_icon.show_action.triggered.connect(self.widget.show)
-            self.tray_icon.exit_action.triggered.connect(self.safe_exit)
+            # 나머지 초기화는 이벤트 루프 진입 후 유휴 시점에 단계별로 수행
+            self._startup_stages = [
+                self._close_warm_start_window,  # 실제 그리드가 그려진 뒤 임시 창 닫기
+                self._create_notification_manager,
+                self._start_period_tracking,  # 알림 관리자 연결 후 알림 확인/예고 배치
+                self._create_tray_icon,
+                self._sync_auto_start_setting,
+                self.start_update_check,  # 업데이트 확인은 백그라운드로 실행
+            ]
+            QTimer.singleShot(0, self._run_next_startup_stage)
             
-            if not self.tray_icon.isSystemTrayAvailable() or not self.tray_icon.isVisible():
-                logger.warning("시스템 트레이를 사용할 수 없거나 아이콘이 표시되지 않습니다.")
-                from PyQt5.QtGui import QIcon
-                self.tray_icon.setIcon(
-                    QIcon(resource_path(os.path.join('assets', 'app_icon.ico')))
-                )
-            
-            self.tray_icon.show()
+            # 이벤트 루프 진입 전까지를 run 단계로 기록
+            # (첫 페인트 등이 끝내 발생하지 않는 경우를 대비해 일정 시간 후 강제로 기록)
+            self.profiler.record("run", run_start_ns, time.perf_counter_ns())
+            QTimer.singleShot(10000, self.profiler.finish)
             
             exit_code = self.app.exec_()
             logger.info(f"앱 종료됨 (코드: {exit_code}), 리소스 정리 시작")
@@ -178,6 +234,161 @@ class ApplicationManager:
             self.cleanup_resources()
             return 1
     
+    def handle_instance_command(self, command: str) -> None:
+        """다른 실행에서 전달된 명령 처리 ("show": 위젯 표시, "reload": 설정 다시 읽기 후 표시)"""
+        if not self.widget:
+            return
+        try:
+            if command == COMMAND_RELOAD:
+                # 설정 대화상자의 적용 경로와 동일하게 반영 (요일/교시 수 변경 포함)
+                self.settings_manager.load_all_settings()
+                self.widget.update_styles()
+                self.widget.sync_period_scheduler()
+                self.widget.apply_grid_dimensions()
+                self.widget.restart_countdown()
+            self.widget.show()
+            self.widget.activateWindow()
+        except Exception as e:
+            logger.error(f"인스턴스 명령 처리 중 오류 ({command}): {e}", exc_info=True)
+    
+    def _run_next_startup_stage(self) -> None:
+        """지연된 시작 단계를 하나씩 실행 (단계 사이에 이벤트 처리/페인트 허용)"""
+        if not self._startup_stages:
+            return
+        stage = self._startup_stages.pop(0)
+        try:
+            stage()
+        except Exception as e:
+            logger.error(f"시작 단계 실행 중 오류 ({stage.__name__}): {e}", exc_info=True)
+        if self._startup_stages:
+            # 0ms 타이머: 대기 중인 이벤트가 모두 처리된 뒤 실행됨
+            QTimer.singleShot(0, self._run_next_startup_stage)
+    
+    def _close_warm_start_window(self) -> None:
+        """웜 스타트 임시 창 닫기"""
+        if self.warm_start_window:
+            self.warm_start_window.close()
+            self.warm_start_window.deleteLater()
+            self.warm_start_window = None
+    
+    def _create_notification_manager(self) -> None:
+        """알림 관리자 생성 및 위젯에 연결"""
+        from notifications.notification_manager import NotificationManager
+        self.notification_manager = NotificationManager.get_instance()
+        if self.widget:
+            self.widget.notification_manager = self.notification_manager
+    
+    def _start_period_tracking(self) -> None:
+        """위젯의 교시 추적 시작 (시작 시점 알림 확인, 예고 포함 주간 계획, 시계 감시)"""
+        if self.widget:
+            self.widget.start_period_tracking()
+    
+    def _create_tray_icon(self) -> None:
+        """트레이 아이콘 생성"""
+        from tray_icon import TrayIcon
+        self.tray_icon = TrayIcon(self.widget)
+        self.tray_icon.show_action.triggered.connect(self.widget.show)
+        self.tray_icon.exit_action.triggered.connect(self.safe_exit)
+        
+        if not self.tray_icon.isSystemTrayAvailable() or not self.tray_icon.isVisible():
+            logger.warning("시스템 트레이를 사용할 수 없거나 아이콘이 표시되지 않습니다.")
+            from PyQt5.QtGui import QIcon
+            self.tray_icon.setIcon(
+                QIcon(resource_path(os.path.join('assets', 'app_icon.ico')))
+            )
+        
+        self.tray_icon.show()
+    
+    def start_update_check(self) -> None:
+        """확인 주기가 지났으면 백그라운드 업데이트 확인 시작"""
+        try:
+            sm = self.settings_manager
+            if sm is None:
+                return
+            from .updater import UpdateCheckWorker, is_update_check_due
+            if not is_update_check_due(sm.last_update_check, sm.update_check_interval_hours):
+                logger.info("업데이트 확인 주기가 지나지 않아 확인을 건너뜁니다.")
+                return
+            
+            # 실패(차단된 네트워크 등)하더라도 주기 내 재시도하지 않도록 시도 시각 기록
+            sm.mark_update_checked()
+            
+            self.update_worker = UpdateCheckWorker(get_version())
+            self.update_worker.update_available.connect(self._on_update_available)
+            self.update_worker.start()
+        except Exception as e:
+            logger.warning(f"업데이트 확인 시작 중 오류: {e}")
+    
+    def _on_update_available(self, updater: "Updater") -> None:
+        """새 버전 확인 시 (GUI 스레드) 트레이 알림으로 업데이트 안내"""
+        logger.info(f"새 버전 확인됨: {updater.latest_version}")
+        if self.tray_icon and self.tray_icon.isSystemTrayAvailable():
+            self.tray_icon.show_update_available(updater.latest_version, lambda: self.prompt_update(updater))
+        else:
+            self.prompt_update(updater)
+    
+    def prompt_update(self, updater: "Updater") -> bool:
+        """
+        업데이트 다운로드 여부 확인 및 처리
+        Returns:
+            업데이트를 다운로드했으면 True (앱 종료 요청됨), 아니면 False
+        """
+        try:
+            msg = (
+                f"새 버전({updater.latest_version})이 출시되었습니다!\n\n"
+                f"릴리즈 노트:\n{updater.release_notes}\n\n"
+                f"지금 다운로드하시겠습니까?"
+            )
+            
+            reply = QMessageBox.question(
+                None, 
+                "업데이트 알림", 
+                msg, 
+                QMessageBox.Yes | QMessageBox.No
+            )
+            
+            if reply != QMessageBox.Yes:
+                return False
+            
+            # 다운로드 진행
+            dest = os.path.join(
+                tempfile.gettempdir(), 
+                f"school_timetable_update_{updater.latest_version}.exe"
+            )
+            
+            progress = QProgressDialog("업데이트 다운로드 중...", None, 0, 100)
+            progress.setWindowTitle("업데이트")
+            progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+            
+            def progress_callback(done: int, total: int) -> None:
+                progress.setValue(int(done / total * 100))
+            
+            ok = updater.download_update(dest, progress_callback=progress_callback)
+            progress.close()
+            
+            if ok:
+                QMessageBox.information(
+                    None, 
+                    "업데이트 완료", 
+                    "다운로드가 완료되었습니다.\n프로그램을 종료하면 새 버전이 실행됩니다."
+                )
+                # 새 업데이터 실행
+                subprocess.Popen([dest])
+                logger.info("새 업데이터 실행 후 현재 애플리케이션 종료 요청")
+                self.safe_exit()
+                return True
+            else:
+                QMessageBox.warning(
+                    None, 
+                    "업데이트 실패", 
+                    "업데이트 파일 다운로드에 실패했습니다."
+                )
+                return False
+                
+        except Exception as e:
+            logger.warning(f"업데이트 처리 중 오류: {e}")
+            return False
+    
     def safe_exit(self) -> None:
         """안전한 종료"""
         logger.info("트레이 아이콘에서 종료 요청됨")
@@ -209,11 +420,7 @@ class ApplicationManager:
             system_is_enabled = is_auto_start_enabled(app_name_for_shortcut=APP_NAME)
             
             executable_path = get_executable_path()
-            icon_path = resource_path("assets/app_icon.ico")
-            if not os.path.exists(icon_path):
-                icon_path = resource_path("assets/icon.ico")
-            if not os.path.exists(icon_path):
-                icon_path = executable_path
+            icon_path = get_app_icon_path() or executable_path
             
             if current_setting_enabled != system_is_enabled:
                 logger.info(
@@ -0,0 +1,107 @@
+"""
+시계 건너뜀/이벤트 루프 정지 감지 모듈
+- 마지막 확인 이후 단조 시계(time.monotonic)가 흐른 시간과 로컬 벽시계(datetime.now)가 흐른 시간을 비교
+- 차이가 허용 오차를 넘으면 clock_jumped 발생 (NTP 시각 보정, 수동 시각 변경, 시간대/일광 절약 시간 변경)
+- 절전/최대 절전은 플랫폼에 따라 다르게 나타남
+  - 단조 시계가 절전 중 멈추는 플랫폼(Linux CLOCK_MONOTONIC 등): 벽시계와의 차이로 clock_jumped
+  - Windows: 단조 시계(QueryPerformanceCounter)가 절전 중에도 흐르므로 차이가 생기지 않음.
+    대신 주기 확인 타이머가 간격보다 한참 늦게 실행되므로(확인 사이 단조 시계 경과가 간격을 넘음) stalled 발생
+  - 확인 간격보다 짧은 절전은 어느 쪽으로도 감지하지 못할 수 있음 (남은 시간 표시는 자체 갱신 타이머로 복구)
+- 확인 시점: 긴 간격의 저정밀 타이머(VeryCoarseTimer), 애플리케이션 활성 상태 변경, 필요할 때 check() 직접 호출
+  (폴링 간격을 줄이는 대신 감지 즉시 교시 스케줄러 커서를 다시 맞추므로 짧은 폴링이 필요 없음)
+"""
+import datetime
+import logging
+import time
+from typing import Callable, Optional
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSignal
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ClockDriftMonitor(QtCore.QObject):
+    """단조 시계 대비 로컬 벽시계 건너뜀 및 확인 타이머 지연 감지기"""
+
+    # 벽시계가 단조 시계보다 더 흐른 초 (양수: 앞으로 건너뜀, 음수: 뒤로 되돌림)
+    clock_jumped = pyqtSignal(float)
+    # 확인 간격을 넘겨 지연된 초 (단조 시계가 흐르는 절전 후 복귀, 이벤트 루프 정지)
+    stalled = pyqtSignal(float)
+
+    def __init__(self, parent=None,
+                 interval_sec: float = Config.CLOCK_CHECK_INTERVAL_SECONDS,
+                 threshold_sec: float = Config.CLOCK_JUMP_THRESHOLD_SECONDS,
+                 stall_threshold_sec: float = Config.CLOCK_STALL_THRESHOLD_SECONDS,
+                 clock: Optional[Callable[[], datetime.datetime]] = None,
+                 monotonic: Callable[[], float] = time.monotonic):
+        super().__init__(parent)
+        self._clock = clock = clock or datetime.datetime.now
+        self._monotonic = monotonic
+        self.interval_sec = interval_sec
+        self.threshold_sec = threshold_sec
+        self.stall_threshold_sec = stall_threshold_sec
+
+        # 마지막 확인 시점의 (단조 시계, 벽시계)
+        self._anchor = (monotonic(), clock())
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.VeryCoarseTimer)
+        self._timer.setInterval(int(interval_sec * 1000))
+        self._timer.timeout.connect(self.check)
+
+        # 통계: 확인 횟수, 감지한 건너뜀 횟수, 감지한 지연 횟수
+        self.check_count = 0
+        self.jump_count = 0
+        self.stall_count = 0
+
+    def start(self) -> None:
+        """주기 확인 시작 (애플리케이션이 다시 활성화될 때도 확인)"""
+        self.reset()
+        self._timer.start()
+        app = QtCore.QCoreApplication.instance()
+        if hasattr(app, "applicationStateChanged"):
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def reset(self) -> None:
+        """현재 시각을 기준점으로 다시 잡음"""
+        self._anchor = (self._monotonic(), self._clock())
+
+    def check(self) -> Optional[float]:
+        """마지막 확인 이후 벽시계 건너뜀 확인
+
+        벽시계 건너뜀이 없더라도 주기 확인 중에 확인 사이 간격이 확인 간격보다
+        stall_threshold_sec 넘게 길었다면 stalled 발생 (Windows 절전 복귀는 이쪽으로만 나타남)
+
+        Returns:
+            허용 오차를 넘은 건너뜀(초), 없으면 None
+        """
+        self.check_count += 1
+        monotonic, wall = self._monotonic(), self._clock()
+        last_monotonic, last_wall = self._anchor
+        self._anchor = (monotonic, wall)
+
+        elapsed = monotonic - last_monotonic
+        drift = (wall - last_wall).total_seconds() - elapsed
+        if abs(drift) >= self.threshold_sec:
+            self.jump_count += 1
+            logger.info(f"시계 건너뜀 감지: {drift:+.1f}초 (절전 복귀 또는 시각/시간대 변경)")
+            self.clock_jumped.emit(drift)
+            return drift
+
+        # 주기 확인 중이면 확인 사이 간격은 확인 간격을 넘지 않아야 함
+        delay = elapsed - self.interval_sec
+        if self._timer.isActive() and delay >= self.stall_threshold_sec:
+            self.stall_count += 1
+            logger.info(f"확인 타이머 {delay:.1f}초 지연 감지 (절전 복귀 또는 이벤트 루프 정지)")
+            self.stalled.emit(delay)
+        return None
+
+    def _on_application_state_changed(self, state) -> None:
+        if state == QtCore.Qt.ApplicationActive:
+            self.check()
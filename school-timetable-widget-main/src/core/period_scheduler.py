@@ -0,0 +1,161 @@
+"""
+교시 전환 이벤트 스케줄러 모듈
+- 주간 교시 전환 계획(utils/weekly_plan.py)의 커서가 가리키는 다음 전환 시각에 정밀 타이머(PreciseTimer) 하나만 예약
+- 전환 시각마다 한 번만 깨어나며 이벤트 사이, 자정, 수업 없는 요일에는 깨어나지 않음 (주기적 폴링 없음)
+  예: 금요일 마지막 교시 종료 후에는 월요일 첫 예고 시각까지 한 번에 예약
+- 계획은 교시 시간/예고/수업 요일이 바뀔 때만 다시 만들고, 커서는 주 끝에서 다음 주로 넘어감
+- 날짜가 바뀐 뒤 첫 전환을 발생시키기 전에 day_changed 발생
+- 현재 교시/요일은 커서 상태에서 바로 조회 (시계를 따로 읽지 않음)
+- 절전 복귀나 시계 변경으로 전환 시각보다 한참 늦게 깨어나면 지난 전환을 재생하지 않고
+  커서를 현재 시각으로 다시 맞춘 뒤 resynced 발생
+- 다음 전환 전에 복귀한 경우처럼 타이머가 늦지 않은 경우는 스스로 알 수 없으므로
+  core/clock_monitor.py의 감지 결과(clock_jumped, stalled)로 resync 호출
+"""
+import datetime
+import logging
+import math
+from typing import Callable, Optional
+
+from PyQt5 import QtCore
+from PyQt5.QtCore import pyqtSignal
+
+from utils.weekly_plan import (
+    WeeklyPlan, WeeklyPlanCursor, Transition,
+    EVENT_PERIOD_ENDED, EVENT_PERIOD_STARTED, EVENT_WARNING
+)
+
+logger = logging.getLogger(__name__)
+
+# 전환 시각보다 이만큼(초) 넘게 늦게 깨어나면 지난 전환을 발생시키지 않고 다시 맞춤
+STALE_AFTER_SECONDS = 60
+
+
+class PeriodEventScheduler(QtCore.QObject):
+    """주간 계획의 교시 시작/종료/예고 시각에만 깨어나는 이벤트 스케줄러"""
+
+    period_started = pyqtSignal(int)      # 교시
+    period_ended = pyqtSignal(int)        # 교시
+    warning = pyqtSignal(int, int)        # 곧 시작할 교시, 시작까지 남은 분
+    day_changed = pyqtSignal(object)      # 새 날짜 (datetime.date)
+    resynced = pyqtSignal()               # 지난 전환을 건너뛰고 현재 시각으로 커서를 다시 맞춤
+
+    def __init__(self, parent=None, clock: Optional[Callable[[], datetime.datetime]] = None):
+        super().__init__(parent)
+        self._clock = clock or datetime.datetime.now
+
+        # 배치한 주간 계획, 다음 전환 위치, 마지막으로 확인한 날짜
+        self.plan: Optional[WeeklyPlan] = None
+        self._cursor: Optional[WeeklyPlanCursor] = None
+        self._date: Optional[datetime.date] = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self.dispatch_due)
+
+        # 통계: 타이머로 깨어난 횟수, 발생시킨 이벤트 수, 다시 맞춘 횟수
+        self.wakeup_count = 0
+        self.emitted_count = 0
+        self.resync_count = 0
+
+    @property
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    @property
+    def next_wakeup_msec(self) -> int:
+        """다음으로 깨어날 때까지 남은 밀리초 (예약이 없으면 -1)"""
+        return self._timer.remainingTime()
+
+    def now(self) -> datetime.datetime:
+        """스케줄러가 사용하는 현재 시각 (남은 시간 표시 등 같은 시계를 써야 하는 곳에서 사용)"""
+        return self._clock()
+
+    @property
+    def current_period(self) -> Optional[int]:
+        """지금 진행 중인 교시 (커서 직전 전환 기준, 계획이 없으면 None)"""
+        return self._cursor.current_period if self._cursor is not None else None
+
+    @property
+    def current_day_idx(self) -> Optional[int]:
+        """마지막으로 확인한 날짜의 요일 인덱스 (1=월요일, 표시하지 않는 요일이면 None)"""
+        if self.plan is None or self._date is None:
+            return None
+        return self.plan.day_index(self._date.weekday())
+
+    def load(self, plan: WeeklyPlan) -> None:
+        """계획 배치 후 현재 시각 이후 첫 전환 예약 (이미 지난 전환은 발생시키지 않음)"""
+        self.plan = plan
+        now = self._clock()
+        self._date = now.date()
+        self._cursor = WeeklyPlanCursor(plan, now)
+        self._arm(now)
+        logger.debug(f"주간 교시 전환 {len(plan)}개 배치 (수업 요일: {plan.class_weekdays})")
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def resync(self) -> None:
+        """시계가 건너뛴 뒤: 지난 전환은 발생시키지 않고 현재 시각 기준으로 커서 위치와 예약을 다시 맞춤"""
+        if self._cursor is None:
+            return
+        now = self._clock()
+        self._cursor.seek(now)
+        self.resync_count += 1
+        logger.info(f"교시 전환 커서 재동기화: {now:%m-%d %H:%M:%S}")
+        if now.date() != self._date:
+            self._change_day(now.date())
+        self._arm(now)
+        self.resynced.emit()
+
+    def dispatch_due(self) -> int:
+        """현재 시각까지 도래한 전환을 순서대로 발생시키고 다음 전환 예약
+
+        Returns:
+            발생시킨 이벤트 수
+        """
+        self.wakeup_count += 1
+        now = self._clock()
+        emitted = 0
+        cursor = self._cursor
+        if cursor is not None:
+            due = cursor.next_time
+            if due is not None and (now - due).total_seconds() > STALE_AFTER_SECONDS:
+                # 절전 복귀 등으로 한참 늦게 깨어남: 지난 예고/전환을 한꺼번에 재생하지 않음
+                self.resync()
+                return 0
+            while cursor.next_time is not None and cursor.next_time <= now:
+                due_date = cursor.next_time.date()
+                if due_date != self._date:
+                    self._change_day(due_date)
+                self._emit(cursor.advance())
+                emitted += 1
+        if now.date() != self._date:
+            self._change_day(now.date())
+        self.emitted_count += emitted
+        self._arm(now)
+        return emitted
+
+    def _change_day(self, date: datetime.date) -> None:
+        self._date = date
+        logger.debug(f"날짜 변경: {date}")
+        self.day_changed.emit(date)
+
+    def _emit(self, transition: Transition) -> None:
+        logger.debug(f"교시 이벤트: {transition.kind} {transition.period}교시")
+        if transition.kind == EVENT_PERIOD_STARTED:
+            self.period_started.emit(transition.period)
+        elif transition.kind == EVENT_PERIOD_ENDED:
+            self.period_ended.emit(transition.period)
+        else:
+            self.warning.emit(transition.period, self.plan.warning_minutes or 0)
+
+    def _arm(self, now: datetime.datetime) -> None:
+        """커서가 가리키는 다음 전환 시각에 타이머 예약 (계획이 비어 있으면 예약 없음)"""
+        target = self._cursor.next_time if self._cursor is not None else None
+        if target is None:
+            self._timer.stop()
+            return
+        delay_msec = max(0, math.ceil((target - now).total_seconds() * 1000))
+        self._timer.start(delay_msec)
+        logger.debug(f"다음 교시 이벤트 예약: {target:%m-%d %H:%M} ({delay_msec / 1000:.1f}초 후)")
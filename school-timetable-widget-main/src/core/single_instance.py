@@ -0,0 +1,177 @@
+"""
+단일 인스턴스 관리 모듈
+- QLocalServer로 실행 중인 인스턴스가 명령("show", "reload")을 받음
+- 두 번째 실행은 QLocalSocket으로 명령만 전달하고 바로 종료
+- GUI 스택(QtWidgets, 위젯 모듈)을 임포트하지 않으므로 두 번째 실행은 빠르게 끝남
+- 데이터 디렉토리의 잠금 파일(QLockFile)을 잡은 실행만 서버를 열어, 동시에 실행해도 확인과 서버 시작이
+  원자적으로 이루어짐 (Windows 명명된 파이프처럼 같은 이름으로 여러 서버가 열리는 경우 포함)
+"""
+import getpass
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from PyQt5 import QtCore
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+from utils.paths import get_data_directory
+
+logger = logging.getLogger(__name__)
+
+COMMAND_SHOW = "show"
+COMMAND_RELOAD = "reload"
+SINGLE_INSTANCE_COMMANDS = (COMMAND_SHOW, COMMAND_RELOAD)
+
+# 명령줄에서 reload 명령을 요청하는 인자
+RELOAD_ARGUMENT = "--reload"
+
+# 실행 중인 인스턴스가 잠금은 잡았지만 아직 서버를 열지 않았을 때 명령 전달을 다시 시도하는 횟수/간격
+_SEND_RETRY_COUNT = 10
+_SEND_RETRY_INTERVAL_MS = 100
+
+
+def get_server_name() -> str:
+    """사용자 및 데이터 디렉토리별 로컬 서버 이름
+
+    데이터 디렉토리는 환경 변수 설정 여부와 관계없이 utils.paths로 결정하므로
+    main.py의 빠른 전달 경로(setup_environment 이전)와 실행 중인 서버가 같은 이름을 사용한다.
+    데이터 디렉토리를 따로 지정한 실행(테스트, 벤치마크 등)은 별도 인스턴스로 취급한다.
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ""
+    data_dir = os.path.normcase(os.path.abspath(get_data_directory()))
+    identity = f"{user}|{data_dir}"
+    digest = hashlib.sha1(identity.encode('utf-8')).hexdigest()[:12]
+    return f"SchoolTimetableWidget-{digest}"
+
+
+def get_lock_file_path() -> str:
+    """단일 인스턴스 잠금 파일 경로 (데이터 디렉토리)"""
+    return os.path.join(get_data_directory(), f"{get_server_name()}.lock")
+
+
+def get_launch_command(argv) -> str:
+    """명령줄 인자로 실행 중인 인스턴스에 전달할 명령 결정"""
+    return COMMAND_RELOAD if RELOAD_ARGUMENT in argv[1:] else COMMAND_SHOW
+
+
+def send_command_to_running_instance(command: str, timeout_ms: int = 300) -> bool:
+    """실행 중인 인스턴스에 명령 전달
+
+    Returns:
+        실행 중인 인스턴스에 전달했으면 True (호출한 쪽은 바로 종료하면 됨)
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(get_server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((command + "\n").encode('utf-8'))
+    sent = socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return sent
+
+
+def _is_server_alive(name: str, timeout_ms: int = 300) -> bool:
+    """해당 이름의 서버가 연결을 받는지 확인 (명령은 보내지 않음)"""
+    socket = QLocalSocket()
+    socket.connectToServer(name)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.disconnectFromServer()
+    return True
+
+
+class SingleInstanceServer(QtCore.QObject):
+    """다른 실행에서 보낸 명령을 받는 로컬 서버"""
+
+    command_received = QtCore.pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._lock: Optional[QtCore.QLockFile] = None
+
+    def acquire(self, command: str) -> bool:
+        """이 실행을 단일 인스턴스로 만들기 (잠금 파일을 잡고 서버 시작)
+
+        다른 인스턴스가 잠금을 가지고 있으면 그 인스턴스에 command를 전달한다.
+
+        Returns:
+            이 실행이 계속 실행되어야 하면 True, 다른 인스턴스가 실행 중이면 False (호출한 쪽은 종료)
+        """
+        lock = QtCore.QLockFile(get_lock_file_path())
+        # 실행 시간으로는 만료시키지 않음 (비정상 종료로 남은 잠금은 PID로 판단하여 정리됨)
+        lock.setStaleLockTime(0)
+        if not lock.tryLock(0):
+            if lock.error() == QtCore.QLockFile.LockFailedError:
+                logger.info("다른 인스턴스가 실행 중입니다. 명령을 전달합니다.")
+                self._send_with_retry(command)
+                return False
+            # 잠금 파일을 만들 수 없는 환경(권한 등)에서는 잠금 없이 진행
+            logger.warning(f"단일 인스턴스 잠금 파일을 사용할 수 없습니다: {get_lock_file_path()}")
+        else:
+            self._lock = lock
+
+        if self.listen():
+            return True
+        # 서버 이름을 살아 있는 다른 인스턴스(잠금 파일을 쓰지 않는 이전 버전 등)가 사용 중이면 전달 후 종료
+        if self.server.serverError() == QAbstractSocket.AddressInUseError \
+                and send_command_to_running_instance(command):
+            self.close()
+            return False
+        # 그 밖의 이유로 서버를 열지 못하면 명령 수신 없이 실행
+        return True
+
+    def listen(self) -> bool:
+        """서버 시작 (응답하지 않는 인스턴스가 남긴 소켓 파일만 정리 후 재시도)"""
+        name = get_server_name()
+        if self.server.listen(name):
+            return True
+        if self.server.serverError() == QAbstractSocket.AddressInUseError:
+            # 실행 중인 인스턴스가 연결을 받으면 그 소켓을 지우지 않음
+            if _is_server_alive(name):
+                logger.warning("단일 인스턴스 서버 이름을 실행 중인 다른 인스턴스가 사용 중입니다.")
+                return False
+            QLocalServer.removeServer(name)
+            if self.server.listen(name):
+                return True
+        logger.warning(f"단일 인스턴스 서버 시작 실패: {self.server.errorString()}")
+        return False
+
+    def close(self) -> None:
+        """서버 종료 및 잠금 해제"""
+        self.server.close()
+        if self._lock is not None:
+            self._lock.unlock()
+            self._lock = None
+
+    @staticmethod
+    def _send_with_retry(command: str) -> bool:
+        """잠금을 가진 인스턴스가 아직 서버를 열지 않았을 수 있으므로 잠시 다시 시도하며 명령 전달"""
+        for _ in range(_SEND_RETRY_COUNT):
+            if send_command_to_running_instance(command):
+                return True
+            QtCore.QThread.msleep(_SEND_RETRY_INTERVAL_MS)
+        logger.warning("실행 중인 인스턴스에 명령을 전달하지 못했습니다.")
+        return False
+
+    def _on_new_connection(self) -> None:
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self._read_commands(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _read_commands(self, socket) -> None:
+        while socket.canReadLine():
+            command = bytes(socket.readLine()).decode('utf-8', 'replace').strip()
+            if command in SINGLE_INSTANCE_COMMANDS:
+                logger.info(f"다른 실행에서 명령 수신: {command}")
+                self.command_received.emit(command)
+            else:
+                logger.warning(f"알 수 없는 단일 인스턴스 명령 무시: {command!r}")
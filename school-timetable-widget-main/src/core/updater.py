@@ -1,12 +1,16 @@
 """
 업데이트 관리 모듈
 - GitHub에서 최신 버전 확인 및 다운로드
+- requests는 실제로 확인/다운로드할 때만 임포트 (시작 경로에서 임포트 비용 제외)
 """
 import logging
 import re
-import requests
+import threading
+import time
 from typing import Optional, Callable, Tuple
 
+from PyQt5 import QtCore
+
 logger = logging.getLogger(__name__)
 
 GITHUB_REPO = "chuthulhu/school-timetable-widget"
@@ -23,8 +27,9 @@ class Updater:
         self.release_notes: Optional[str] = None
     
     def check_for_update(self) -> bool:
-        """업데이트 확인"""
+        """업데이트 확인 (백그라운드 스레드에서 호출되므로 requests도 여기서 임포트)"""
         try:
+            import requests
             resp = requests.get(GITHUB_API_RELEASES, timeout=5)
             if resp.status_code == 200:
                 data = resp.json()
@@ -63,6 +68,7 @@ class Updater:
             return False
         
         try:
+            import requests
             with requests.get(self.download_url, stream=True, timeout=30) as r:
                 r.raise_for_status()
                 total = int(r.headers.get('content-length', 0))
@@ -81,3 +87,62 @@ class Updater:
             logger.error(f"업데이트 다운로드 실패: {e}")
             return False
 
+
+
+def is_update_check_due(
+    last_check: Optional[float],
+    interval_hours: float,
+    now: Optional[float] = None
+) -> bool:
+    """마지막 확인 시각(epoch 초)과 확인 주기(시간)로 업데이트 확인 필요 여부 반환
+
+    Args:
+        last_check: 마지막 업데이트 확인 시각 (없으면 None)
+        interval_hours: 확인 주기 (0 이하이면 매 실행마다 확인)
+        now: 현재 시각 (테스트용, 기본값은 time.time())
+    """
+    if last_check is None or interval_hours <= 0:
+        return True
+    if now is None:
+        now = time.time()
+    # 시계가 뒤로 간 경우에도 다시 확인하도록 음수 경과 시간은 만료로 간주
+    elapsed = now - last_check
+    return elapsed < 0 or elapsed >= interval_hours * 3600
+
+
+class UpdateCheckWorker(QtCore.QObject):
+    """백그라운드 스레드에서 업데이트를 확인하고 결과를 GUI 스레드로 전달하는 클래스
+
+    네트워크 요청(requests.get)이 시작 경로를 막지 않도록 데몬 스레드에서 실행한다.
+    결과 시그널은 이 객체가 속한 GUI 스레드에서 (Queued 연결로) 수신된다.
+    """
+    update_available = QtCore.pyqtSignal(object)  # Updater 인스턴스
+    check_finished = QtCore.pyqtSignal(bool)  # 새 버전 존재 여부
+
+    def __init__(self, current_version: str, parent=None):
+        super().__init__(parent)
+        self.updater = Updater(current_version)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """업데이트 확인 시작 (이미 진행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="UpdateCheck", daemon=True
+        )
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        """확인 작업 진행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        has_update = False
+        try:
+            has_update = self.updater.check_for_update()
+        except Exception as e:
+            logger.warning(f"백그라운드 업데이트 확인 중 오류: {e}")
+        self.check_finished.emit(has_update)
+        if has_update:
+            self.update_available.emit(self.updater)
@@ -1,2 +1,8 @@
 # GUI 패키지 초기화
-from .widget import Widget
\ No newline at end of file
+# Widget은 처음 사용할 때만 임포트되도록 지연 로딩 (PEP 562 모듈 __getattr__)
+# (웜 스타트 창(gui.warm_start)을 위젯 모듈 임포트 전에 표시할 수 있도록)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(__name__, {
+    "Widget": ".widget",
+})
@@ -1,4 +1,9 @@
 # 대화상자 패키지 초기화
-from .time_dialog import TimeRangeDialog
-from .settings_dialog import SettingsDialog
-from .timetable_dialog import TimetableEditDialog
+# 대화상자는 처음 사용할 때만 임포트되도록 지연 로딩 (PEP 562 모듈 __getattr__)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(__name__, {
+    "TimeRangeDialog": ".time_dialog",
+    "SettingsDialog": ".settings_dialog",
+    "TimetableEditDialog": ".timetable_dialog",
+})
@@ -199,8 +199,8 @@ class BackupRestoreDialog(QtWidgets.QDialog):
         
         if reply == QtWidgets.QMessageBox.Yes:
             # 백업 폴더 경로 가져오기
-            from utils.paths import get_data_directory
-            backup_path = os.path.join(get_data_directory(), "backups", backup_name)
+            from utils.paths import get_resolved_paths
+            backup_path = os.path.join(get_resolved_paths().backup_dir, backup_name)
             
             try:
                 # 폴더와 내용 삭제
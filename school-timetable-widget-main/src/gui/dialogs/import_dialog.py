@@ -1,5 +1,6 @@
 from PyQt5 import QtWidgets, QtCore, QtGui
 import json
+from utils.config import Config
 
 class ImportDialog(QtWidgets.QDialog):
     """시간표 가져오기 대화상자"""
@@ -90,7 +91,7 @@ class ImportDialog(QtWidgets.QDialog):
         if "timetable" in self.imported_data:
             timetable = self.imported_data["timetable"]
             result += "■ 시간표 데이터\n"
-            for day in ["월", "화", "수", "목", "금"]:
+            for day in Config.ALL_DAYS_OF_WEEK_KR:
                 if day in timetable:
                     result += f"  {day}요일: "
                     periods = []
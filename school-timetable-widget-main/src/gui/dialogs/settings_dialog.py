@@ -3,6 +3,7 @@ from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtCore import pyqtSignal # pyqtSignal 임포트 추가
 from ..components.color_button import ColorButton, FontComboBox
 from ..components.theme_selector import ThemeSelector
+from utils.config import Config
 import logging
 
 # 로거 설정
@@ -10,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 class SettingsDialog(QtWidgets.QDialog):
     settings_applied = pyqtSignal() # 설정 적용 시그널 정의
+    grid_dimensions_changed = pyqtSignal() # 요일/교시 수 변경 시그널
+    countdown_settings_changed = pyqtSignal() # 남은 시간 표시 설정 변경 시그널
 
     # style_preview_requested = pyqtSignal() # 미리보기 요청 시그널 (settings_applied와 구분 시)
 
@@ -43,12 +46,53 @@ class SettingsDialog(QtWidgets.QDialog):
             "header_font_size": sm.header_font_size,
             "cell_font_family": sm.cell_font_family,
             "cell_font_size": sm.cell_font_size,
+            "cell_text_auto_shrink": sm.cell_text_auto_shrink,
             "theme": sm.theme,
             # 알림 설정은 NotificationManager에서 직접 관리하므로 여기서는 백업/복원하지 않음.
             # 위젯 크기/위치, 자동 시작 등도 각 탭에서 직접 관리하거나,
             # apply_settings에서 최종 저장되므로, 스타일 관련만 우선 처리.
         }
 
+    def reload_from_settings(self):
+        """캐시된 대화상자를 다시 열 때 현재 설정값으로 백업 및 컨트롤 갱신"""
+        self._backup_initial_settings()
+        
+        # 컨트롤 갱신 중 발생하는 valueChanged 시그널이 미리보기로 설정값을 덮어쓰지 않도록 함
+        self._reloading = True
+        try:
+            self._reload_controls()
+        finally:
+            self._reloading = False
+    
+    def _reload_controls(self):
+        """reload_from_settings에서 사용하는 컨트롤 갱신 본체"""
+        # 테마 선택기 상태
+        self.theme_selector.current_theme = self.settings_manager.theme
+        self.theme_selector.highlight_selected_theme()
+        self.theme_selector.theme_label.setText(f"현재 테마: {self.theme_selector.get_theme_display_name()}")
+        
+        # 알림 설정
+        notification_manager = self.parent.notification_manager
+        self.notification_enabled.setChecked(notification_manager.notification_enabled)
+        self.next_period_warning.setChecked(notification_manager.next_period_warning)
+        self.warning_minutes.setValue(notification_manager.warning_minutes)
+        
+        # 위젯 크기/위치 설정
+        current_size = self.settings_manager.widget_size
+        self.widget_width.setValue(current_size.get("width", 400) if current_size else 400)
+        self.widget_height.setValue(current_size.get("height", 300) if current_size else 300)
+        self.lock_position.setChecked(self.settings_manager.is_position_locked)
+        
+        # 시간표 구성 (교시 수, 토요일 수업)
+        self.period_count.setValue(self.settings_manager.period_count)
+        self.saturday_classes.setChecked(self.settings_manager.day_count > len(Config.DAYS_OF_WEEK_KR))
+        self.show_countdown.setChecked(self.settings_manager.show_period_countdown)
+        self.countdown_interval.setValue(self.settings_manager.countdown_interval_seconds)
+        
+        # 색상/투명도/폰트/자동 시작
+        self.update_controls_from_settings()
+        self.tab_widget.setCurrentIndex(0)
+
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout()
         
@@ -236,6 +280,12 @@ class SettingsDialog(QtWidgets.QDialog):
         self.cell_font_size.setValue(self.settings_manager.cell_font_size)
         cell_font_layout.addRow("셀 폰트 크기:", self.cell_font_size)
         
+        # 셀 글자 자동 축소 체크박스
+        self.cell_text_auto_shrink = QtWidgets.QCheckBox("셀 크기에 맞춰 글자 자동 축소")
+        self.cell_text_auto_shrink.setChecked(self.settings_manager.cell_text_auto_shrink)
+        self.cell_text_auto_shrink.setToolTip("과목명이 셀에 다 들어가지 않으면 글자 크기를 줄여서 표시합니다.")
+        cell_font_layout.addRow("", self.cell_text_auto_shrink)
+        
         cell_font_group.setLayout(cell_font_layout)
         font_layout.addWidget(cell_font_group)
         
@@ -265,6 +315,7 @@ class SettingsDialog(QtWidgets.QDialog):
         self.header_font_size.valueChanged.connect(self._on_font_preview_settings_changed)
         self.cell_font_combo.currentFontChanged.connect(self._on_font_preview_settings_changed)
         self.cell_font_size.valueChanged.connect(self._on_font_preview_settings_changed)
+        self.cell_text_auto_shrink.toggled.connect(self._on_font_preview_settings_changed)
         
         # 기존 폰트 설정 (호환성 유지)
         self.font_combo = self.header_font_combo
@@ -363,6 +414,36 @@ class SettingsDialog(QtWidgets.QDialog):
         size_form_layout.addRow("", preview_group)
         size_group.setLayout(size_form_layout)
         
+        # 시간표 구성 그룹 (교시 수, 토요일 수업 여부)
+        grid_group = QtWidgets.QGroupBox("시간표 구성")
+        grid_form_layout = QtWidgets.QFormLayout()
+        
+        self.period_count = QtWidgets.QSpinBox()
+        self.period_count.setRange(Config.MIN_NUMBER_OF_CLASSES, Config.MAX_NUMBER_OF_CLASSES)
+        self.period_count.setValue(self.settings_manager.period_count)
+        self.period_count.setSuffix("교시")
+        grid_form_layout.addRow("교시 수:", self.period_count)
+        
+        self.saturday_classes = QtWidgets.QCheckBox("토요일 수업 표시")
+        self.saturday_classes.setChecked(self.settings_manager.day_count > len(Config.DAYS_OF_WEEK_KR))
+        grid_form_layout.addRow("", self.saturday_classes)
+        
+        # 현재 교시 남은 시간 표시 및 갱신 간격
+        self.show_countdown = QtWidgets.QCheckBox("현재 교시 남은 시간 표시")
+        self.show_countdown.setChecked(self.settings_manager.show_period_countdown)
+        grid_form_layout.addRow("", self.show_countdown)
+        
+        self.countdown_interval = QtWidgets.QSpinBox()
+        self.countdown_interval.setRange(Config.MIN_COUNTDOWN_INTERVAL_SECONDS, Config.MAX_COUNTDOWN_INTERVAL_SECONDS)
+        self.countdown_interval.setSingleStep(10)
+        self.countdown_interval.setValue(self.settings_manager.countdown_interval_seconds)
+        self.countdown_interval.setSuffix("초")
+        self.countdown_interval.setEnabled(self.show_countdown.isChecked())
+        self.show_countdown.toggled.connect(self.countdown_interval.setEnabled)
+        grid_form_layout.addRow("남은 시간 갱신 간격:", self.countdown_interval)
+        
+        grid_group.setLayout(grid_form_layout)
+        
         # 위젯 위치 설정 그룹
         position_group = QtWidgets.QGroupBox("위젯 위치 설정")
         position_layout = QtWidgets.QVBoxLayout()
@@ -390,6 +471,7 @@ class SettingsDialog(QtWidgets.QDialog):
         
         # 레이아웃에 그룹 추가
         size_layout.addWidget(size_group)
+        size_layout.addWidget(grid_group)
         size_layout.addWidget(position_group)
         size_layout.addStretch()
         
@@ -433,7 +515,6 @@ class SettingsDialog(QtWidgets.QDialog):
     
     def reset_widget_position(self):
         """위젯 위치를 기본값으로 초기화"""
-        from utils.config import Config
         msg_box = QtWidgets.QMessageBox(self)
         msg_box.setWindowTitle("위치 초기화")
         msg_box.setText("위젯 위치를 화면 왼쪽 상단으로 초기화하시겠습니까?")
@@ -490,6 +571,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self.header_font_size.setValue(self.settings_manager.header_font_size)
             self.cell_font_combo.setCurrentFont(QtGui.QFont(self.settings_manager.cell_font_family))
             self.cell_font_size.setValue(self.settings_manager.cell_font_size)
+            self.cell_text_auto_shrink.setChecked(self.settings_manager.cell_text_auto_shrink)
         else:
             # 기존 단일 폰트 설정 호환성 유지
             self.font_combo.setCurrentFont(QtGui.QFont(self.settings_manager.font_family))
@@ -508,6 +590,8 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def _preview_style_update(self):
         """UI 컨트롤 값 변경 시 호출되어 SettingsManager에 임시 적용하고 시그널 발생"""
+        if getattr(self, '_reloading', False):
+            return
         # 현재 UI 컨트롤에서 값 읽어서 SettingsManager에 즉시 반영
         # 색상
         self.settings_manager.header_bg_color = self.header_bg_btn.color
@@ -527,6 +611,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self.settings_manager.header_font_size = self.header_font_size.value()
             self.settings_manager.cell_font_family = self.cell_font_combo.currentFont().family()
             self.settings_manager.cell_font_size = self.cell_font_size.value()
+            self.settings_manager.cell_text_auto_shrink = self.cell_text_auto_shrink.isChecked()
             # 호환성
             self.settings_manager.font_family = self.settings_manager.header_font_family
             self.settings_manager.font_size = self.settings_manager.header_font_size
@@ -636,6 +721,19 @@ class SettingsDialog(QtWidgets.QDialog):
         except Exception as e:
             logger.error(f"위젯 크기 설정 적용 중 오류: {e}")
         
+        # 시간표 구성 적용 (값이 바뀐 경우에만 그리드 행/열 갱신)
+        if hasattr(self, 'period_count') and hasattr(self, 'saturday_classes'):
+            day_count = len(Config.ALL_DAYS_OF_WEEK_KR if self.saturday_classes.isChecked() else Config.DAYS_OF_WEEK_KR)
+            if self.settings_manager.set_grid_dimensions(day_count, self.period_count.value()):
+                self.grid_dimensions_changed.emit()
+        
+        # 남은 시간 표시 설정 적용
+        if hasattr(self, 'show_countdown') and hasattr(self, 'countdown_interval'):
+            if self.settings_manager.set_countdown_settings(
+                self.show_countdown.isChecked(), self.countdown_interval.value()
+            ):
+                self.countdown_settings_changed.emit()
+        
         # 부팅시 자동실행 적용
         if hasattr(self, 'auto_start_checkbox'):
             auto_start_enabled = self.auto_start_checkbox.isChecked()
@@ -643,15 +741,11 @@ class SettingsDialog(QtWidgets.QDialog):
             
             # 자동 시작 기능 연동
             from utils.auto_start import enable_auto_start, disable_auto_start, get_executable_path
-            from utils.paths import resource_path, APP_NAME as DEFAULT_APP_NAME # APP_NAME 임포트
+            from utils.paths import get_app_icon_path, APP_NAME as DEFAULT_APP_NAME # APP_NAME 임포트
             
             app_name = DEFAULT_APP_NAME # 또는 설정에서 관리하는 앱 이름
             executable_path = get_executable_path()
-            icon_path = resource_path("assets/app_icon.ico")
-            if not os.path.exists(icon_path): # os 임포트 필요
-                icon_path = resource_path("assets/icon.ico")
-            if not os.path.exists(icon_path):
-                 icon_path = executable_path # 최후의 수단으로 실행 파일 아이콘
+            icon_path = get_app_icon_path() or executable_path # 최후의 수단으로 실행 파일 아이콘
 
             if auto_start_enabled:
                 # 먼저 설정 매니저를 통해 값을 변경하고 저장 시도
@@ -701,6 +795,7 @@ class SettingsDialog(QtWidgets.QDialog):
         sm.header_font_size = initial["header_font_size"]
         sm.cell_font_family = initial["cell_font_family"]
         sm.cell_font_size = initial["cell_font_size"]
+        sm.cell_text_auto_shrink = initial["cell_text_auto_shrink"]
         sm.theme = initial["theme"] # 테마도 복원
         
         # UI 컨트롤들도 복원된 값으로 업데이트
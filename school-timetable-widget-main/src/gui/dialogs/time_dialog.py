@@ -1,5 +1,7 @@
 from PyQt5 import QtWidgets, QtCore
 
+from utils.period_schedule import compile_schedule
+
 class TimeRangeDialog(QtWidgets.QDialog):
     """시간 설정 다이얼로그 클래스"""
     def __init__(self, parent=None):
@@ -16,11 +18,41 @@ class TimeRangeDialog(QtWidgets.QDialog):
         info_label = QtWidgets.QLabel("각 교시의 시작 시간과 종료 시간을 설정하세요.")
         layout.addWidget(info_label)
         
-        # 시간 설정 폼
-        form_layout = QtWidgets.QFormLayout()
+        # 시간 설정 폼 (교시 행은 설정된 교시 수만큼 생성)
+        self.form_layout = QtWidgets.QFormLayout()
         self.time_widgets = {}
+        self.sync_period_rows()
+        
+        layout.addLayout(self.form_layout)
+        
+        # 버튼 레이아웃
+        button_layout = QtWidgets.QHBoxLayout()
+        
+        save_btn = QtWidgets.QPushButton("저장")
+        save_btn.clicked.connect(self.save_time_ranges)
+        button_layout.addWidget(save_btn)
+        
+        cancel_btn = QtWidgets.QPushButton("취소")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+        
+        layout.addLayout(button_layout)
         
-        for period in range(1, 8):  # 1교시부터 7교시까지
+        self.setLayout(layout)
+    
+    def sync_period_rows(self):
+        """설정된 교시 수에 맞게 교시 행 추가 또는 제거 (기존 행은 그대로 유지)"""
+        period_count = self.settings_manager.period_count
+        
+        # 줄어든 교시 행 제거 (마지막 교시부터)
+        for period in sorted(self.time_widgets, reverse=True):
+            if period <= period_count:
+                break
+            self.form_layout.removeRow(period - 1)
+            del self.time_widgets[period]
+        
+        # 늘어난 교시 행 추가
+        for period in range(len(self.time_widgets) + 1, period_count + 1):
             # 시간 범위 설정을 위한 레이아웃
             period_layout = QtWidgets.QHBoxLayout()
             
@@ -41,41 +73,42 @@ class TimeRangeDialog(QtWidgets.QDialog):
             period_layout.addWidget(QtWidgets.QLabel("종료:"))
             period_layout.addWidget(end_time_edit)
             
-            form_layout.addRow(f"{period}교시:", period_layout)
+            self.form_layout.addRow(f"{period}교시:", period_layout)
             
             # 위젯 저장
             self.time_widgets[period] = {
                 "start": start_time_edit,
                 "end": end_time_edit
             }
+    
+    def reload_from_settings(self):
+        """캐시된 대화상자를 다시 열 때 현재 설정값으로 입력 위젯 갱신"""
+        self.sync_period_rows()
+        for period, widgets in self.time_widgets.items():
+            time_range = self.settings_manager.time_ranges.get(period, {})
+            widgets["start"].setTime(time_range.get("start", QtCore.QTime(9, 0)))
+            widgets["end"].setTime(time_range.get("end", QtCore.QTime(9, 50)))
         
-        layout.addLayout(form_layout)
-        
-        # 버튼 레이아웃
-        button_layout = QtWidgets.QHBoxLayout()
-        
-        save_btn = QtWidgets.QPushButton("저장")
-        save_btn.clicked.connect(self.save_time_ranges)
-        button_layout.addWidget(save_btn)
-        
-        cancel_btn = QtWidgets.QPushButton("취소")
-        cancel_btn.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(button_layout)
+    def save_time_ranges(self):
+        time_ranges = {
+            period: {"start": widgets["start"].time(), "end": widgets["end"].time()}
+            for period, widgets in self.time_widgets.items()
+        }
         
-        self.setLayout(layout)
+        # 겹치거나 종료 시각이 시작 시각보다 이른 교시가 있으면 저장 전에 확인
+        issues = compile_schedule(time_ranges, self.settings_manager.period_count).issues
+        if issues:
+            reply = QtWidgets.QMessageBox.question(
+                self, "시간 설정 확인",
+                "\n".join(issue.message for issue in issues) + "\n\n그래도 저장하시겠습니까?",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                QtWidgets.QMessageBox.No
+            )
+            if reply != QtWidgets.QMessageBox.Yes:
+                return
         
-    def save_time_ranges(self):
         # 설정된 시간 범위를 설정 관리자에 저장
-        for period, widgets in self.time_widgets.items():
-            start_time = widgets["start"].time()
-            end_time = widgets["end"].time()
-            
-            self.settings_manager.time_ranges[period] = {
-                "start": start_time,
-                "end": end_time
-            }
+        self.settings_manager.time_ranges.update(time_ranges)
         
         # 설정을 파일에 저장
         self.settings_manager.save_time_settings()
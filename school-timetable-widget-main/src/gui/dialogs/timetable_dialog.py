@@ -26,16 +26,50 @@ class TimetableEditDialog(QtWidgets.QDialog):
         self.setWindowTitle("시간표 편집")
         self.setMinimumHeight(400)
         
-        # 현재 시간표 데이터 복사본 사용
-        self.timetable_data = {}
-        for day_idx, day in enumerate(['월', '화', '수', '목', '금']):
-            self.timetable_data[day] = {}
-            for period in range(1, 8):  # 1~7교시
-                value = self.settings_manager.timetable_data.get(day, {}).get(str(period), "")
-                self.timetable_data[day][str(period)] = value
+        # 현재 시간표 데이터 복사본 사용 ((요일 인덱스, 교시) -> 과목)
+        self.subjects = {}
+        self.load_timetable_copy()
                 
         self.setup_ui()
     
+    def load_timetable_copy(self):
+        """설정 관리자의 시간표 데이터를 복사하여 편집용 데이터로 사용"""
+        sm = self.settings_manager
+        self.subjects = {
+            (day_idx, period): sm.get_subject(day_idx, period)
+            for day_idx in range(1, sm.day_count + 1)
+            for period in range(1, sm.period_count + 1)
+        }
+    
+    def reload_from_settings(self):
+        """캐시된 대화상자를 다시 열 때 현재 시간표 데이터로 테이블 갱신"""
+        self.load_timetable_copy()
+        self.table.clearSpans()
+        self.sync_table_dimensions()
+        self.fill_table()
+        self.apply_cell_spans()
+        self.table.resizeRowsToContents()
+    
+    def sync_table_dimensions(self):
+        """설정된 요일/교시 수에 맞게 테이블 행/열 추가 또는 제거"""
+        sm = self.settings_manager
+        self.table.setRowCount(sm.period_count)
+        self.table.setColumnCount(sm.day_count)
+        self.table.setHorizontalHeaderLabels(sm.day_labels)
+        self.table.setVerticalHeaderLabels([f"{i}교시" for i in range(1, sm.period_count + 1)])
+        
+        # 테이블 셀 크기 조정 (새로 추가된 열 포함)
+        header = self.table.horizontalHeader()
+        for i in range(header.count()):
+            header.setSectionResizeMode(i, QtWidgets.QHeaderView.Stretch)
+    
+    def fill_table(self):
+        """편집용 데이터로 테이블 셀 채우기"""
+        for (day_idx, period), subject in self.subjects.items():
+            item = QtWidgets.QTableWidgetItem(subject)
+            item.setTextAlignment(QtCore.Qt.AlignCenter)
+            self.table.setItem(period - 1, day_idx - 1, item)
+    
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout()
         
@@ -52,24 +86,15 @@ class TimetableEditDialog(QtWidgets.QDialog):
         split_action.triggered.connect(self.split_selected_cell)
         layout.addWidget(toolbar)
         
-        self.table = QtWidgets.QTableWidget(7, 5)  # 7행(교시), 5열(요일)
-        self.table.setHorizontalHeaderLabels(['월', '화', '수', '목', '금'])
-        self.table.setVerticalHeaderLabels([f"{i}교시" for i in range(1, 8)])
-        
-        # 테이블 셀 크기 조정
-        header = self.table.horizontalHeader()
-        for i in range(header.count()):
-            header.setSectionResizeMode(i, QtWidgets.QHeaderView.Stretch)
+        # 행(교시), 열(요일) 수는 설정에 따름
+        self.table = QtWidgets.QTableWidget()
+        self.sync_table_dimensions()
         
         # 셀 선택 모드 변경
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.ContiguousSelection)
         
         # 기존 데이터로 테이블 채우기
-        for day_idx, day in enumerate(['월', '화', '수', '목', '금']):
-            for period in range(1, 8):
-                item = QtWidgets.QTableWidgetItem(self.timetable_data.get(day, {}).get(str(period), ""))
-                item.setTextAlignment(QtCore.Qt.AlignCenter)
-                self.table.setItem(period-1, day_idx, item)
+        self.fill_table()
         
         # 다중행 입력을 위한 delegate 적용
         delegate = MultiLineDelegate(self.table)
@@ -165,28 +190,29 @@ class TimetableEditDialog(QtWidgets.QDialog):
         """시간표 데이터에서 블록 교시 정보를 가져와 테이블에 적용"""
         # 블록 데이터 처리 (미구현: 시간표 데이터에 블록 정보 저장 형식 정의 필요)
         # 예시: 시간표에서 같은 요일의 연속 교시에 같은 과목이 있으면 자동으로 합치기
-        for day_idx, day in enumerate(['월', '화', '수', '목', '금']):
+        last_period = self.settings_manager.period_count
+        for col in range(self.settings_manager.day_count):
             start_row = None
             current_subject = None
             span_count = 0
             
             # 각 교시 확인
-            for period in range(1, 8):
-                subject = self.timetable_data.get(day, {}).get(str(period), "")
+            for period in range(1, last_period + 1):
+                subject = self.subjects.get((col + 1, period), "")
                 
                 # 같은 과목이 계속되는 경우
                 if subject and subject == current_subject:
                     span_count += 1
                 
                 # 다른 과목이거나 마지막 교시인 경우
-                if (subject != current_subject or period == 7) and start_row is not None:
+                if (subject != current_subject or period == last_period) and start_row is not None:
                     # 여러 교시에 걸친 경우만 처리
                     if span_count > 1:
                         # 마지막 같은 과목인 경우 포함
-                        if period == 7 and subject == current_subject:
-                            self.table.setSpan(start_row-1, day_idx, span_count+1, 1)
+                        if period == last_period and subject == current_subject:
+                            self.table.setSpan(start_row-1, col, span_count+1, 1)
                         else:
-                            self.table.setSpan(start_row-1, day_idx, span_count, 1)
+                            self.table.setSpan(start_row-1, col, span_count, 1)
                     
                     # 다음 블록 시작
                     start_row = period if subject else None
@@ -207,40 +233,36 @@ class TimetableEditDialog(QtWidgets.QDialog):
     
     def save_timetable(self):
         """테이블에서 데이터 가져와서 저장"""
-        updated_data = {}
+        updated_cells = {}
         
-        # 각 요일에 대해
-        for day_idx, day in enumerate(['월', '화', '수', '목', '금']):
-            updated_data[day] = {}
+        # 각 요일(열)에 대해
+        for col in range(self.table.columnCount()):
             
             # 각 교시에 대해
-            for period in range(1, 8):
-                row = period - 1
+            for row in range(self.table.rowCount()):
+                cell = (col + 1, row + 1)
                 
                 # 이 셀이 표시되는지 확인 (병합된 셀의 일부가 아닌 경우만)
-                is_visible_cell = self.table.rowSpan(row, day_idx) > 0
+                is_visible_cell = self.table.rowSpan(row, col) > 0
                 
                 if is_visible_cell:
                     # 병합된 셀이면 첫 번째 셀의 내용 가져오기
                     span_row = row
-                    while span_row > 0 and self.table.rowSpan(span_row - 1, day_idx) > 1:
+                    while span_row > 0 and self.table.rowSpan(span_row - 1, col) > 1:
                         span_row -= 1
                     
-                    item = self.table.item(span_row, day_idx)
-                    text = item.text() if item else ""
-                    updated_data[day][str(period)] = text
+                    item = self.table.item(span_row, col)
+                    updated_cells[cell] = item.text() if item else ""
                 else:
                     # 병합된 셀 내부는 상위 셀과 같은 내용으로 설정
                     for check_row in range(row, -1, -1):
-                        if self.table.rowSpan(check_row, day_idx) > 0:
-                            span_row = check_row
-                            item = self.table.item(span_row, day_idx)
-                            text = item.text() if item else ""
-                            updated_data[day][str(period)] = text
+                        if self.table.rowSpan(check_row, col) > 0:
+                            item = self.table.item(check_row, col)
+                            updated_cells[cell] = item.text() if item else ""
                             break
         
-        # 설정 관리자를 통해 시간표 데이터 업데이트
-        self.settings_manager.update_timetable_data(updated_data)
+        # 설정 관리자를 통해 시간표 데이터 업데이트 (표시하지 않는 요일/교시 데이터는 유지)
+        self.settings_manager.update_timetable_cells(updated_cells)
         
         # 부모 위젯에 시간표 갱신 요청
         self.parent.update_timetable_display()
@@ -0,0 +1,108 @@
+"""
+레이아웃 패스 스케줄러 모듈
+- 크기 변경, DPI 변경, 모니터 이동, 스타일 변경 등 셀 크기를 다시 계산해야 하는 이유를 모아 둠
+- 같은 이벤트 루프 프레임에서 들어온 요청은 하나로 합쳐 최대 한 번만 레이아웃 패스 실행
+- 드래그/리사이징 중에는 실행을 보류했다가 끝난 뒤 한 번만 실행
+- 요청 수 대비 실제 실행 수를 기록하여 중복 호출이 얼마나 줄었는지 확인
+"""
+import logging
+from typing import Callable, FrozenSet, Set
+
+from PyQt5 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# 레이아웃 무효화 이유
+REASON_RESIZE = "resize"
+REASON_DPI = "dpi"
+REASON_SCREEN = "screen"
+REASON_STYLE = "style"
+REASON_SHOW = "show"
+REASON_POSITION = "position"
+REASON_DIMENSIONS = "dimensions"
+
+# 연속된 패스 사이 최소 간격 (약 60Hz 한 프레임)
+LAYOUT_FRAME_INTERVAL_MS = 16
+
+
+class LayoutScheduler(QtCore.QObject):
+    """무효화 이유를 모아 프레임당 최대 한 번 레이아웃 패스를 실행하는 스케줄러
+
+    run_pass는 모인 이유 집합(frozenset)을 인자로 받는다.
+    """
+
+    def __init__(self, run_pass: Callable[[FrozenSet[str]], None],
+                 frame_interval_ms: int = LAYOUT_FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._run_pass = run_pass
+        self.frame_interval_ms = frame_interval_ms
+        self._pending: Set[str] = set()
+        self._suspended = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+        # 마지막 패스 실행 시각 (프레임 간격 계산용)
+        self._last_pass = QtCore.QElapsedTimer()
+
+        # 통계: 요청 수, 실행 수, 마지막으로 실행한 이유
+        self.requested_count = 0
+        self.executed_count = 0
+        self.last_reasons: FrozenSet[str] = frozenset()
+
+    @property
+    def pending_reasons(self) -> FrozenSet[str]:
+        return frozenset(self._pending)
+
+    @property
+    def is_suspended(self) -> bool:
+        return self._suspended
+
+    def invalidate(self, reason: str) -> None:
+        """레이아웃 무효화 (이미 예약된 패스가 있으면 이유만 추가)"""
+        self.requested_count += 1
+        self._pending.add(reason)
+        if not self._suspended:
+            self._schedule()
+
+    def suspend(self) -> None:
+        """드래그/리사이징 시작: 이유는 계속 모으되 실행은 보류"""
+        self._suspended = True
+        self._timer.stop()
+
+    def resume(self) -> None:
+        """드래그/리사이징 종료: 보류된 이유가 있으면 패스 예약"""
+        self._suspended = False
+        if self._pending:
+            self._schedule()
+
+    def flush(self) -> bool:
+        """보류 중인 패스를 즉시 실행
+
+        Returns:
+            패스를 실행했는지 여부
+        """
+        self._timer.stop()
+        if self._suspended or not self._pending:
+            return False
+        reasons = frozenset(self._pending)
+        self._pending.clear()
+        self.executed_count += 1
+        self.last_reasons = reasons
+        self._last_pass.start()
+        logger.debug(
+            f"레이아웃 패스 실행 ({', '.join(sorted(reasons))}): "
+            f"요청 {self.requested_count}회 / 실행 {self.executed_count}회"
+        )
+        self._run_pass(reasons)
+        return True
+
+    def _schedule(self) -> None:
+        if self._timer.isActive():
+            return
+        # 다음 이벤트 루프 반복에서 실행하되, 직전 패스와는 최소 한 프레임 간격 유지
+        delay = 0
+        if self._last_pass.isValid():
+            delay = max(0, self.frame_interval_ms - self._last_pass.elapsed())
+        self._timer.start(delay)
@@ -0,0 +1,125 @@
+"""
+스크린별 DPI/폰트 메트릭 캐시 모듈
+- 스크린별 논리 DPI, 장치 픽셀 비율, 주사율, 헤더 크기(폰트 메트릭)를 한 번만 계산하여 보관
+- 스크린 추가/제거(screenAdded, screenRemoved)와 DPI 변경(logicalDotsPerInchChanged) 시그널로만 갱신
+- 위젯은 창의 screenChanged 시그널과 metrics_changed 시그널을 받아 레이아웃을 다시 예약 (타이머 폴링 없음)
+"""
+import logging
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtCore import pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# DPI 비율 계산 기준 (100% 배율)
+BASE_DPI = 96.0
+
+# 주사율을 알 수 없을 때 사용할 기본값 (Hz)
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class ScreenMetrics(NamedTuple):
+    """스크린 하나의 DPI 정보"""
+    name: str
+    logical_dpi: float
+    device_pixel_ratio: float
+    refresh_rate: float = DEFAULT_REFRESH_RATE
+
+    @property
+    def dpi_ratio(self) -> float:
+        return self.logical_dpi / BASE_DPI
+
+    @property
+    def frame_interval_ms(self) -> int:
+        """한 화면 프레임 간격 (밀리초, 최소 1)"""
+        return max(1, int(1000 / self.refresh_rate))
+
+
+def _measure_screen(screen: QtGui.QScreen) -> ScreenMetrics:
+    refresh_rate = screen.refreshRate() or DEFAULT_REFRESH_RATE
+    return ScreenMetrics(screen.name(), screen.logicalDotsPerInch(), screen.devicePixelRatio(), refresh_rate)
+
+
+class ScreenMetricsCache(QtCore.QObject):
+    """스크린 이름별 DPI 정보와 헤더 크기 캐시 (싱글톤)"""
+
+    # DPI가 바뀐 스크린 (QScreen)
+    metrics_changed = pyqtSignal(object)
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = ScreenMetricsCache()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        if ScreenMetricsCache._instance is not None:
+            raise Exception("ScreenMetricsCache는 싱글톤 클래스입니다. get_instance() 메서드를 사용하세요.")
+        super().__init__(parent)
+        self._metrics: Dict[str, ScreenMetrics] = {}
+        # (스크린 이름, 폰트 키, 텍스트) -> 헤더 크기
+        self._header_sizes: Dict[Tuple[str, str, str], QtCore.QSize] = {}
+        self.hits = 0
+        self.misses = 0
+
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screen_removed)
+        for screen in app.screens():
+            self._on_screen_added(screen)
+
+    # ----- 시그널 처리 -----
+
+    def _on_screen_added(self, screen: QtGui.QScreen) -> None:
+        screen.logicalDotsPerInchChanged.connect(lambda _dpi, s=screen: self._on_dpi_changed(s))
+        self._metrics[screen.name()] = _measure_screen(screen)
+        logger.debug(f"스크린 추가: {self._metrics[screen.name()]}")
+
+    def _on_screen_removed(self, screen: QtGui.QScreen) -> None:
+        name = screen.name()
+        self._metrics.pop(name, None)
+        self._drop_header_sizes(name)
+        logger.debug(f"스크린 제거: {name}")
+
+    def _on_dpi_changed(self, screen: QtGui.QScreen) -> None:
+        metrics = _measure_screen(screen)
+        if self._metrics.get(metrics.name) == metrics:
+            return
+        self._metrics[metrics.name] = metrics
+        self._drop_header_sizes(metrics.name)
+        logger.debug(f"DPI 변경 감지: {metrics}")
+        self.metrics_changed.emit(screen)
+
+    def _drop_header_sizes(self, screen_name: str) -> None:
+        for key in [key for key in self._header_sizes if key[0] == screen_name]:
+            del self._header_sizes[key]
+
+    # ----- 조회 -----
+
+    def metrics_for(self, screen: Optional[QtGui.QScreen]) -> Optional[ScreenMetrics]:
+        """스크린의 DPI 정보 (screen이 None이면 주 스크린, 스크린이 없으면 None)"""
+        if screen is None:
+            screen = QtGui.QGuiApplication.primaryScreen()
+            if screen is None:
+                return None
+        metrics = self._metrics.get(screen.name())
+        if metrics is None:
+            metrics = self._metrics[screen.name()] = _measure_screen(screen)
+        return metrics
+
+    def header_size(self, screen: Optional[QtGui.QScreen], text: str, font: QtGui.QFont,
+                    measure: Callable[[str, QtGui.QFont], QtCore.QSize]) -> QtCore.QSize:
+        """헤더 텍스트 크기 (스크린/폰트/텍스트별로 measure를 한 번만 호출)"""
+        screen_name = screen.name() if screen is not None else ""
+        key = (screen_name, font.key(), text)
+        size = self._header_sizes.get(key)
+        if size is not None:
+            self.hits += 1
+            return size
+        self.misses += 1
+        size = self._header_sizes[key] = measure(text, font)
+        return size
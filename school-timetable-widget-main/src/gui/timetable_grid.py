@@ -0,0 +1,628 @@
+"""
+시간표 그리드 뷰 모듈
+- 요일/교시 헤더, 셀, 테두리, 현재 교시 강조, 줄바꿈 텍스트를 하나의 paintEvent에서 직접 그림
+- 셀 위치는 크기가 바뀔 때만 계산하는 좌표 테이블로 관리
+- 마우스 위치 -> 셀 판정은 좌표 테이블에 대한 산술 계산(이진 탐색)으로 처리
+- 항목별 상태(텍스트, 역할, 스타일 버전)를 캐시하여 실제로 바뀐 항목만 다시 그림
+- 요일/교시 수 변경 시 위젯을 다시 만들지 않고 늘어난/줄어든 행과 열만 반영
+- 줄바꿈 텍스트 배치는 QStaticText로 한 번만 계산하여 캐시 (폰트/셀 너비가 바뀌면 제거)
+- 마우스 호버는 미리 만들어 둔 호버 변형 스타일로 역할만 바꿔 해당 항목만 다시 그림
+- 헤더/셀 배경과 테두리(정적 배경 레이어)는 (좌표 테이블, DPR, 스타일 버전)별 QPixmap으로 캐시하고
+  다시 그릴 때는 캐시를 복사한 뒤 텍스트와 현재 교시/호버 항목만 위에 그림
+- 현재 교시 셀에는 남은 시간과 얇은 진행 막대를 표시하며, 갱신 시 그 셀만 다시 그림
+"""
+import bisect
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+from utils.styling import (
+    CellStyle, GRID_BORDER_RADIUS, GRID_PADDING,
+    ROLE_HEADER, ROLE_CELL, ROLE_CURRENT, ROLE_DRAG, hover_role
+)
+from utils.startup_profiler import StartupProfiler
+
+logger = logging.getLogger(__name__)
+
+# 그리드 간격 (기존 QGridLayout.setSpacing(4)와 동일)
+GRID_SPACING = 4
+
+# 헤더/셀 최소 크기 기본값 (px, adjust_cell_sizes에서 DPI에 맞게 다시 설정)
+DEFAULT_HEADER_WIDTH = 40
+DEFAULT_HEADER_HEIGHT = 30
+
+# 글자 자동 축소 시 최소 폰트 크기 (pt) 및 축소 단계
+MIN_SHRINK_POINT_SIZE = 6.0
+SHRINK_STEP_POINT_SIZE = 0.5
+
+# 현재 교시 진행 막대 높이 (px) 및 불투명도 (0-255)
+PROGRESS_BAR_HEIGHT = 3
+PROGRESS_BAR_OPACITY = 160
+
+
+def _distribute(total: int, fixed: int, count: int, spacing: int, minimum: int) -> List[Tuple[int, int]]:
+    """첫 구간(헤더)은 고정 크기, 나머지 count개 구간은 남는 공간을 균등 분배
+
+    Returns:
+        (시작 좌표, 크기) 목록 (헤더 포함 count + 1개)
+    """
+    available = total - fixed - spacing * count
+    base, remainder = divmod(max(available, 0), count) if count else (0, 0)
+    sections = [(0, fixed)]
+    pos = fixed + spacing
+    for index in range(count):
+        # 나머지 픽셀은 앞쪽 구간부터 1px씩 분배
+        size = max(minimum, base + (1 if index < remainder else 0))
+        sections.append((pos, size))
+        pos += size + spacing
+    return sections
+
+
+class TextLayout(NamedTuple):
+    """미리 배치한 셀 텍스트 (font는 축소가 적용된 실제 그리기 폰트)"""
+    static_text: QtGui.QStaticText
+    font: QtGui.QFont
+    width: float
+    height: float
+
+
+class TextLayoutCache:
+    """(텍스트, 폰트, 텍스트 영역 크기, 장치 픽셀 비율) -> 배치가 끝난 QStaticText 캐시
+
+    줄바꿈은 영역 너비에만 의존하므로 자동 축소를 쓰지 않으면 높이는 키에서 제외하고
+    세로 가운데 정렬은 그릴 때 계산한다. 폰트가 바뀌면 clear(), 셀 너비가 바뀌면
+    retain_widths()로 더 이상 쓰지 않는 항목을 제거한다.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, TextLayout]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str, font: QtGui.QFont, size: QtCore.QSize,
+            device_pixel_ratio: float, auto_shrink: bool = False) -> TextLayout:
+        width = size.width()
+        height = size.height() if auto_shrink else -1
+        key = (text, font.key(), width, height, device_pixel_ratio, auto_shrink)
+        layout = self._entries.get(key)
+        if layout is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        if auto_shrink:
+            font = _shrink_font_to_fit(text, font, size)
+        layout = _prepare_text_layout(text, font, width)
+        self._entries[key] = layout
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return layout
+
+    def retain_widths(self, widths) -> int:
+        """주어진 너비로 배치한 항목만 남김
+
+        Returns:
+            제거한 항목 수
+        """
+        widths = set(widths)
+        stale = [key for key in self._entries if key[2] not in widths]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _prepare_text_layout(text: str, font: QtGui.QFont, width: int) -> TextLayout:
+    """가운데 정렬/줄바꿈 텍스트를 영역 너비에 맞게 배치"""
+    # QStaticText는 '\n'을 줄바꿈으로 처리하지 않으므로 줄 구분 문자(U+2028)로 바꿔 drawText와 같게 맞춤
+    static_text = QtGui.QStaticText(text.replace("\n", "\u2028"))
+    static_text.setTextFormat(QtCore.Qt.PlainText)
+    option = QtGui.QTextOption(QtCore.Qt.AlignHCenter)
+    option.setWrapMode(QtGui.QTextOption.WordWrap)
+    static_text.setTextOption(option)
+    static_text.setTextWidth(max(width, 1))
+    static_text.prepare(QtGui.QTransform(), font)
+    laid_out = static_text.size()
+    return TextLayout(static_text, font, laid_out.width(), laid_out.height())
+
+
+def _shrink_font_to_fit(text: str, font: QtGui.QFont, size: QtCore.QSize) -> QtGui.QFont:
+    """텍스트가 영역 안에 들어갈 때까지 폰트 크기를 줄임 (최소 MIN_SHRINK_POINT_SIZE)"""
+    point_size = font.pointSizeF()
+    if point_size <= 0:
+        return font  # 픽셀 단위 폰트는 축소하지 않음
+    bounds = QtCore.QRect(QtCore.QPoint(0, 0), size)
+    flags = QtCore.Qt.AlignCenter | QtCore.Qt.TextWordWrap
+    fitted = QtGui.QFont(font)
+    while True:
+        needed = QtGui.QFontMetrics(fitted).boundingRect(bounds, flags, text)
+        if needed.width() <= size.width() and needed.height() <= size.height():
+            return fitted
+        if point_size - SHRINK_STEP_POINT_SIZE < MIN_SHRINK_POINT_SIZE:
+            return fitted
+        point_size -= SHRINK_STEP_POINT_SIZE
+        fitted.setPointSizeF(point_size)
+
+
+class SectionState(NamedTuple):
+    """항목(헤더/셀) 하나의 표시 상태 (이전 상태와 같으면 다시 그리지 않음)"""
+    text: str
+    role: str
+    style_version: Optional[int]
+    # 현재 교시 진행률 (0.0-1.0, 현재 교시 셀이 아니거나 표시하지 않으면 None)
+    progress: Optional[float] = None
+
+
+class TimetableGridView(QtWidgets.QWidget):
+    """직접 그리는 시간표 그리드 (행 0: 요일 헤더, 열 0: 교시 헤더)"""
+
+    def __init__(self, day_labels, period_count, parent=None):
+        super().__init__(parent)
+        self.day_labels = list(day_labels)
+        self.period_count = period_count
+
+        # 셀 텍스트 ((교시, 요일 인덱스) -> 텍스트, 둘 다 1부터 시작)
+        self._texts: Dict[Tuple[int, int], str] = {}
+        self._current_cell: Optional[Tuple[int, int]] = None
+        # 현재 교시 셀의 (남은 분, 진행률), 표시하지 않으면 None
+        self._progress: Optional[Tuple[int, float]] = None
+        # 마우스가 올라가 있는 항목 ((행, 열), 없으면 None)
+        self._hovered: Optional[Tuple[int, int]] = None
+        self._drag_mode = False
+        self._styles: Dict[str, CellStyle] = {}
+        self._style_version = None
+
+        # 텍스트 배치 캐시 및 글자 자동 축소 여부
+        self._text_layouts = TextLayoutCache()
+        self._auto_shrink = False
+
+        # 정적 배경 레이어 캐시 및 키 (좌표 테이블, DPR, 스타일 버전, 드래그 모드), 재생성 횟수
+        self._background: Optional[QtGui.QPixmap] = None
+        self._background_key = None
+        self.background_rebuild_count = 0
+
+        # 항목별 마지막 표시 상태 ((행, 열) -> SectionState) 및 갱신 항목 수 통계
+        self._states: Dict[Tuple[int, int], SectionState] = {}
+        self.last_updated_count = 0
+        self.total_updated_count = 0
+        # 시간표를 처음 그렸는지 (첫 페인트 시점 기록용)
+        self._first_paint_done = False
+
+        # 헤더 및 셀 최소 크기
+        self._header_width = DEFAULT_HEADER_WIDTH
+        self._header_height = DEFAULT_HEADER_HEIGHT
+        self._min_cell_width = 0
+        self._min_cell_height = 0
+
+        # 좌표 테이블 (열/행별 (시작 좌표, 크기)), 크기가 바뀔 때만 다시 계산
+        self._columns: List[Tuple[int, int]] = []
+        self._rows: List[Tuple[int, int]] = []
+        self._column_starts: List[int] = []
+        self._row_starts: List[int] = []
+
+        # 마우스 이동은 상위 위젯(드래그/커서 처리)으로 전달되도록 추적만 활성화
+        self.setMouseTracking(True)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        self._update_minimum_size()
+
+    # ----- 상태 설정 -----
+
+    def set_styles(self, styles: Dict[str, CellStyle], version: int) -> int:
+        """역할별 스타일 적용 (utils.styling.get_compiled_grid_styles 결과)
+
+        같은 버전이면 아무 항목도 바뀌지 않으므로 다시 그리지 않음
+        """
+        if version == self._style_version:
+            return self._apply_changes((), "style")
+        self._styles = styles
+        self._style_version = version
+        # 폰트가 바뀌었을 수 있으므로 이전 텍스트 배치는 모두 제거
+        self._text_layouts.clear()
+        return self._apply_changes(self._all_sections(), "style")
+
+    def set_auto_shrink(self, enabled: bool) -> None:
+        """셀 크기에 맞춰 글자 크기 자동 축소 여부 (셀 크기별로 한 번만 계산)"""
+        if enabled == self._auto_shrink:
+            return
+        self._auto_shrink = enabled
+        self.update()
+
+    @property
+    def text_layout_cache(self) -> TextLayoutCache:
+        return self._text_layouts
+
+    @property
+    def style_version(self):
+        return self._style_version
+
+    def set_cell_text(self, period: int, day_idx: int, text: str) -> int:
+        """셀 텍스트 설정 (바뀐 경우에만 해당 셀만 다시 그림)"""
+        self._texts[(period, day_idx)] = text
+        return self._apply_changes([(period, day_idx)], "text")
+
+    def set_cell_texts(self, texts: Dict[Tuple[int, int], str]) -> int:
+        """여러 셀 텍스트를 한 번에 설정 ((교시, 요일 인덱스) -> 텍스트)
+
+        Returns:
+            실제로 바뀐 셀 수
+        """
+        self._texts.update(texts)
+        return self._apply_changes(texts.keys(), "timetable")
+
+    def cell_text(self, period: int, day_idx: int) -> str:
+        return self._texts.get((period, day_idx), "")
+
+    def set_current_cell(self, period: Optional[int], day_idx: Optional[int]) -> int:
+        """현재 교시 강조 셀 설정 (없으면 None, 이전/새 강조 셀만 다시 그림)"""
+        new_cell = (period, day_idx) if period is not None and day_idx is not None else None
+        if new_cell == self._current_cell:
+            return self._apply_changes((), "highlight")
+        old_cell = self._current_cell
+        self._current_cell = new_cell
+        # 진행 상태는 이전 교시 기준이므로 제거 (새 값은 set_current_progress로 설정)
+        self._progress = None
+        return self._apply_changes([cell for cell in (old_cell, new_cell) if cell], "highlight")
+
+    def set_current_progress(self, remaining_minutes: Optional[int], fraction: Optional[float]) -> int:
+        """현재 교시 셀의 남은 시간과 진행률 설정 (None이면 숨김, 현재 교시 셀만 다시 그림)"""
+        if remaining_minutes is None or fraction is None:
+            progress = None
+        else:
+            # 진행 막대 너비가 눈에 띄게 바뀔 때만 다시 그리도록 반올림
+            progress = (remaining_minutes, round(min(max(fraction, 0.0), 1.0), 3))
+        self._progress = progress
+        return self._apply_changes([self._current_cell] if self._current_cell else (), "countdown")
+
+    @property
+    def current_progress(self) -> Optional[Tuple[int, float]]:
+        """현재 교시 셀의 (남은 분, 진행률), 표시하지 않으면 None"""
+        return self._progress
+
+    def set_drag_mode(self, enabled: bool) -> int:
+        """드래그 중 요일 헤더 스타일 적용 여부"""
+        if enabled == self._drag_mode:
+            return self._apply_changes((), "drag")
+        self._drag_mode = enabled
+        return self._apply_changes([(0, col) for col in range(len(self.day_labels) + 1)], "drag")
+
+    def set_hovered_section(self, section: Optional[Tuple[int, int]]) -> int:
+        """호버 항목 설정 ((행, 열) 또는 None, 이전/새 호버 항목만 다시 그림)"""
+        if section == self._hovered:
+            return self._apply_changes((), "hover")
+        old_section = self._hovered
+        self._hovered = section
+        return self._apply_changes([key for key in (old_section, section) if key], "hover")
+
+    @property
+    def hovered_section(self) -> Optional[Tuple[int, int]]:
+        return self._hovered
+
+    def set_dimensions(self, day_labels, period_count: int) -> int:
+        """요일/교시 수 변경 (범위를 벗어난 행/열 상태는 버리고 새 행/열과 바뀐 요일 헤더만 계산)
+
+        Returns:
+            상태가 새로 계산된 항목 수
+        """
+        day_labels = list(day_labels)
+        if day_labels == self.day_labels and period_count == self.period_count:
+            return self._apply_changes((), "dimensions")
+
+        old_labels, old_period_count = self.day_labels, self.period_count
+        self.day_labels, self.period_count = day_labels, period_count
+        day_count = len(day_labels)
+
+        # 사라진 행/열의 텍스트와 상태 제거
+        for store in (self._texts, self._states):
+            for key in [key for key in store if key[0] > period_count or key[1] > day_count]:
+                del store[key]
+        if self._current_cell and (self._current_cell[0] > period_count or self._current_cell[1] > day_count):
+            self._current_cell = None
+        if self._hovered and (self._hovered[0] > period_count or self._hovered[1] > day_count):
+            self._hovered = None
+
+        # 새로 생긴 행/열, 이름이 바뀐 요일 헤더만 후보로 사용
+        sections = [
+            (row, col)
+            for row in range(period_count + 1)
+            for col in range(day_count + 1)
+            if row > old_period_count or col > len(old_labels)
+        ]
+        sections.extend(
+            (0, col) for col in range(1, min(day_count, len(old_labels)) + 1)
+            if day_labels[col - 1] != old_labels[col - 1]
+        )
+
+        self._update_minimum_size()
+        self._relayout()
+        changed = self._apply_changes(sections, "dimensions")
+        # 기존 항목도 좌표가 바뀌므로 전체 영역을 다시 그림
+        self.update()
+        return changed
+
+    # ----- 변경 추적 -----
+
+    def _all_sections(self) -> List[Tuple[int, int]]:
+        return [
+            (row, col)
+            for row in range(self.period_count + 1)
+            for col in range(len(self.day_labels) + 1)
+        ]
+
+    def _build_state(self, row: int, col: int) -> SectionState:
+        progress = self._progress[1] if self._progress and (row, col) == self._current_cell else None
+        return SectionState(
+            self._section_text(row, col), self._section_role(row, col), self._style_version, progress
+        )
+
+    def _apply_changes(self, sections: Iterable[Tuple[int, int]], reason: str) -> int:
+        """후보 항목의 상태를 다시 계산하여 바뀐 항목만 상태 캐시에 반영하고 다시 그림
+
+        Returns:
+            바뀐 항목 수
+        """
+        region = QtGui.QRegion()
+        changed = 0
+        for key in sections:
+            state = self._build_state(*key)
+            if self._states.get(key) == state:
+                continue
+            self._states[key] = state
+            region += self.section_rect(*key)
+            changed += 1
+
+        self.last_updated_count = changed
+        self.total_updated_count += changed
+        if changed:
+            self.update(region)
+            logger.debug(f"그리드 갱신 ({reason}): {changed}개 항목")
+        return changed
+
+    def set_section_minimums(self, header_width: int, header_height: int,
+                             cell_width: int, cell_height: int) -> None:
+        """헤더 열/행 크기와 셀 최소 크기 설정 (기존 레이아웃의 최소 너비/높이 설정과 동일)"""
+        values = (header_width, header_height, cell_width, cell_height)
+        if values == (self._header_width, self._header_height, self._min_cell_width, self._min_cell_height):
+            return
+        self._header_width, self._header_height, self._min_cell_width, self._min_cell_height = values
+        self._update_minimum_size()
+        self._relayout()
+        self.update()
+
+    def header_size_hint(self, text: str, font: QtGui.QFont) -> QtCore.QSize:
+        """헤더 텍스트를 잘리지 않게 표시하는 데 필요한 크기 (QLabel.sizeHint 대응)"""
+        metrics = QtGui.QFontMetrics(font)
+        return QtCore.QSize(
+            metrics.horizontalAdvance(text) + GRID_PADDING * 2,
+            metrics.height() + GRID_PADDING * 2
+        )
+
+    # ----- 좌표 테이블 및 판정 -----
+
+    def _update_minimum_size(self) -> None:
+        day_count = len(self.day_labels)
+        min_width = self._header_width + day_count * (self._min_cell_width + GRID_SPACING)
+        min_height = self._header_height + self.period_count * (self._min_cell_height + GRID_SPACING)
+        self.setMinimumSize(min_width, min_height)
+
+    def _relayout(self) -> None:
+        """현재 크기로 열/행 좌표 테이블 계산"""
+        self._columns = _distribute(
+            self.width(), self._header_width, len(self.day_labels), GRID_SPACING, self._min_cell_width
+        )
+        self._rows = _distribute(
+            self.height(), self._header_height, self.period_count, GRID_SPACING, self._min_cell_height
+        )
+        self._column_starts = [start for start, _ in self._columns]
+        self._row_starts = [start for start, _ in self._rows]
+        # 현재 열 너비에서 나올 수 없는 텍스트 배치 제거 (역할별 테두리 두께에 따라 영역 너비가 다름)
+        insets = {style.border_width + GRID_PADDING for style in self._styles.values()} or {GRID_PADDING}
+        self._text_layouts.retain_widths(
+            width - inset * 2 for _, width in self._columns for inset in insets
+        )
+
+    def section_rect(self, row: int, col: int) -> QtCore.QRect:
+        """행/열 위치의 사각형 (행 0 / 열 0은 헤더)"""
+        if not self._columns:
+            self._relayout()
+        x, width = self._columns[col]
+        y, height = self._rows[row]
+        return QtCore.QRect(x, y, width, height)
+
+    def cell_rect(self, period: int, day_idx: int) -> QtCore.QRect:
+        """셀 사각형 (교시, 요일 인덱스 모두 1부터)"""
+        return self.section_rect(period, day_idx)
+
+    def section_at(self, pos: QtCore.QPoint) -> Optional[Tuple[int, int]]:
+        """좌표가 속한 (행, 열) 반환 (간격 또는 바깥이면 None)"""
+        if not self._columns:
+            self._relayout()
+        col = bisect.bisect_right(self._column_starts, pos.x()) - 1
+        row = bisect.bisect_right(self._row_starts, pos.y()) - 1
+        if col < 0 or row < 0:
+            return None
+        x, width = self._columns[col]
+        y, height = self._rows[row]
+        if pos.x() >= x + width or pos.y() >= y + height:
+            return None
+        return row, col
+
+    # ----- 그리기 -----
+
+    def _section_text(self, row: int, col: int) -> str:
+        if row == 0:
+            return self.day_labels[col - 1] if col > 0 else ""
+        if col == 0:
+            return str(row)
+        text = self._texts.get((row, col), "")
+        if self._progress and (row, col) == self._current_cell:
+            countdown = f"{self._progress[0]}분 남음"
+            return f"{text}\n{countdown}" if text else countdown
+        return text
+
+    def _section_role(self, row: int, col: int) -> str:
+        role = self._base_role(row, col)
+        if (row, col) == self._hovered:
+            # 호버 변형이 컴파일되어 있으면 그 스타일 사용
+            hovered = hover_role(role)
+            if hovered in self._styles:
+                return hovered
+        return role
+
+    def _base_role(self, row: int, col: int) -> str:
+        if (row, col) == self._current_cell:
+            return ROLE_CURRENT
+        return self._static_role(row, col)
+
+    def _static_role(self, row: int, col: int) -> str:
+        """정적 배경 레이어에 그리는 역할 (현재 교시/호버 강조 제외)"""
+        if row == 0:
+            return ROLE_DRAG if self._drag_mode else ROLE_HEADER
+        if col == 0:
+            return ROLE_HEADER
+        return ROLE_CELL
+
+    def _background_layer(self, device_pixel_ratio: float) -> QtGui.QPixmap:
+        """정적 배경 레이어 (키가 바뀐 경우에만 다시 그림)"""
+        key = (
+            self.width(), self.height(), tuple(self._columns), tuple(self._rows),
+            device_pixel_ratio, self._style_version, self._drag_mode
+        )
+        if self._background is not None and key == self._background_key:
+            return self._background
+
+        pixmap = QtGui.QPixmap(
+            max(1, round(self.width() * device_pixel_ratio)),
+            max(1, round(self.height() * device_pixel_ratio))
+        )
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        for row, col in self._all_sections():
+            style = self._styles.get(self._static_role(row, col))
+            if style is not None:
+                self._paint_section_background(painter, self.section_rect(row, col), style)
+        painter.end()
+
+        self._background = pixmap
+        self._background_key = key
+        self.background_rebuild_count += 1
+        logger.debug(f"배경 레이어 다시 그림 ({self.width()}x{self.height()}, DPR {device_pixel_ratio})")
+        return pixmap
+
+    def _paint_section_background(self, painter: QtGui.QPainter, rect: QtCore.QRect,
+                                  style: CellStyle) -> None:
+        # 배경 (스타일시트와 같이 테두리 아래까지 채움)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(style.background)
+        painter.drawRoundedRect(QtCore.QRectF(rect), GRID_BORDER_RADIUS, GRID_BORDER_RADIUS)
+
+        # 테두리 (사각형 안쪽에 그림)
+        border = style.border_width
+        if border and style.border_color is not None:
+            pen = QtGui.QPen(style.border_color, border, style.border_style)
+            painter.setPen(pen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            half = border / 2
+            painter.drawRoundedRect(
+                QtCore.QRectF(rect).adjusted(half, half, -half, -half),
+                GRID_BORDER_RADIUS, GRID_BORDER_RADIUS
+            )
+
+    def _paint_progress(self, painter: QtGui.QPainter, rect: QtCore.QRect,
+                        style: CellStyle, progress: float) -> None:
+        # 진행 막대 (테두리 안쪽 아래, 글자색을 반투명하게 사용)
+        inset = style.border_width + GRID_PADDING
+        width = (rect.width() - inset * 2) * progress
+        if width <= 0:
+            return
+        color = QtGui.QColor(style.text_color)
+        color.setAlpha(PROGRESS_BAR_OPACITY)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRect(QtCore.QRectF(
+            rect.x() + inset, rect.y() + rect.height() - style.border_width - PROGRESS_BAR_HEIGHT,
+            width, PROGRESS_BAR_HEIGHT
+        ))
+
+    def _paint_section_text(self, painter: QtGui.QPainter, rect: QtCore.QRect,
+                            style: CellStyle, text: str, device_pixel_ratio: float) -> None:
+        # 텍스트 (가운데 정렬, 줄바꿈, 배치는 캐시 사용)
+        if text:
+            inset = style.border_width + GRID_PADDING
+            text_rect = rect.adjusted(inset, inset, -inset, -inset)
+            layout = self._text_layouts.get(
+                text, style.font, text_rect.size(), device_pixel_ratio, self._auto_shrink
+            )
+            painter.setPen(style.text_color)
+            painter.setFont(layout.font)
+            # 영역보다 크면 drawText(AlignCenter)와 같이 가운데 기준으로 넘치게 두고 영역 밖은 잘라냄
+            # (가로 가운데 정렬은 QStaticText가 줄마다 처리)
+            y = text_rect.y() + (text_rect.height() - layout.height) / 2
+            overflows = layout.width > text_rect.width() or layout.height > text_rect.height()
+            if overflows:
+                painter.save()
+                painter.setClipRect(text_rect)
+            painter.drawStaticText(QtCore.QPointF(text_rect.x(), y), layout.static_text)
+            if overflows:
+                painter.restore()
+
+    def paintEvent(self, event):
+        if not self._styles:
+            return
+        start_ns = time.perf_counter_ns()
+        if not self._columns:
+            self._relayout()
+        device_pixel_ratio = self.devicePixelRatioF()
+        background = self._background_layer(device_pixel_ratio)
+        dirty = event.region()
+
+        # 다시 그릴 항목 중 정적 배경과 역할이 다른 항목(현재 교시, 호버)은 배경부터 직접 그림
+        sections = []
+        overlay = QtGui.QRegion()
+        for row in range(self.period_count + 1):
+            for col in range(len(self.day_labels) + 1):
+                rect = self.section_rect(row, col)
+                if not dirty.intersects(rect):
+                    continue
+                state = self._states.get((row, col)) or self._build_state(row, col)
+                is_overlay = state.role != self._static_role(row, col)
+                sections.append((rect, state, is_overlay))
+                if is_overlay:
+                    overlay += rect
+
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        # 정적 배경은 캐시 복사 (강조 항목 영역 제외)
+        painter.setClipRegion(dirty.subtracted(overlay))
+        painter.drawPixmap(0, 0, background)
+        painter.setClipping(False)
+        for rect, state, is_overlay in sections:
+            style = self._styles.get(state.role)
+            if style is None:
+                continue
+            if is_overlay:
+                self._paint_section_background(painter, rect, style)
+            self._paint_section_text(painter, rect, style, state.text, device_pixel_ratio)
+            if state.progress is not None:
+                self._paint_progress(painter, rect, style, state.progress)
+        painter.end()
+
+        # 첫 페인트: 스타일이 적용된 시간표가 처음 그려진 시점
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            StartupProfiler.get_instance().record("first_paint", start_ns, time.perf_counter_ns())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._relayout()
@@ -0,0 +1,172 @@
+"""
+웜 스타트 렌더링 캐시 모듈
+- 종료 시 마지막으로 그린 시간표 그리드를 이미지로 저장
+- 스타일 설정, 시간표 데이터, 위젯 크기로 만든 키가 같을 때만 재사용
+- 다음 시작 시 QApplication 생성 직후, 위젯 모듈 임포트와 설정 로드 전에 프레임 없는 창으로 먼저 표시
+  (메타데이터 파일에 저장한 키와 창 위치만 읽음) 한 뒤 실제 그리드로 교체
+- 설정을 불러온 뒤 현재 설정의 키와 다르면(다른 곳에서 설정 파일이 바뀐 경우) 즉시 닫음
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import NamedTuple, Optional, Tuple
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+from utils.config import Config
+from utils.paths import get_resolved_paths
+from utils.settings_store import atomic_write_json
+from utils.startup_profiler import StartupProfiler
+
+logger = logging.getLogger(__name__)
+
+# 캐시 형식 버전 (렌더링 방식이 바뀌면 증가시켜 기존 캐시를 무효화)
+WARM_START_CACHE_VERSION = 2
+WARM_START_IMAGE_FILE = "warm_start.png"
+WARM_START_META_FILE = "warm_start.json"
+
+
+class WarmStartFrame(NamedTuple):
+    """저장된 그리드 이미지와 저장 당시의 캐시 키, 창 위치"""
+    pixmap: QtGui.QPixmap
+    key: str
+    position: Optional[Tuple[int, int]]
+
+
+def compute_render_key(style_settings, timetable_data, size, dimensions=None) -> str:
+    """스타일 설정, 시간표 데이터, 위젯 크기(너비, 높이), 그리드 크기(요일 수, 교시 수)로 캐시 키 생성"""
+    if dimensions is None:
+        dimensions = (len(Config.DAYS_OF_WEEK_KR), Config.NUMBER_OF_CLASSES)
+    payload = json.dumps(
+        {
+            "version": WARM_START_CACHE_VERSION,
+            "style": style_settings,
+            "timetable": timetable_data,
+            "size": [int(size[0]), int(size[1])],
+            "dimensions": [int(dimensions[0]), int(dimensions[1])],
+        },
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _cache_file_paths():
+    cache_dir = get_resolved_paths().cache_dir
+    return (
+        os.path.join(cache_dir, WARM_START_IMAGE_FILE),
+        os.path.join(cache_dir, WARM_START_META_FILE),
+    )
+
+
+def save_warm_start_frame(pixmap: QtGui.QPixmap, key: str, position: Optional[Tuple[int, int]] = None) -> bool:
+    """그리드 이미지와 메타데이터(키, 장치 픽셀 비율, 창 위치) 저장"""
+    if pixmap is None or pixmap.isNull():
+        return False
+    image_path, meta_path = _cache_file_paths()
+    temp_path = image_path + ".tmp"
+    try:
+        if not pixmap.save(temp_path, "PNG"):
+            logger.warning("웜 스타트 이미지 저장 실패")
+            return False
+        os.replace(temp_path, image_path)
+        atomic_write_json(meta_path, {
+            "version": WARM_START_CACHE_VERSION,
+            "key": key,
+            "device_pixel_ratio": pixmap.devicePixelRatio(),
+            "position": list(position) if position is not None else None,
+        })
+        return True
+    except Exception as e:
+        logger.warning(f"웜 스타트 캐시 저장 중 오류: {e}")
+        return False
+
+
+def load_warm_start_frame(key: Optional[str] = None) -> Optional[WarmStartFrame]:
+    """저장된 그리드 이미지 반환 (없거나 형식 버전이 다르면 None)
+
+    Args:
+        key: 지정하면 저장된 키가 일치할 때만 반환 (None이면 키를 확인하지 않음)
+    """
+    image_path, meta_path = _cache_file_paths()
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != WARM_START_CACHE_VERSION or not meta.get("key"):
+        return None
+    if key is not None and meta["key"] != key:
+        return None
+
+    pixmap = QtGui.QPixmap(image_path)
+    if pixmap.isNull():
+        return None
+    pixmap.setDevicePixelRatio(float(meta.get("device_pixel_ratio", 1.0)))
+    position = meta.get("position")
+    return WarmStartFrame(pixmap, meta["key"], tuple(position) if position else None)
+
+
+def render_key_for_settings(settings_manager, size=None) -> str:
+    """설정 관리자 상태로 캐시 키 생성 (size가 없으면 저장된 위젯 크기 사용)"""
+    if size is None:
+        saved_size = settings_manager.widget_size
+        size = (saved_size["width"], saved_size["height"])
+    return compute_render_key(
+        settings_manager.get_style_settings(),
+        settings_manager.timetable_data,
+        size,
+        (settings_manager.day_count, settings_manager.period_count)
+    )
+
+
+class WarmStartWindow(QtWidgets.QWidget):
+    """저장된 그리드 이미지만 그리는 임시 창 (실제 위젯이 표시되면 닫힘)"""
+
+    def __init__(self, pixmap: QtGui.QPixmap, key: str = "", parent=None):
+        super().__init__(parent)
+        self.pixmap = pixmap
+        # 이미지를 저장할 때의 캐시 키 (matches 참고)
+        self.key = key
+        # 실제 위젯과 같은 창 속성 사용
+        self.setWindowFlags(
+            QtCore.Qt.WindowStaysOnBottomHint |
+            QtCore.Qt.Tool |
+            QtCore.Qt.FramelessWindowHint
+        )
+        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+        self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)
+        ratio = pixmap.devicePixelRatio() or 1.0
+        self.resize(int(round(pixmap.width() / ratio)), int(round(pixmap.height() / ratio)))
+
+    def paintEvent(self, event):
+        start_ns = time.perf_counter_ns()
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmap)
+        painter.end()
+        StartupProfiler.get_instance().record("warm_start_paint", start_ns, time.perf_counter_ns())
+
+    def matches(self, settings_manager) -> bool:
+        """저장된 이미지가 현재 설정(스타일, 시간표, 크기)으로 그린 것인지 여부"""
+        return self.key == render_key_for_settings(settings_manager)
+
+
+def show_warm_start_window() -> Optional[WarmStartWindow]:
+    """캐시된 그리드 이미지가 있으면 저장 당시 위치에 즉시 표시 (설정을 불러오지 않음)"""
+    if not Config.USE_WARM_START_CACHE:
+        return None
+    try:
+        frame = load_warm_start_frame()
+        if frame is None:
+            return None
+        window = WarmStartWindow(frame.pixmap, frame.key)
+        if frame.position is not None:
+            window.move(*frame.position)
+        window.show()
+        # 위젯 모듈 임포트와 생성(init_ui)이 이벤트 루프를 막기 전에 한 번 그리도록 처리
+        QtWidgets.QApplication.processEvents()
+        return window
+    except Exception as e:
+        logger.warning(f"웜 스타트 창 표시 실패: {e}")
+        return None
@@ -1,9 +1,10 @@
 from PyQt5 import QtWidgets, QtGui, QtCore
 import sys
 import os
-import datetime
 import json
 import logging
+import importlib
+import time
 
 # 새로 추가: Qt 경고 메시지 억제
 os.environ["QT_LOGGING_RULES"] = "qt.qpa.*=false"
@@ -11,18 +12,36 @@ os.environ["QT_LOGGING_RULES"] = "qt.qpa.*=false"
 # 사용자 정의 모듈
 from notifications.notification_manager import NotificationManager
 from utils.settings_manager import SettingsManager
-from utils.styling import (
-    hex_to_rgba, generate_header_style, generate_cell_style, 
-    generate_current_style, generate_drag_style
+from utils.startup_profiler import StartupProfiler
+from utils.config import Config
+from utils.styling import get_compiled_grid_styles, ROLE_HEADER
+from core.period_scheduler import PeriodEventScheduler
+from core.clock_monitor import ClockDriftMonitor
+from utils.weekly_plan import build_weekly_plan
+from .timetable_grid import TimetableGridView
+from .layout_scheduler import (
+    LayoutScheduler, REASON_RESIZE, REASON_DPI, REASON_SCREEN, REASON_STYLE,
+    REASON_SHOW, REASON_POSITION, REASON_DIMENSIONS, LAYOUT_FRAME_INTERVAL_MS
 )
-from .dialogs.time_dialog import TimeRangeDialog
-from .dialogs.settings_dialog import SettingsDialog
-from .dialogs.timetable_dialog import TimetableEditDialog
+from .screen_metrics import ScreenMetricsCache
+from .warm_start import render_key_for_settings, save_warm_start_frame
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
 
+# 대화상자 지연 로딩 레지스트리 (이름 -> (모듈 경로, 클래스 이름, 인스턴스 캐시 여부))
+# 대화상자 모듈은 우클릭 메뉴에서만 사용되므로 시작 시 임포트하지 않고
+# 처음 열 때 임포트 및 생성한 뒤 캐시한다.
+DIALOG_REGISTRY = {
+    "timetable": (".dialogs.timetable_dialog", "TimetableEditDialog", True),
+    "time": (".dialogs.time_dialog", "TimeRangeDialog", True),
+    "settings": (".dialogs.settings_dialog", "SettingsDialog", True),
+    # 가져오기/백업 대화상자는 열 때마다 상태가 새로 필요하므로 캐시하지 않음
+    "import": (".dialogs.import_dialog", "ImportDialog", False),
+    "backup": (".dialogs.backup_dialog", "BackupRestoreDialog", False),
+}
+
 # 드래그/리사이징 관련 로직을 별도 믹스인 클래스로 분리
 class DragResizeMixin:
     def init_drag_resize(self):
@@ -31,12 +50,56 @@ class DragResizeMixin:
         self.drag_start_pos = None
         self.resize_start_pos = None
         self.initial_size = self.size()
+        
+        # 드래그/리사이징 중 마우스 이동은 마지막 위치/크기만 보관했다가
+        # 화면 주사율에 맞춰 프레임당 한 번만 move()/resize() 적용
+        self._pending_pos = None
+        self._pending_size = None
+        self._geometry_frame_ms = LAYOUT_FRAME_INTERVAL_MS
+        self._last_geometry_apply = QtCore.QElapsedTimer()
+        self.geometry_timer = QtCore.QTimer(self)
+        self.geometry_timer.setSingleShot(True)
+        self.geometry_timer.timeout.connect(self.apply_pending_geometry)
+        
+        # 계측: 받은 이동 이벤트 수 / 실제 적용한 횟수 (누적)
+        self.geometry_moves_received = 0
+        self.geometry_moves_applied = 0
+        self._gesture_moves = (0, 0)
+    
+    def _schedule_geometry_apply(self):
+        """보관된 위치/크기를 다음 프레임에 적용하도록 예약 (이미 예약되어 있으면 무시)"""
+        self.geometry_moves_received += 1
+        if self.geometry_timer.isActive():
+            return
+        # 직전 적용과 최소 한 프레임 간격 유지
+        delay = 0
+        if self._last_geometry_apply.isValid():
+            delay = max(0, self._geometry_frame_ms - self._last_geometry_apply.elapsed())
+        self.geometry_timer.start(delay)
+    
+    def apply_pending_geometry(self):
+        """보관된 마지막 위치/크기를 한 번에 적용"""
+        self.geometry_timer.stop()
+        if self._pending_pos is None and self._pending_size is None:
+            return
+        if self._pending_size is not None:
+            self.resize(self._pending_size)
+        if self._pending_pos is not None:
+            self.move(self._pending_pos)
+        self._pending_pos = None
+        self._pending_size = None
+        self.geometry_moves_applied += 1
+        self._last_geometry_apply.start()
     
     def handle_mouse_press(self, event):
         if event.button() == QtCore.Qt.LeftButton:
-            # 드래그/리사이징 시작 시 모든 셀 크기 조정 타이머를 취소
-            if hasattr(self, 'resize_timer'):
-                self.resize_timer.stop()
+            # 드래그/리사이징 중에는 레이아웃 패스를 보류 (종료 시 한 번만 실행)
+            self.layout_scheduler.suspend()
+            self.grid_view.set_hovered_section(None)
+            # 현재 모니터 주사율에 맞춘 위치/크기 적용 간격
+            metrics = self.screen_metrics.metrics_for(self.current_screen())
+            self._geometry_frame_ms = metrics.frame_interval_ms if metrics else LAYOUT_FRAME_INTERVAL_MS
+            self._gesture_moves = (self.geometry_moves_received, self.geometry_moves_applied)
             
             # 위치가 고정되어 있으면 크기 조절만 허용
             if self.settings_manager.is_position_locked:
@@ -56,31 +119,21 @@ class DragResizeMixin:
                     self.dragging = True
                     self.drag_start_pos = event.globalPos() - self.frameGeometry().topLeft()
                     self.setCursor(QtCore.Qt.ClosedHandCursor)
-                    # 드래그 모드에서 스타일 변경
-                    drag_bg_rgba = hex_to_rgba(self.settings_manager.header_bg_color, self.settings_manager.header_opacity)
-                    border_rgba = hex_to_rgba(self.settings_manager.border_color, self.settings_manager.border_opacity)
-                    drag_style = generate_drag_style(
-                        drag_bg_rgba, 
-                        self.settings_manager.header_text_color, 
-                        border_rgba,
-                        self.settings_manager.font_family,
-                        self.settings_manager.font_size
-                    )
-                    for header in self.day_headers.values():
-                        header.setStyleSheet(drag_style)
+                    # 드래그 모드에서 요일 헤더 스타일 변경
+                    self.grid_view.set_drag_mode(True)
     
     def handle_mouse_move(self, event):
         if self.resizing:
             diff = event.globalPos() - self.resize_start_pos
             new_width = max(self.minimumWidth(), self.initial_size.width() + diff.x())
             new_height = max(self.minimumHeight(), self.initial_size.height() + diff.y())
-            self.resize(new_width, new_height)
+            self._pending_size = QtCore.QSize(new_width, new_height)
+            self._schedule_geometry_apply()
         elif self.dragging and event.buttons() == QtCore.Qt.LeftButton and not self.settings_manager.is_position_locked:
             # 위치 고정이 아닐 때만 드래그 허용
-            # 드래그 중에는 셀 크기 조정 타이머를 취소하여 모니터 이동 시 발생하는 resizeEvent로 인한 셀 크기 변경 방지
-            if hasattr(self, 'resize_timer'):
-                self.resize_timer.stop()
-            self.move(event.globalPos() - self.drag_start_pos)
+            # (모니터 이동 시 발생하는 resizeEvent는 스케줄러가 보류했다가 드래그 종료 후 처리)
+            self._pending_pos = event.globalPos() - self.drag_start_pos
+            self._schedule_geometry_apply()
         else:
             if event.pos().x() >= self.rect().width() - 20 and event.pos().y() >= self.rect().height() - 20:
                 self.setCursor(QtCore.Qt.SizeFDiagCursor)
@@ -91,22 +144,25 @@ class DragResizeMixin:
         if event.button() == QtCore.Qt.LeftButton:
             was_resizing = self.resizing
             was_dragging = self.dragging
+            # 아직 적용되지 않은 마지막 위치/크기를 반영한 뒤 저장
+            self.apply_pending_geometry()
+            if was_resizing or was_dragging:
+                received = self.geometry_moves_received - self._gesture_moves[0]
+                applied = self.geometry_moves_applied - self._gesture_moves[1]
+                logger.debug(f"{'리사이징' if was_resizing else '드래그'} 종료: 이동 이벤트 {received}회 / 적용 {applied}회")
             self.resizing = False
             self.dragging = False
             self.setCursor(QtCore.Qt.ArrowCursor)
-            self.update_styles()
+            self.grid_view.set_drag_mode(False)
             # 위치 및 크기 저장
             self.save_widget_position()
             
-            # 리사이징이 끝났을 때만 셀 크기 조정
+            # 리사이징이 끝났으면 셀 크기 조정
+            # (드래그 중 모니터를 옮겼다면 screenChanged로 보류된 요청이 함께 실행됨)
             if was_resizing:
-                # 약간의 지연을 두어 레이아웃이 완전히 업데이트된 후 실행
-                QtCore.QTimer.singleShot(200, self.adjust_cell_sizes)
-            elif was_dragging:
-                # 드래그 중 모니터 이동 시 위젯 크기가 변경될 수 있으므로 드래그 종료 시에도 셀 크기 조정
-                # 모니터 변경 후 레이아웃이 완전히 안정화될 때까지 충분한 지연
-                # DPI 변경도 함께 확인
-                QtCore.QTimer.singleShot(300, self._check_and_adjust_for_dpi_change)
+                self.layout_scheduler.invalidate(REASON_RESIZE)
+            # 보류 중 모인 이유와 함께 한 번만 실행
+            self.layout_scheduler.resume()
 
 class Widget(DragResizeMixin, QtWidgets.QWidget):
     def __init__(
@@ -114,8 +170,13 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         settings_manager=None, 
         notification_manager=None, 
         app_manager=None, 
-        parent=None
+        parent=None,
+        clock=None
     ):
+        """
+        Args:
+            clock: 현재 시각(datetime)을 반환하는 함수 (교시 전환과 남은 시간 표시에 함께 사용, 기본값 datetime.now)
+        """
         super().__init__(parent)
         
         # 매니저 인스턴스 설정
@@ -123,10 +184,8 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
             settings_manager if settings_manager 
             else SettingsManager.get_instance()
         )
-        self.notification_manager = (
-            notification_manager if notification_manager 
-            else NotificationManager.get_instance()
-        )
+        # 알림 관리자는 첫 표시 이후 ApplicationManager가 연결 (연결 전에는 알림/예고 없이 교시만 추적)
+        self.notification_manager = notification_manager
         self.app_manager = app_manager
         
         # 프레임 없는 창으로 설정
@@ -141,54 +200,74 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         # DPI 스케일링 지원 활성화 (모니터 간 이동 시 DPI 변경 처리)
         self.setAttribute(QtCore.Qt.WA_AcceptTouchEvents, False)
         
+        # 교시 전환 이벤트 스케줄러 (주간 계획의 교시 시작/종료, 예고 시각에만 깨어남)
+        self.period_scheduler = PeriodEventScheduler(self, clock=clock)
+        self.period_scheduler.period_started.connect(self._on_period_boundary)
+        self.period_scheduler.period_ended.connect(self._on_period_boundary)
+        self.period_scheduler.warning.connect(self._on_period_warning)
+        self.period_scheduler.day_changed.connect(self._on_day_changed)
+        self.period_scheduler.resynced.connect(self._on_period_schedule_resynced)
+        
+        # 절전/복귀, 시각/시간대 변경 감지 (감지하면 교시 전환 커서를 즉시 다시 맞춤, 확인은 표시 이후 시작)
+        self.clock_monitor = ClockDriftMonitor(self, clock=clock)
+        self.clock_monitor.clock_jumped.connect(self._on_clock_jumped)
+        self.clock_monitor.stalled.connect(self._on_clock_jumped)
+        
         # 현재 교시 및 요일 정보 초기화
+        # 첫 표시 전에는 예고 없는 주간 계획으로 교시만 계산해서 초기 스타일에 강조를 반영하고,
+        # 알림 확인과 예고 배치는 알림 관리자 연결 이후(start_period_tracking)로 미룬다
         self.current_period = None
         self.current_day_idx = None
+        self.sync_period_scheduler()
+        self._calculate_current_period()
+        
+        # 스크린별 DPI/헤더 크기 캐시 (스크린 추가/제거, DPI 변경 시그널로만 갱신)
+        self.screen_metrics = ScreenMetricsCache.get_instance()
+        self.screen_metrics.metrics_changed.connect(self._on_screen_metrics_changed)
         
-        # 현재 스크린의 DPI 정보 저장 (모니터 간 이동 시 DPI 변경 감지용)
-        self.last_screen_dpi = None
-        self.last_screen_device_pixel_ratio = None
+        # 설정 저장 디바운싱 타이머
+        self._save_settings_timer = None
         
-        # 설정 충돌 방지를 위한 플래그
-        self._is_applying_position = False  # 위치 적용 중 플래그
-        self._save_settings_timer = None  # 설정 저장 디바운싱 타이머
+        # 셀 크기 조정 요청(크기/DPI/모니터/스타일 변경)을 모아 프레임당 한 번만 실행
+        self.layout_scheduler = LayoutScheduler(self._run_layout_pass, parent=self)
         
         # 드래그 및 리사이징 관련 변수 초기화 (init_ui 이전에 호출)
         self.init_drag_resize()
         
-        # 위젯 초기화
-        self.init_ui()
+        # 그리드 역할별 스타일 (update_styles에서 생성)
+        self.grid_styles = {}
         
-        # 초기 DPI 정보 저장
-        current_global_pos = self.mapToGlobal(self.rect().center()) if self.isVisible() else QtCore.QPoint(0, 0)
-        current_screen = QtWidgets.QApplication.screenAt(current_global_pos) if self.isVisible() else QtWidgets.QApplication.primaryScreen()
-        if current_screen:
-            self.last_screen_dpi = current_screen.logicalDotsPerInch()
-            self.last_screen_device_pixel_ratio = current_screen.devicePixelRatio()
-        
-        # 타이머 설정 (매 분마다 현재 교시 업데이트)
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_current_period)
-        self.timer.start(60000)  # 60초 (1분) 마다 실행
-        
-        # 셀 크기 조정을 위한 지연 타이머 (모니터 변경 시 사용)
-        self.resize_timer = QtCore.QTimer(self)
-        self.resize_timer.setSingleShot(True)
-        self.resize_timer.timeout.connect(self.adjust_cell_sizes)
+        # 위젯 초기화
+        self.profiler = StartupProfiler.get_instance()
+        with self.profiler.phase("init_ui"):
+            self.init_ui()
+        
+        # 현재 교시 남은 시간/진행 막대 갱신 타이머 (현재 교시가 있을 때만 예약, 초 단위 정확도면 충분)
+        self.countdown_timer = QtCore.QTimer(self)
+        self.countdown_timer.setSingleShot(True)
+        self.countdown_timer.setTimerType(QtCore.Qt.VeryCoarseTimer)
+        self.countdown_timer.timeout.connect(self.update_countdown)
+        # 현재 교시 (시작, 종료) 시각 (자정 기준 밀리초), 교시가 바뀔 때만 계산
+        self._period_span = None
         
         # 설정 저장 디바운싱 타이머 (여러 저장 요청을 하나로 통합)
         self._save_settings_timer = QtCore.QTimer(self)
         self._save_settings_timer.setSingleShot(True)
         self._save_settings_timer.timeout.connect(self._save_widget_settings_debounced)
         
-        # 현재 시간에 맞는 교시 하이라이트
-        self.update_current_period()
+        # 알림 확인, 예고 배치, 시계 감시는 알림 관리자 연결 후 start_period_tracking에서 시작
+        # (ApplicationManager의 시작 단계에서 호출, 단독 실행 시에는 이벤트 루프 진입 직후)
+        if app_manager is None:
+            QtCore.QTimer.singleShot(0, self.start_period_tracking)
         
         # 마우스 우클릭 메뉴
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         
         self.cleanup_on_close = None  # 종료 시 호출할 정리 함수
+        
+        # 지연 생성된 대화상자 캐시 (DIALOG_REGISTRY 참고)
+        self._dialogs = {}
     
     def init_ui(self):
         """UI 초기화"""
@@ -203,59 +282,14 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(0)
         
-        # 시간표 그리드 레이아웃
-        self.grid_layout = QtWidgets.QGridLayout()
-        self.grid_layout.setSpacing(4)
-        
-        # 요일 헤더 생성 (1행)
-        self.day_headers = {}
-        days = ["", "월", "화", "수", "목", "금"]
-        for col, day in enumerate(days):
-            label = QtWidgets.QLabel(day)
-            label.setAlignment(QtCore.Qt.AlignCenter)
-            # 마우스 이벤트 추적 설정
-            label.setMouseTracking(True)
-            label.enterEvent = lambda event, lbl=label: self.on_label_hover_enter(event, lbl)
-            label.leaveEvent = lambda event, lbl=label: self.on_label_hover_leave(event, lbl)
-            self.grid_layout.addWidget(label, 0, col)
-            self.day_headers[col] = label
-        
-        # 교시 헤더 및 셀 생성 (2행부터)
-        self.period_headers = {}
-        self.cell_widgets = {}
-        
-        for row in range(1, 8):  # 1교시부터 7교시까지
-            # 교시 헤더 (첫 번째 열)
-            period_label = QtWidgets.QLabel(f"{row}")
-            period_label.setAlignment(QtCore.Qt.AlignCenter)
-            # 마우스 이벤트 추적 설정
-            period_label.setMouseTracking(True)
-            period_label.enterEvent = lambda event, lbl=period_label: self.on_label_hover_enter(event, lbl)
-            period_label.leaveEvent = lambda event, lbl=period_label: self.on_label_hover_leave(event, lbl)
-            self.grid_layout.addWidget(period_label, row, 0)
-            self.period_headers[row] = period_label
-            
-            # 각 요일별 셀 (2-6열)
-            for col in range(1, 6):  # 월화수목금
-                cell = QtWidgets.QLabel()
-                cell.setAlignment(QtCore.Qt.AlignCenter)
-                cell.setWordWrap(True)
-                # 셀 크기를 레이아웃이 완전히 제어하도록 설정 (내용에 따라 크기 변경 방지)
-                # Ignored 정책을 사용하면 위젯이 자신의 크기를 제안하지 않고 레이아웃이 완전히 제어
-                cell.setSizePolicy(QtWidgets.QSizePolicy.Ignored, QtWidgets.QSizePolicy.Ignored)
-                # 셀의 최소/최대 크기를 설정하여 내용에 의존하지 않도록 함
-                # DPI 변경 시에도 셀 크기가 내용에 의해 변경되지 않도록 최소 크기를 0으로 설정
-                cell.setMinimumSize(0, 0)
-                cell.setMaximumSize(16777215, 16777215)  # QWIDGETSIZE_MAX
-                # 마우스 이벤트 추적 설정
-                cell.setMouseTracking(True)
-                cell.enterEvent = lambda event, c=cell: self.on_cell_hover_enter(event, c)
-                cell.leaveEvent = lambda event, c=cell: self.on_cell_hover_leave(event, c)
-                self.grid_layout.addWidget(cell, row, col)
-                self.cell_widgets[(row, col)] = cell
-        
-        main_layout.addLayout(self.grid_layout)
+        # 시간표 그리드 (헤더와 셀을 하나의 위젯에서 직접 그림)
+        self.grid_view = TimetableGridView(
+            self.settings_manager.day_labels, self.settings_manager.period_count, self
+        )
+        main_layout.addWidget(self.grid_view)
         self.setLayout(main_layout)
+        # 호버 처리는 그리드에 설치한 이벤트 필터 하나에서 담당
+        self.grid_view.installEventFilter(self)
         
         # 스타일 적용
         self.update_styles()
@@ -280,14 +314,12 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
                     return
         
         # 위젯이 아직 표시되지 않았거나 크기가 0이면 실행하지 않음
+        # (표시될 때 showEvent에서 레이아웃 패스가 다시 예약됨)
         if not self.isVisible() or self.width() <= 0 or self.height() <= 0:
-            # 위젯이 아직 표시되지 않았으면 나중에 다시 시도
-            if not self.isVisible():
-                QtCore.QTimer.singleShot(100, lambda: self.adjust_cell_sizes(force))
             return
         
         # 레이아웃이 아직 설정되지 않았으면 실행하지 않음
-        if not self.layout() or not self.grid_layout:
+        if not self.layout() or not self.grid_view:
             return
         
         # 전체 위젯 크기에서 마진 제외
@@ -299,65 +331,38 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         if available_width <= 0 or available_height <= 0:
             return
         
+        start_ns = time.perf_counter_ns()
+        
+        # 현재 스크린의 DPI 정보 (스크린별 캐시, DPI 변경 시그널로 갱신)
+        screen = self.current_screen()
+        metrics = self.screen_metrics.metrics_for(screen)
+        dpi_ratio = metrics.dpi_ratio if metrics else 1.0
+        
+        # 헤더 텍스트 크기 (스크린/폰트/텍스트별로 한 번만 계산)
+        header_font = self.grid_styles[ROLE_HEADER].font if self.grid_styles else self.font()
+        measure = self.grid_view.header_size_hint
+        
         # 교시 헤더 열(0열) 크기 설정
-        # DPI 변경에 대응하기 위해 sizeHint() 대신 고정값 사용
-        # DPI가 높은 모니터에서도 일관된 크기 유지
-        if self.period_headers:
-            # sizeHint()를 사용하되, DPI를 고려한 최소값 설정
-            header_col_width_hint = self.period_headers[1].sizeHint().width()
-            # 현재 스크린의 DPI를 고려하여 최소 크기 계산
-            current_global_pos = self.mapToGlobal(self.rect().center())
-            current_screen = QtWidgets.QApplication.screenAt(current_global_pos)
-            if current_screen is None:
-                current_screen = QtWidgets.QApplication.primaryScreen()
-            
-            if current_screen:
-                dpi_ratio = current_screen.logicalDotsPerInch() / 96.0  # 96 DPI 기준
-                # 기본 최소 크기(40px)에 DPI 비율 적용
-                min_header_width = int(40 * dpi_ratio)
-                header_col_width = max(min_header_width, header_col_width_hint)
-            else:
-                header_col_width = max(40, header_col_width_hint)
+        # 텍스트 크기와 DPI 비율을 적용한 기본 최소 크기(40px) 중 큰 값 사용
+        if self.grid_view.period_count:
+            # (가장 긴 교시 번호 기준, 10교시 이상이면 두 자리)
+            header_col_width_hint = self.screen_metrics.header_size(
+                screen, str(self.grid_view.period_count), header_font, measure
+            ).width()
+            header_col_width = max(int(40 * dpi_ratio), header_col_width_hint)
         else:
             header_col_width = 40
         
-        self.grid_layout.setColumnMinimumWidth(0, header_col_width)
-        self.grid_layout.setColumnStretch(0, 0)
-        
-        # 요일 헤더 행(0행) 크기 설정
-        # DPI 변경에 대응하기 위해 sizeHint() 대신 고정값 사용
-        if self.day_headers:
-            header_row_height_hint = self.day_headers[1].sizeHint().height()
-            # 현재 스크린의 DPI를 고려하여 최소 크기 계산
-            current_global_pos = self.mapToGlobal(self.rect().center())
-            current_screen = QtWidgets.QApplication.screenAt(current_global_pos)
-            if current_screen is None:
-                current_screen = QtWidgets.QApplication.primaryScreen()
-            
-            if current_screen:
-                dpi_ratio = current_screen.logicalDotsPerInch() / 96.0  # 96 DPI 기준
-                # 기본 최소 크기(30px)에 DPI 비율 적용
-                min_header_height = int(30 * dpi_ratio)
-                header_row_height = max(min_header_height, header_row_height_hint)
-            else:
-                header_row_height = max(30, header_row_height_hint)
+        # 요일 헤더 행(0행) 크기 설정 (기본 최소 크기 30px에 DPI 비율 적용)
+        if self.grid_view.day_labels:
+            header_row_height_hint = self.screen_metrics.header_size(
+                screen, self.grid_view.day_labels[0], header_font, measure
+            ).height()
+            header_row_height = max(int(30 * dpi_ratio), header_row_height_hint)
         else:
             header_row_height = 30
         
-        self.grid_layout.setRowMinimumHeight(0, header_row_height)
-        self.grid_layout.setRowStretch(0, 0)
-        
         # 셀의 최소 크기 계산 (폰트가 잘리지 않도록)
-        # 현재 스크린의 DPI를 고려하여 최소 크기 계산
-        current_global_pos = self.mapToGlobal(self.rect().center())
-        current_screen = QtWidgets.QApplication.screenAt(current_global_pos)
-        if current_screen is None:
-            current_screen = QtWidgets.QApplication.primaryScreen()
-        
-        dpi_ratio = 1.0
-        if current_screen:
-            dpi_ratio = current_screen.logicalDotsPerInch() / 96.0
-        
         # 셀 폰트 크기 가져오기 (기본값 10pt)
         cell_font_size = getattr(self.settings_manager, 'cell_font_size', 10)
         
@@ -366,15 +371,14 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         min_cell_height_px = int((cell_font_size * 1.33 * 2.5) * dpi_ratio)  # 폰트 크기의 2.5배 (여유 공간 포함)
         min_cell_width_px = int((cell_font_size * 1.33 * 3.0) * dpi_ratio)  # 폰트 크기의 3배 (한글 2-3자 정도)
         
-        # 셀 열(1-5열) 크기 균등 설정 + 최소 너비 보장
-        for col in range(1, 6):
-            self.grid_layout.setColumnStretch(col, 1)  # 모든 열에 동일한 stretch
-            self.grid_layout.setColumnMinimumWidth(col, min_cell_width_px)  # 최소 너비 보장
+        # 헤더 열/행 크기 고정, 셀 열/행은 남는 공간을 균등 분배 + 최소 크기 보장
+        self.grid_view.set_section_minimums(
+            header_col_width, header_row_height,
+            min_cell_width_px, min_cell_height_px
+        )
         
-        # 셀 행(1-7행) 크기 균등 설정 + 최소 높이 보장
-        for row in range(1, 8):
-            self.grid_layout.setRowStretch(row, 1)  # 모든 행에 동일한 stretch
-            self.grid_layout.setRowMinimumHeight(row, min_cell_height_px)  # 최소 높이 보장
+        # 시작 시간 측정 (첫 실행만 기록됨)
+        self.profiler.record("first_adjust_cell_sizes", start_ns, time.perf_counter_ns())
     
     def apply_saved_position(self):
         """
@@ -382,9 +386,6 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         - 저장된 screen_info(geometry, name)가 있으면 해당 스크린 기준으로 복원
         - 없거나 스크린이 사라졌으면 primaryScreen 기준 fallback
         """
-        # 위치 적용 중 플래그 설정 (resizeEvent에서 중복 호출 방지)
-        self._is_applying_position = True
-        
         pos = self.settings_manager.widget_position
         size = self.settings_manager.widget_size
         screen_info = getattr(self.settings_manager, 'widget_screen_info', None)
@@ -437,12 +438,8 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         self.move(final_x, final_y)
         self.resize(widget_width, widget_height)
         
-        # 위치 적용 완료 플래그 해제
-        QtCore.QTimer.singleShot(100, lambda: setattr(self, '_is_applying_position', False))
-        
-        # 위치 적용 후 셀 크기 조정 (모니터 변경 시 레이아웃이 완전히 업데이트될 때까지 충분한 지연)
-        # 여러 번의 이벤트가 발생할 수 있으므로 더 긴 지연 시간 사용
-        QtCore.QTimer.singleShot(300, self.adjust_cell_sizes)
+        # 위치 적용 후 셀 크기 조정 (이동/크기 변경으로 생기는 resize 요청과 합쳐서 한 번만 실행)
+        self.layout_scheduler.invalidate(REASON_POSITION)
 
     def save_widget_position(self):
         """
@@ -482,141 +479,169 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         self._schedule_settings_save()
     
     def update_styles(self):
-        """모든 위젯에 현재 스타일 설정 적용"""
-        # 스타일 정보 가져오기
-        sm = self.settings_manager
-        
-        # 헤더 배경색을 RGBA 형식으로 변환
-        header_bg_rgba = hex_to_rgba(sm.header_bg_color, sm.header_opacity)
-        cell_bg_rgba = hex_to_rgba(sm.cell_bg_color, sm.cell_opacity)
-        current_bg_rgba = hex_to_rgba(sm.current_period_color, sm.current_period_opacity)
-        border_rgba = hex_to_rgba(sm.border_color, sm.border_opacity)
-        
-        # 헤더 스타일 적용 - 개별 헤더 폰트 사용
-        header_style = generate_header_style(
-            header_bg_rgba, 
-            sm.header_text_color, 
-            sm.header_font_family,  # 헤더 전용 폰트
-            sm.header_font_size     # 헤더 폰트 크기
-        )
-        
-        # 셀 스타일 적용 - 개별 셀 폰트 사용
-        cell_style = generate_cell_style(
-            cell_bg_rgba, 
-            sm.cell_text_color, 
-            border_rgba, 
-            sm.cell_font_family,    # 셀 전용 폰트
-            sm.cell_font_size       # 셀 폰트 크기
-        )
+        """그리드에 현재 스타일 설정 및 현재 교시 강조 적용
         
-        # 현재 교시 스타일 적용 - 개별 셀 폰트 사용
-        current_style = generate_current_style(
-            current_bg_rgba, 
-            sm.cell_text_color, 
-            border_rgba, 
-            sm.cell_font_family,    # 셀 전용 폰트
-            sm.cell_font_size       # 셀 폰트 크기
-        )
-        
-        # 요일 헤더 스타일 적용
-        for col, label in self.day_headers.items():
-            label.setStyleSheet(header_style)
-        
-        # 교시 헤더 스타일 적용
-        for row, label in self.period_headers.items():
-            label.setStyleSheet(header_style)
-        
-        # 셀 스타일 적용
-        for (row, col), cell in self.cell_widgets.items():
-            # 현재 교시이면 강조 스타일 적용
-            if row == self.current_period and col == self.current_day_idx:
-                cell.setStyleSheet(current_style)
-            else:
-                cell.setStyleSheet(cell_style)
+        스타일은 설정 값 조합별로 한 번만 컴파일되며, 값이 그대로면 다시 그리지 않는다.
+        """
+        compiled = get_compiled_grid_styles(self.settings_manager)
+        self.grid_styles = compiled.styles
+        self.grid_view.set_styles(compiled.styles, compiled.version)
+        self.grid_view.set_auto_shrink(self.settings_manager.cell_text_auto_shrink)
+        self.update_highlight()
+        # 헤더 폰트가 바뀌면 헤더 크기도 달라지므로 셀 크기 재계산
+        self.layout_scheduler.invalidate(REASON_STYLE)
+    
+    def update_highlight(self):
+        """현재 교시 강조만 갱신 (이전/새 강조 셀 두 개만 다시 그림)"""
+        self.grid_view.set_current_cell(self.current_period, self.current_day_idx)
     
     def update_timetable_display(self):
         """시간표 데이터를 화면에 표시"""
-        # 각 요일과 교시에 맞는 데이터 표시
-        days = ["월", "화", "수", "목", "금"]
-        timetable_data = self.settings_manager.timetable_data
-        
-        for day_idx, day in enumerate(days, 1):
-            for period in range(1, 8):
-                cell = self.cell_widgets.get((period, day_idx))
-                if cell:
-                    # 해당 요일과 교시에 맞는 과목 가져오기
-                    subject = timetable_data.get(day, {}).get(str(period), "")
-                    cell.setText(subject)
-    
-    def update_current_period(self):
-        """현재 시간에 맞는 교시 계산"""
-        now = QtCore.QTime.currentTime()
-        today = datetime.datetime.now().weekday()  # 0=월요일, 1=화요일, ..., 6=일요일
-        
-        # 주말이 아닌 경우에만 요일 인덱스 계산 (인덱스 1=월, 2=화, ..., 5=금)
-        self.current_day_idx = today + 1 if 0 <= today <= 4 else None
+        # 그리드에 표시 중인 각 요일과 교시에 맞는 과목 (요일 인덱스/교시 정수로 조회)
+        get_subject = self.settings_manager.get_subject
+        texts = {
+            (period, day_idx): get_subject(day_idx, period)
+            for day_idx in range(1, len(self.grid_view.day_labels) + 1)
+            for period in range(1, self.grid_view.period_count + 1)
+        }
+        
+        # 실제로 바뀐 셀만 다시 그림
+        changed = self.grid_view.set_cell_texts(texts)
+        logger.debug(f"시간표 표시 갱신: {changed}개 셀 변경")
+        
+        # 과목이 없는 요일이 바뀌었으면 교시 전환 계획도 다시 만듦
+        plan = self.period_scheduler.plan
+        if plan is not None and plan.class_weekdays != self.settings_manager.class_weekdays:
+            self.update_current_period()
+    
+    def apply_grid_dimensions(self):
+        """설정된 요일/교시 수를 그리드에 반영 (늘어난/줄어든 행과 열만 갱신)"""
+        sm = self.settings_manager
+        self.grid_view.set_dimensions(sm.day_labels, sm.period_count)
+        # 새 최소 크기를 바로 사용해야 하므로 예약된 패스를 즉시 실행
+        self.layout_scheduler.invalidate(REASON_DIMENSIONS)
+        self.layout_scheduler.flush()
+        # 행/열이 늘어나 최소 크기보다 작아졌으면 잘리지 않도록 위젯 크기 확장
+        required_size = self.size().expandedTo(self.minimumSizeHint())
+        if required_size != self.size():
+            self.resize(required_size)
+        self.update_timetable_display()
+        self.update_current_period()
+        self.update_highlight()
+    
+    def _calculate_current_period(self):
+        """현재 요일 인덱스와 교시만 갱신 (스타일/알림 갱신 없음)
         
+        시계를 다시 읽지 않고 교시 전환 스케줄러의 주간 계획 커서 상태를 그대로 사용한다.
+        """
+        self.current_day_idx = self.period_scheduler.current_day_idx
+        self.current_period = self.period_scheduler.current_period
+    
+    def start_period_tracking(self):
+        """알림 관리자 연결 이후: 예고를 포함한 주간 계획 배치, 시작 시점 교시 알림 확인, 시계 감시 시작"""
+        self.update_current_period(force_notify=True)
+        self.clock_monitor.start()
+    
+    def update_current_period(self, force_notify: bool = False):
+        """현재 시간에 맞는 교시 계산
+        
+        Args:
+            force_notify: True이면 교시 변경이 없어도 알림 확인 수행 (시작 시점용)
+        """
         # 이전 현재 교시 저장
         prev_period = self.current_period
         
-        # 현재 교시 계산
-        self.current_period = self.settings_manager.get_current_period(now)
+        # 교시 시간, 예고, 수업 요일이 바뀌었으면 주간 계획을 다시 배치한 뒤 커서 상태 반영
+        self.sync_period_scheduler()
+        self._calculate_current_period()
         
-        # 현재 교시가 변경되었으면 스타일 업데이트 및 알림
-        if prev_period != self.current_period:
-            self.update_styles()
-            
-            # 알림 관리자에 상태 전달
-            self.notification_manager.check_notifications(
-                self.current_period, 
-                self.current_day_idx, 
-                self.settings_manager.timetable_data
-            )
+        # 현재 교시가 변경되었으면 강조 셀 갱신 및 알림
+        period_changed = prev_period != self.current_period
+        if period_changed:
+            self.update_highlight()
             
-        # 최적화: 다음 교시 시작/종료 시간에 맞춰 타이머 재설정
-        self.set_next_update_timer()
-    
-    def set_next_update_timer(self):
-        """다음 교시 변경 시간에 맞춰 타이머 재설정"""
-        now = QtCore.QTime.currentTime()
-        next_update_msec = 60000  # 기본값: 1분
-        
-        # 현재 교시가 있는 경우, 종료 시간까지 남은 시간 계산
-        if self.current_period:
-            current_end_time = self.settings_manager.time_ranges.get(self.current_period, {}).get("end")
-            if current_end_time:
-                msec_to_end = now.msecsTo(current_end_time)
-                if msec_to_end > 0:
-                    next_update_msec = min(next_update_msec, msec_to_end + 1000)  # 1초 추가하여 확실히 넘어가게
-        
-        # 다음 교시 시작 시간 확인
-        next_period = (self.current_period or 0) + 1 if self.current_period != 7 else None
-        if next_period and 1 <= next_period <= 7:
-            next_start_time = self.settings_manager.time_ranges.get(next_period, {}).get("start")
-            if (next_start_time):
-                msec_to_start = now.msecsTo(next_start_time)
-                if msec_to_start > 0:
-                    next_update_msec = min(next_update_msec, msec_to_start + 1000)
-        
-        # 예고 알림을 위한 시간 계산
-        if next_period and self.notification_manager.next_period_warning:
-            warning_minutes = self.notification_manager.warning_minutes
-            next_start_time = self.settings_manager.time_ranges.get(next_period, {}).get("start")
-            if next_start_time:
-                warning_time = next_start_time.addSecs(-warning_minutes * 60)
-                msec_to_warning = now.msecsTo(warning_time)
-                if msec_to_warning > 0:
-                    next_update_msec = min(next_update_msec, msec_to_warning + 500)
-        
-        # 너무 긴 대기 시간은 최대 10분으로 제한 (안전장치)
-        next_update_msec = min(next_update_msec, 600000)  
-        
-        # 타이머 재설정
-        self.timer.stop()
-        self.timer.setInterval(max(1000, next_update_msec))  # 최소 1초
-        self.timer.start()
-        
-        logger.debug(f"다음 업데이트 예약: {next_update_msec/1000:.1f}초 후")
+        if period_changed or force_notify:
+            # 남은 시간 계산 기준 구간 갱신
+            self.restart_countdown()
+            # 알림 관리자에 상태 전달 (연결 전이면 start_period_tracking에서 확인)
+            if self.notification_manager is not None:
+                self.notification_manager.check_notifications(
+                    self.current_period, 
+                    self.current_day_idx
+                )
+    
+    def restart_countdown(self):
+        """현재 교시 시작/종료 시각을 다시 계산하고 남은 시간 표시 갱신 (교시, 시간 설정, 표시 설정 변경 시)"""
+        self._period_span = None
+        sm = self.settings_manager
+        if sm.show_period_countdown and self.current_period and self.current_day_idx:
+            minutes = sm.schedule.range_of(self.current_period)
+            if minutes:
+                self._period_span = (minutes[0] * 60000, minutes[1] * 60000)
+        self.update_countdown()
+    
+    def update_countdown(self):
+        """현재 교시 셀의 남은 시간과 진행 막대 갱신 (해당 셀만 다시 그림) 및 다음 갱신 예약"""
+        self.countdown_timer.stop()
+        if self._period_span is None:
+            self.grid_view.set_current_progress(None, None)
+            return
+        start, end = self._period_span
+        # 교시 전환 스케줄러와 같은 시계 사용
+        clock_now = self.period_scheduler.now()
+        now = (clock_now.hour * 3600 + clock_now.minute * 60 + clock_now.second) * 1000 \
+            + clock_now.microsecond // 1000
+        remaining_msec = end - now
+        if remaining_msec <= 0:
+            # 교시 종료 후 전환은 교시 이벤트 스케줄러(period_ended)가 처리
+            self.grid_view.set_current_progress(None, None)
+            return
+        remaining_minutes = -(-remaining_msec // 60000)  # 올림
+        self.grid_view.set_current_progress(remaining_minutes, (now - start) / (end - start))
+        
+        # 다음 갱신: 설정된 간격과 남은 분 표시가 바뀌는 시점 중 빠른 쪽
+        interval_msec = self.settings_manager.countdown_interval_seconds * 1000
+        self.countdown_timer.start(min(interval_msec, remaining_msec % 60000 or 60000))
+    
+    def sync_period_scheduler(self):
+        """교시 인덱스, 예고 설정, 수업 요일이 바뀐 경우에만 주간 계획을 다시 만들어 스케줄러에 배치
+        
+        알림 관리자가 연결되기 전에는 예고 없이 배치한다.
+        """
+        sm = self.settings_manager
+        warning_minutes = None
+        notification_manager = self.notification_manager
+        if notification_manager is not None and notification_manager.next_period_warning:
+            warning_minutes = notification_manager.warning_minutes
+        schedule, class_weekdays = sm.schedule, sm.class_weekdays
+        plan = self.period_scheduler.plan
+        if plan is not None and plan.key == (schedule.signature, class_weekdays, sm.day_count, warning_minutes):
+            return
+        self.period_scheduler.load(build_weekly_plan(schedule, class_weekdays, sm.day_count, warning_minutes))
+    
+    def _on_period_boundary(self, period):
+        """교시 시작/종료 시각 도래"""
+        self.update_current_period()
+    
+    def _on_period_warning(self, period, minutes):
+        """교시 시작 예고 시각 도래"""
+        if self.notification_manager is not None:
+            self.notification_manager.notify_upcoming_period(period, self.current_day_idx, minutes)
+    
+    def _on_clock_jumped(self, seconds):
+        """절전 복귀(시계 건너뜀 또는 확인 타이머 지연) 또는 시각/시간대 변경 감지"""
+        self.period_scheduler.resync()
+    
+    def _on_period_schedule_resynced(self):
+        """교시 전환 커서를 현재 시각으로 다시 맞춤 (지난 전환은 건너뜀)"""
+        self.update_current_period()
+        self.restart_countdown()  # 교시가 같아도 남은 시간이 달라졌음
+    
+    def _on_day_changed(self, date):
+        """날짜가 바뀐 뒤 첫 교시 전환 직전 (수업 없는 요일에는 발생하지 않음)"""
+        if self.notification_manager is not None:
+            self.notification_manager.reset_daily_state()
+        self.update_current_period()
     
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트 처리"""
@@ -634,59 +659,49 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         super().mouseReleaseEvent(event)
     
     def resizeEvent(self, event):
-        """위젯 크기 변경 시 셀 크기 조정"""
+        """위젯 크기 변경 시 셀 크기 조정 예약"""
         super().resizeEvent(event)
-        # 드래그/리사이징 중일 때는 셀 크기 조정을 하지 않음 (성능 최적화)
-        # 드래그 중 모니터 이동 시에도 resizeEvent가 발생할 수 있으므로 반드시 체크 필요
-        if self.resizing or self.dragging:
-            # 드래그/리사이징 중에는 타이머도 완전히 중지하여 드래그 종료 후 실행되는 것을 방지
-            self.resize_timer.stop()
-            return
-        
-        # 위치 적용 중일 때는 중복 호출 방지
-        if self._is_applying_position:
-            return
-        
-        # 모니터 변경 등으로 인한 크기 변경 시 레이아웃이 완전히 업데이트될 때까지 약간의 지연
-        # 타이머를 사용하여 연속된 resize 이벤트를 하나로 묶어 처리
-        # 지연 시간을 늘려서 레이아웃이 완전히 안정화된 후에 실행
-        self.resize_timer.stop()
-        self.resize_timer.start(150)  # 150ms 지연 (이전 50ms에서 증가)
+        # 연속된 resize 이벤트는 스케줄러가 하나의 패스로 합침
+        # (드래그/리사이징 중에는 보류되었다가 종료 시 한 번만 실행)
+        self.layout_scheduler.invalidate(REASON_RESIZE)
+    
+    def eventFilter(self, obj, event):
+        """그리드 호버 처리 (마우스 위치의 항목만 호버 스타일로 표시, 이벤트는 그대로 전달)"""
+        if obj is self.grid_view:
+            event_type = event.type()
+            if event_type == QtCore.QEvent.MouseMove:
+                # 드래그/리사이징 중에는 호버 표시 안 함
+                if not (self.dragging or self.resizing):
+                    self.grid_view.set_hovered_section(self.grid_view.section_at(event.pos()))
+            elif event_type == QtCore.QEvent.Leave:
+                self.grid_view.set_hovered_section(None)
+        return super().eventFilter(obj, event)
     
     def showEvent(self, event):
-        """위젯이 표시될 때 셀 크기 조정"""
+        """위젯이 표시될 때 셀 크기 조정 예약"""
         super().showEvent(event)
-        # 모니터 간 이동 후 표시될 때 셀 크기 재조정
-        # 드래그/리사이징 중이 아닐 때만 실행
-        # hasattr 체크를 추가하여 초기화 전에 호출되는 경우 방지
-        if hasattr(self, 'resizing') and hasattr(self, 'dragging'):
-            if not (self.resizing or self.dragging):
-                # 위젯이 처음 표시될 때는 즉시 셀 크기 조정
-                # 이후 표시될 때는 모니터 변경 등을 고려하여 지연
-                if not hasattr(self, '_has_been_shown'):
-                    # 첫 표시: 레이아웃이 완전히 업데이트될 때까지 약간의 지연
-                    QtCore.QTimer.singleShot(100, self.adjust_cell_sizes)
-                    self._has_been_shown = True
-                else:
-                    # 이후 표시: 모니터 변경 시 레이아웃이 완전히 업데이트될 때까지 충분한 지연
-                    # DPI 변경도 함께 확인
-                    QtCore.QTimer.singleShot(300, self._check_and_adjust_for_dpi_change)
-    
-    def changeEvent(self, event):
-        """위젯 상태 변경 이벤트 처리 (모니터 변경 감지)"""
-        super().changeEvent(event)
-        # 모니터 변경이나 기타 상태 변경 시 셀 크기 재조정
-        # QEvent.ActivationChange: 위젯이 활성화/비활성화될 때
-        # QEvent.WindowStateChange: 창 상태가 변경될 때
-        if event.type() in (QtCore.QEvent.WindowStateChange, QtCore.QEvent.ActivationChange):
-            # 드래그/리사이징 중이 아닐 때만 실행
-            # hasattr 체크를 추가하여 초기화 전에 호출되는 경우 방지
-            # 드래그 중 모니터 이동 시에도 이 이벤트가 발생할 수 있으므로 체크가 중요함
-            if hasattr(self, 'resizing') and hasattr(self, 'dragging'):
-                if not (self.resizing or self.dragging):
-                    # 모니터 변경 시 레이아웃이 완전히 업데이트될 때까지 충분한 지연
-                    # DPI 변경도 함께 확인
-                    QtCore.QTimer.singleShot(300, self._check_and_adjust_for_dpi_change)
+        # 창 핸들은 처음 표시될 때 만들어지므로 이때 모니터 변경 시그널 연결
+        if not hasattr(self, '_has_been_shown'):
+            self._has_been_shown = True
+            self.windowHandle().screenChanged.connect(self._on_window_screen_changed)
+        self.layout_scheduler.invalidate(REASON_SHOW)
+    
+    def current_screen(self):
+        """위젯 창이 속한 스크린 (창 핸들이 없으면 주 스크린)"""
+        handle = self.windowHandle()
+        screen = handle.screen() if handle is not None else None
+        return screen or QtWidgets.QApplication.primaryScreen()
+    
+    def _on_window_screen_changed(self, screen):
+        """창이 다른 모니터로 옮겨졌을 때 (드래그 중이면 스케줄러가 보류했다가 종료 시 실행)"""
+        logger.debug(f"모니터 변경 감지: {screen.name() if screen else None}")
+        self.layout_scheduler.invalidate(REASON_SCREEN)
+    
+    def _on_screen_metrics_changed(self, screen):
+        """스크린 DPI 변경 시 현재 창이 있는 스크린이면 셀 크기 재계산"""
+        current = self.current_screen()
+        if current is not None and screen.name() == current.name():
+            self.layout_scheduler.invalidate(REASON_DPI)
     
     def _schedule_settings_save(self):
         """설정 저장을 디바운싱하여 스케줄링"""
@@ -704,40 +719,13 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         except Exception as e:
             logger.error(f"설정 저장 오류: {e}")
     
-    def _check_and_adjust_for_dpi_change(self):
-        """DPI 변경 확인 및 셀 크기 조정"""
-        # 현재 위젯이 속한 스크린의 DPI 정보 가져오기
-        current_global_pos = self.mapToGlobal(self.rect().center())
-        current_screen = QtWidgets.QApplication.screenAt(current_global_pos)
+    def _run_layout_pass(self, reasons):
+        """레이아웃 스케줄러가 프레임당 한 번 호출하는 레이아웃 패스
         
-        if current_screen is None:
-            current_screen = QtWidgets.QApplication.primaryScreen()
-        
-        if current_screen:
-            # 현재 스크린의 DPI 정보
-            current_dpi = current_screen.logicalDotsPerInch()
-            current_device_pixel_ratio = current_screen.devicePixelRatio()
-            
-            # DPI가 변경되었는지 확인
-            dpi_changed = (
-                self.last_screen_dpi is not None and 
-                self.last_screen_dpi != current_dpi
-            ) or (
-                self.last_screen_device_pixel_ratio is not None and 
-                self.last_screen_device_pixel_ratio != current_device_pixel_ratio
-            )
-            
-            # DPI 정보 업데이트
-            self.last_screen_dpi = current_dpi
-            self.last_screen_device_pixel_ratio = current_device_pixel_ratio
-            
-            if dpi_changed:
-                logger.debug(f"DPI 변경 감지: DPI={current_dpi}, DevicePixelRatio={current_device_pixel_ratio}")
-                # DPI 변경 시 셀 크기 재조정 (약간의 추가 지연)
-                QtCore.QTimer.singleShot(100, lambda: self.adjust_cell_sizes(force=True))
-            else:
-                # DPI 변경이 없어도 일반적인 셀 크기 조정
-                self.adjust_cell_sizes(force=True)
+        Args:
+            reasons: 이번 패스에 합쳐진 무효화 이유 집합 (크기/DPI/모니터/스타일 등)
+        """
+        self.adjust_cell_sizes(force=True)
     
     def show_context_menu(self, pos):
         """마우스 우클릭 메뉴 표시"""
@@ -776,16 +764,34 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         # 메뉴 표시
         menu.exec_(self.mapToGlobal(pos))
 
+    def get_dialog(self, name):
+        """
+        레지스트리에 등록된 대화상자를 반환 (첫 사용 시 모듈 임포트 및 생성)
+        
+        캐시된 대화상자를 재사용할 때는 reload_from_settings()로 현재 설정을 다시 반영한다.
+        """
+        dialog = self._dialogs.get(name)
+        if dialog is not None:
+            dialog.reload_from_settings()
+            return dialog
+        
+        module_name, class_name, cacheable = DIALOG_REGISTRY[name]
+        module = importlib.import_module(module_name, __package__)
+        dialog = getattr(module, class_name)(self)
+        logger.debug(f"대화상자 지연 생성: {class_name}")
+        
+        if cacheable:
+            self._dialogs[name] = dialog
+        return dialog
+
     def show_import_dialog(self):
         """데이터 가져오기 대화상자 표시"""
-        from .dialogs.import_dialog import ImportDialog
-        dialog = ImportDialog(self)
+        dialog = self.get_dialog("import")
         dialog.exec_()
 
     def show_backup_dialog(self):
         """백업 관리 대화상자 표시"""
-        from .dialogs.backup_dialog import BackupRestoreDialog
-        dialog = BackupRestoreDialog(self)
+        dialog = self.get_dialog("backup")
         dialog.exec_()
 
     def toggle_position_lock(self):
@@ -795,21 +801,32 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
     
     def show_timetable_edit_dialog(self):
         """시간표 편집 대화상자 표시"""
-        dialog = TimetableEditDialog(self)
+        dialog = self.get_dialog("timetable")
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             self.update_timetable_display()
     
     def show_time_dialog(self):
         """시간 설정 대화상자 표시"""
-        dialog = TimeRangeDialog(self)
+        dialog = self.get_dialog("time")
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             self.update_current_period()  # 현재 교시 업데이트
+            self.restart_countdown()  # 교시가 같아도 시작/종료 시각이 바뀌었을 수 있음
     
     def show_settings_dialog(self):
         """설정 대화상자 표시"""
-        dialog = SettingsDialog(self)
-        # SettingsDialog의 settings_applied 시그널을 Widget의 update_styles 메서드에 연결
-        dialog.settings_applied.connect(self.update_styles)
+        if self.notification_manager is None:
+            # 시작 단계에서 알림 관리자가 연결되기 전에 연 경우 (알림 설정 탭에 필요)
+            self.notification_manager = NotificationManager.get_instance()
+        is_new = "settings" not in self._dialogs
+        dialog = self.get_dialog("settings")
+        if is_new:
+            # SettingsDialog의 settings_applied 시그널을 Widget의 update_styles 메서드에 연결
+            # (대화상자는 캐시되어 재사용되므로 최초 생성 시 한 번만 연결)
+            dialog.settings_applied.connect(self.update_styles)
+            # 예고 알림 설정이 바뀌었을 수 있으므로 교시 이벤트도 확인
+            dialog.settings_applied.connect(self.sync_period_scheduler)
+            dialog.grid_dimensions_changed.connect(self.apply_grid_dimensions)
+            dialog.countdown_settings_changed.connect(self.restart_countdown)
         
         # dialog.exec_()는 사용자가 대화상자를 닫을 때까지 블로킹합니다.
         # "확인" 또는 "적용" 후 "취소"가 아닌 방식으로 닫히면 Accepted 반환.
@@ -819,8 +836,24 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         # settings_applied 시그널이 발생하여 update_styles가 호출됩니다.
         # 따라서 dialog.exec_() 이후에 별도로 self.update_styles()를 호출할 필요는 없습니다.
         dialog.exec_()
-        # if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            # self.update_styles() # 시그널로 처리되므로 이 부분은 필요 없음
+    
+    def save_warm_start_frame(self) -> bool:
+        """다음 시작 시 먼저 표시할 그리드 이미지 저장 (gui/warm_start.py 참고)
+        
+        현재 교시 강조는 다음 시작 시점에 달라질 수 있으므로 제외하고 그린다.
+        """
+        if not Config.USE_WARM_START_CACHE:
+            return False
+        highlight = (self.current_period, self.current_day_idx)
+        self.current_period, self.current_day_idx = None, None
+        self.update_highlight()
+        try:
+            pixmap = self.grab()
+        finally:
+            self.current_period, self.current_day_idx = highlight
+            self.update_highlight()
+        key = render_key_for_settings(self.settings_manager, (self.width(), self.height()))
+        return save_warm_start_frame(pixmap, key, (self.x(), self.y()))
     
     def closeEvent(self, event):
         """위젯 종료 시 호출되는 이벤트"""
@@ -845,29 +878,8 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
             event.accept()
         # super().closeEvent(event) # event.accept() 또는 event.ignore()로 대체됨
 
-    # 호버 이벤트 처리 메서드 추가
-    def on_label_hover_enter(self, event, label):
-        """라벨에 마우스가 올라갔을 때 호출"""
-        # 필요한 경우 호버 효과 구현
-        pass
-    
-    def on_label_hover_leave(self, event, label):
-        """라벨에서 마우스가 나갔을 때 호출"""
-        # 필요한 경우 호버 효과 제거
-        pass
-    
-    def on_cell_hover_enter(self, event, cell):
-        """셀에 마우스가 올라갔을 때 호출"""
-        # 필요한 경우 호버 효과 구현
-        pass
-    
-    def on_cell_hover_leave(self, event, cell):
-        """셀에서 마우스가 나갔을 때 호출"""
-        # 필요한 경우 호버 효과 제거
-        pass
-
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
-    widget = Widget()
+    widget = Widget(notification_manager=NotificationManager.get_instance())
     widget.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -4,17 +4,14 @@
 import logging
 import os
 import sys
-import tempfile
-import subprocess
 from typing import Optional
 
-from PyQt5.QtWidgets import QApplication, QMessageBox, QProgressDialog
-from PyQt5.QtCore import Qt
+# 시작 시간 측정 기준 시각을 가능한 한 이르게 잡기 위해 가장 먼저 임포트
+import utils.startup_profiler  # noqa: F401
 
-from utils.version import get_version, get_version_string
+from utils.version import get_version_string
 from utils.exceptions import handle_exception
-from core.application_manager import ApplicationManager
-from core.updater import Updater
+from core.single_instance import get_launch_command, send_command_to_running_instance
 
 # 로거 설정
 def setup_logging() -> logging.Logger:
@@ -38,81 +35,6 @@ def setup_logging() -> logging.Logger:
 logger = setup_logging()
 
 
-def check_and_handle_update() -> bool:
-    """
-    업데이트 확인 및 처리
-    Returns:
-        업데이트를 다운로드했으면 True (앱 종료 필요), 아니면 False
-    """
-    try:
-        updater = Updater(get_version())
-        if not updater.check_for_update():
-            return False
-        
-        # GUI가 없으면 업데이트 체크만 하고 종료
-        app = QApplication.instance()
-        if not app:
-            app = QApplication(sys.argv)
-        
-        msg = (
-            f"새 버전({updater.latest_version})이 출시되었습니다!\n\n"
-            f"릴리즈 노트:\n{updater.release_notes}\n\n"
-            f"지금 다운로드하시겠습니까?"
-        )
-        
-        reply = QMessageBox.question(
-            None, 
-            "업데이트 알림", 
-            msg, 
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply != QMessageBox.Yes:
-            return False
-        
-        # 다운로드 진행
-        import os
-        dest = os.path.join(
-            tempfile.gettempdir(), 
-            f"school_timetable_update_{updater.latest_version}.exe"
-        )
-        
-        progress = QProgressDialog("업데이트 다운로드 중...", None, 0, 100)
-        progress.setWindowTitle("업데이트")
-        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
-        
-        def progress_callback(done: int, total: int) -> None:
-            progress.setValue(int(done / total * 100))
-        
-        ok = updater.download_update(dest, progress_callback=progress_callback)
-        progress.close()
-        
-        if ok:
-            QMessageBox.information(
-                None, 
-                "업데이트 완료", 
-                "다운로드가 완료되었습니다.\n프로그램을 종료하면 새 버전이 실행됩니다."
-            )
-            # 새 업데이터 실행
-            subprocess.Popen([dest])
-            logger.info("새 업데이터 실행 후 현재 애플리케이션 종료 요청")
-            app_instance = QApplication.instance()
-            if app_instance:
-                app_instance.quit()
-            return True
-        else:
-            QMessageBox.warning(
-                None, 
-                "업데이트 실패", 
-                "업데이트 파일 다운로드에 실패했습니다."
-            )
-            return False
-            
-    except Exception as e:
-        logger.warning(f"업데이트 확인 중 오류: {e}")
-        return False
-
-
 def main() -> int:
     """메인 함수"""
     try:
@@ -120,11 +42,16 @@ def main() -> int:
         version_str = get_version_string()
         logger.info(f"학교시간표위젯 {version_str} 시작")
         
-        # 자동 업데이트 확인 (비동기로 변경 가능)
-        if check_and_handle_update():
+        # 이미 실행 중인 인스턴스가 있으면 명령("show"/"reload")만 전달하고 종료
+        # (GUI 스택을 임포트하기 전에 확인하여 두 번째 실행이 빠르게 끝나도록 함)
+        command = get_launch_command(sys.argv)
+        if send_command_to_running_instance(command):
+            logger.info(f"이미 실행 중인 인스턴스에 '{command}' 명령을 전달했습니다.")
             return 0
         
-        # 애플리케이션 실행
+        from core.application_manager import ApplicationManager
+        
+        # 애플리케이션 실행 (업데이트 확인은 위젯 표시 후 백그라운드에서 수행)
         app_manager = ApplicationManager()
         exit_code = app_manager.run()
         return exit_code
@@ -132,6 +59,7 @@ def main() -> int:
     except Exception as e:
         logger.critical(f"심각한 오류 발생: {e}", exc_info=True)
         try:
+            from PyQt5.QtWidgets import QApplication, QMessageBox
             app = QApplication.instance()
             if not app:
                 app = QApplication(sys.argv)
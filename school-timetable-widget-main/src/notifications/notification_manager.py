@@ -1,9 +1,10 @@
 import platform
-from typing import Optional, Dict
+from typing import Optional
 from PyQt5 import QtWidgets, QtCore, QtGui
 import os
 from utils.settings_manager import SettingsManager
 from utils.paths import get_notification_settings_file_path
+from utils.settings_store import SECTION_NOTIFICATION
 import json
 import logging
 
@@ -60,12 +61,11 @@ class NotificationManager:
         """알림 설정 로드"""
         try:
             file_path = get_notification_settings_file_path()
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    self.notification_enabled = settings.get("notification_enabled", True)
-                    self.next_period_warning = settings.get("next_period_warning", True)
-                    self.warning_minutes = settings.get("warning_minutes", 5)
+            settings = self.settings_manager.read_settings_section(SECTION_NOTIFICATION, file_path)
+            if settings is not None:
+                self.notification_enabled = settings.get("notification_enabled", True)
+                self.next_period_warning = settings.get("next_period_warning", True)
+                self.warning_minutes = settings.get("warning_minutes", 5)
         except Exception as e:
             self.logger.error(f"알림 설정 로드 오류: {e}")
     
@@ -78,23 +78,20 @@ class NotificationManager:
                 "next_period_warning": self.next_period_warning,
                 "warning_minutes": self.warning_minutes
             }
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            self.settings_manager.write_settings_section(SECTION_NOTIFICATION, file_path, settings)
         except Exception as e:
             self.logger.error(f"알림 설정 저장 오류: {e}")
     
     def check_notifications(
         self, 
         current_period: Optional[int], 
-        current_day_idx: Optional[int], 
-        timetable_data: Dict[str, Dict[str, str]]
+        current_day_idx: Optional[int]
     ) -> None:
         """현재 교시에 대한 알림 확인
         
         Args:
-            current_period: 현재 교시 (1-7 또는 None)
-            current_day_idx: 현재 요일 인덱스 (1=월요일, ..., 5=금요일, 또는 None)
-            timetable_data: 시간표 데이터
+            current_period: 현재 교시 (1-교시 수 또는 None)
+            current_day_idx: 현재 요일 인덱스 (1=월요일, ..., 6=토요일, 또는 None)
         """
         if not self.notification_enabled:
             return
@@ -102,8 +99,7 @@ class NotificationManager:
         # 새 교시로 변경되었고, 평일인 경우만 알림
         if current_period is not None and current_day_idx is not None:
             if current_period != self.last_notified_period:
-                day_name = ['월', '화', '수', '목', '금'][current_day_idx-1]
-                subject = timetable_data.get(day_name, {}).get(str(current_period), "")
+                subject = self.settings_manager.get_subject(current_day_idx, current_period)
                 
                 # 현재 교시에 과목이 있는 경우 알림
                 if subject:
@@ -113,28 +109,35 @@ class NotificationManager:
                     )
                     self.last_notified_period = current_period
 
-        # 다음 교시 예고 알림 기능
-        if self.next_period_warning and current_period is not None and current_day_idx is not None:
-            next_period = current_period + 1
-            if next_period <= 7:  # 최대 7교시까지만 체크
-                now = QtCore.QTime.currentTime()
-                next_period_start = self.settings_manager.time_ranges.get(next_period, {}).get("start")
-                
-                if next_period_start:
-                    time_diff_secs = now.secsTo(next_period_start)
-                    # 다음 교시 시작 n분 전 예고
-                    if 0 < time_diff_secs <= self.warning_minutes * 60:
-                        if self.last_notified_warning != next_period:
-                            day_name = ['월', '화', '수', '목', '금'][current_day_idx-1]
-                            subject = timetable_data.get(day_name, {}).get(str(next_period), "")
-                            
-                            if subject:
-                                minutes = time_diff_secs // 60
-                                self.show_notification(
-                                    "다음 교시 예고",
-                                    f"{minutes}분 후 {next_period}교시 {subject} 수업이 시작됩니다."
-                                )
-                                self.last_notified_warning = next_period
+    def reset_daily_state(self) -> None:
+        """날짜가 바뀌면 같은 교시도 다시 알릴 수 있도록 마지막 알림 기록 초기화"""
+        self.last_notified_period = None
+        self.last_notified_warning = None
+
+    def notify_upcoming_period(
+        self,
+        period: int,
+        current_day_idx: Optional[int],
+        minutes: int
+    ) -> None:
+        """다음 교시 예고 알림 (교시 이벤트 스케줄러가 시작 n분 전에 호출)
+        
+        Args:
+            period: 곧 시작할 교시
+            current_day_idx: 현재 요일 인덱스 (표시하지 않는 요일이면 None)
+            minutes: 시작까지 남은 분
+        """
+        if not (self.notification_enabled and self.next_period_warning) or current_day_idx is None:
+            return
+        if self.last_notified_warning == period:
+            return
+        subject = self.settings_manager.get_subject(current_day_idx, period)
+        if subject:
+            self.show_notification(
+                "다음 교시 예고",
+                f"{minutes}분 후 {period}교시 {subject} 수업이 시작됩니다."
+            )
+            self.last_notified_warning = period
 
     def show_notification(self, title: str, message: str) -> None:
         """시스템 알림 표시
@@ -156,14 +159,10 @@ class NotificationManager:
             # win10toast 패키지 사용 시도
             try:
                 from win10toast import ToastNotifier
-                from utils.paths import resource_path # resource_path 임포트
+                from utils.paths import get_app_icon_path
                 
-                # 아이콘 경로 설정
-                app_icon_path = resource_path("assets/app_icon.ico")
-                if not os.path.exists(app_icon_path):
-                    app_icon_path = resource_path("assets/icon.ico")
-                if not os.path.exists(app_icon_path):
-                    app_icon_path = None # 아이콘 없음
+                # 아이콘 경로 설정 (캐시됨, 없으면 None)
+                app_icon_path = get_app_icon_path()
 
                 toaster = ToastNotifier()
                 toaster.show_toast(
@@ -5,26 +5,26 @@ import os
 import sys
 
 # 사용자 모듈
-from utils.paths import resource_path
+from utils.paths import get_app_icon_path
 from utils.version import get_version_string
 
 class TrayIcon(QSystemTrayIcon):
     def __init__(self, widget):
         super().__init__()
         self.widget = widget
+        # 마지막으로 표시한 풍선 메시지를 클릭했을 때 한 번만 호출할 함수 (show_message 참고)
+        self._message_click_handler = None
+        # 업데이트 메뉴 항목을 눌렀을 때 호출할 함수 (show_update_available 참고)
+        self._update_handler = None
         self.setup_tray()
         
     def setup_tray(self):
         # 아이콘 설정
-        icon_path = resource_path("assets/app_icon.ico")
-        if not os.path.exists(icon_path):
-            # 기본 아이콘 사용 (패키지 내부)
-            icon_path = resource_path("assets/icon.ico")
-            if not os.path.exists(icon_path):
-                # 그래도 없으면 Qt 기본 아이콘
-                self.setIcon(QIcon.fromTheme("applications-education"))
-            else:
-                self.setIcon(QIcon(icon_path))
+        # (app_icon.ico, icon.ico 순으로 확인, 캐시됨)
+        icon_path = get_app_icon_path()
+        if icon_path is None:
+            # 그래도 없으면 Qt 기본 아이콘
+            self.setIcon(QIcon.fromTheme("applications-education"))
         else:
             self.setIcon(QIcon(icon_path))
             
@@ -43,6 +43,12 @@ class TrayIcon(QSystemTrayIcon):
         version_action.setEnabled(False)  # 클릭 불가능하게 설정
         menu.addAction(version_action)
         
+        # 업데이트 액션 (새 버전이 확인되었을 때만 표시)
+        self.update_action = QAction("업데이트 설치", menu)
+        self.update_action.setVisible(False)
+        self.update_action.triggered.connect(self._on_update_action)
+        menu.addAction(self.update_action)
+        
         # 구분선
         menu.addSeparator()
         
@@ -55,6 +61,41 @@ class TrayIcon(QSystemTrayIcon):
         
         # 트레이 아이콘 클릭 시 메뉴 표시
         self.activated.connect(self.on_tray_icon_activated)
+        # 풍선 메시지 클릭은 그 메시지에 지정한 함수로만 전달
+        self.messageClicked.connect(self._on_message_clicked)
+    
+    def show_message(self, title, message, icon=QSystemTrayIcon.Information, msecs=10000, on_click=None):
+        """풍선 메시지 표시
+        
+        on_click은 이 메시지를 클릭했을 때 한 번만 호출되며, 다른 메시지를 표시하면 취소된다.
+        """
+        self._message_click_handler = on_click
+        self.showMessage(title, message, icon, msecs)
+    
+    def _on_message_clicked(self):
+        handler, self._message_click_handler = self._message_click_handler, None
+        if handler is not None:
+            handler()
+    
+    def show_update_available(self, version, on_install):
+        """새 버전 알림 표시 (트레이 메뉴 항목 + 풍선 메시지)
+        
+        Args:
+            version: 새 버전 문자열
+            on_install: 메뉴 항목 또는 풍선 메시지를 클릭했을 때 호출할 함수
+        """
+        self._update_handler = on_install
+        self.update_action.setText(f"업데이트 설치 ({version})")
+        self.update_action.setVisible(True)
+        self.show_message(
+            "업데이트 알림",
+            f"새 버전({version})이 출시되었습니다.\n클릭하여 업데이트하세요.",
+            on_click=on_install
+        )
+    
+    def _on_update_action(self):
+        if self._update_handler is not None:
+            self._update_handler()
     
     def on_tray_icon_activated(self, reason):
         """트레이 아이콘 활성화 이벤트 처리"""
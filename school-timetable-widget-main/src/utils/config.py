@@ -6,7 +6,7 @@
 
 테마/스타일 관리 가이드라인
 - 테마 정의 및 기본값: utils/config.py (THEMES, DEFAULT_STYLES)
-- 스타일 생성 함수: utils/styling.py (generate_header_style 등)
+- 스타일 생성 함수: utils/styling.py (역할(ROLE_*)별 CellStyle을 만드는 generate_grid_styles 등)
 - 테마/스타일 관련 코드는 반드시 위 두 파일만 수정
 - 테마 프리셋 추가 시 config.py의 THEMES, styling.py의 get_theme_presets()만 수정
 - settings_manager.py 등에서는 import config, import styling만 사용
@@ -14,18 +14,51 @@
 
 import os
 import sys
-import platform
-import appdirs
+from types import MappingProxyType
+
+
+class _lazy_class_attribute:
+    """처음 접근할 때 한 번만 계산하여 클래스 속성으로 캐시하는 디스크립터
+    
+    appdirs 플랫폼 탐색 등 비용이 드는 값을 임포트 시점이 아닌 사용 시점에 계산
+    """
+    
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        value = self.func(owner)
+        # 계산된 값으로 디스크립터를 교체하여 이후 접근은 일반 속성 조회
+        setattr(owner, self.name, value)
+        return value
+
 
 class Config:
     # 애플리케이션 기본 정보
     APP_NAME = "학교시간표위젯"
     APP_AUTHOR = "TimeTableDev"
+    # 사용자 데이터 디렉토리 이름 (APP_NAME은 아래에서 표시용 이름으로 재정의됨)
+    APP_DIR_NAME = APP_NAME
+    
+    # 사용자 데이터 경로 (OS에 맞게 자동 설정, 처음 접근할 때 계산)
+    @_lazy_class_attribute
+    def USER_DATA_DIR(cls):
+        import appdirs
+        return appdirs.user_data_dir(cls.APP_DIR_NAME, cls.APP_AUTHOR)
+    
+    @_lazy_class_attribute
+    def USER_CONFIG_DIR(cls):
+        import appdirs
+        return appdirs.user_config_dir(cls.APP_DIR_NAME, cls.APP_AUTHOR)
     
-    # 사용자 데이터 경로 (OS에 맞게 자동 설정)
-    USER_DATA_DIR = appdirs.user_data_dir(APP_NAME, APP_AUTHOR)
-    USER_CONFIG_DIR = appdirs.user_config_dir(APP_NAME, APP_AUTHOR)
-    USER_CACHE_DIR = appdirs.user_cache_dir(APP_NAME, APP_AUTHOR)
+    @_lazy_class_attribute
+    def USER_CACHE_DIR(cls):
+        import appdirs
+        return appdirs.user_cache_dir(cls.APP_DIR_NAME, cls.APP_AUTHOR)
     
     # 리소스 파일 경로
     @staticmethod
@@ -36,7 +69,9 @@ class Config:
         return os.path.join(os.path.abspath('.'), relative_path)
     
     # 파일 경로 설정 (상대 경로는 절대 경로로 변환)
-    TIMETABLE_CSV_PATH = get_resource_path.__func__('assets/default_timetable.csv')
+    @_lazy_class_attribute
+    def TIMETABLE_CSV_PATH(cls):
+        return cls.get_resource_path('assets/default_timetable.csv')
     
     # 사용자 설정 파일 (사용자 데이터 디렉토리에 저장)
     TIME_SETTINGS_FILE = 'time_settings.json'
@@ -44,6 +79,14 @@ class Config:
     STYLE_SETTINGS_FILE = 'style_settings.json'
     WIDGET_SETTINGS_FILE = 'widget_settings.json'
     
+    # 통합 설정 저장소 사용 여부 (모든 설정을 settings_store.json 하나에 저장)
+    # SCHOOL_TIMETABLE_SETTINGS_STORE 환경 변수("1"/"0")로 재정의 가능
+    USE_SETTINGS_STORE = False
+    SETTINGS_STORE_ENV = 'SCHOOL_TIMETABLE_SETTINGS_STORE'
+    
+    # 웜 스타트 캐시 사용 여부 (종료 시 저장한 그리드 이미지를 다음 시작 시 먼저 표시)
+    USE_WARM_START_CACHE = True
+    
     # 창 설정
     WINDOW_TRANSPARENCY = 0.8
     DEFAULT_WINDOW_POSITION = (100, 100)
@@ -55,6 +98,26 @@ class Config:
     DAYS_OF_WEEK_KR = ['월', '화', '수', '목', '금']
     NUMBER_OF_CLASSES = 7
     
+    # 시간표 그리드 크기 (요일 수는 앞에서부터 사용, 토요일 수업이면 6)
+    ALL_DAYS_OF_WEEK_KR = ('월', '화', '수', '목', '금', '토')
+    MIN_NUMBER_OF_CLASSES = 1
+    MAX_NUMBER_OF_CLASSES = 10
+    
+    # 기본 시간이 없는 교시(8교시 이후)는 앞 교시 종료 후 쉬는 시간 뒤에 이어서 배치
+    DEFAULT_PERIOD_MINUTES = 50
+    DEFAULT_BREAK_MINUTES = 10
+    
+    # 현재 교시 남은 시간/진행 막대 갱신 간격 (초)
+    DEFAULT_COUNTDOWN_INTERVAL_SECONDS = 60
+    MIN_COUNTDOWN_INTERVAL_SECONDS = 10
+    MAX_COUNTDOWN_INTERVAL_SECONDS = 600
+
+    # 시계 변경 감지: 단조 시계와 벽시계 차이를 확인하는 간격과 허용 오차 (초)
+    CLOCK_CHECK_INTERVAL_SECONDS = 60
+    CLOCK_JUMP_THRESHOLD_SECONDS = 2
+    # 절전 복귀 감지(Windows 등 단조 시계가 절전 중에도 흐르는 경우): 확인 타이머가 간격보다 이만큼 늦으면 지연으로 판단 (초)
+    CLOCK_STALL_THRESHOLD_SECONDS = 30
+
     # 기본 교시별 시간 설정
     DEFAULT_TIME_RANGES = {
         1: {"start": "09:00", "end": "09:50"},
@@ -73,12 +136,15 @@ class Config:
         "warning_minutes": 5
     }
     
+    # 업데이트 확인 주기 (시간 단위, 0이면 실행할 때마다 확인)
+    UPDATE_CHECK_INTERVAL_HOURS = 24
+    
     # 테마 설정
     THEME_LIGHT = "light"
     THEME_DARK = "dark"
     THEME_CUSTOM = "custom"
     
-    # 테마 스타일 정의
+    # 테마 스타일 정의 (읽기 전용, 아래에서 MappingProxyType으로 고정)
     THEMES = {
         THEME_LIGHT: {
             "header_bg_color": "#6464C8",  # 연한 파란색
@@ -121,10 +187,17 @@ class Config:
         "header_font_size": 11,  # 헤더는 약간 더 크게
         "cell_font_family": "맑은 고딕",  # 기본 셀 폰트
         "cell_font_size": 10,  # 셀 폰트 크기
+        "cell_text_auto_shrink": False,  # 셀 크기에 맞춰 글자 자동 축소
         # 테마 설정
         "theme": DEFAULT_THEME
     }
     
+    # 테마/기본 스타일은 한 번만 구성하고 읽기 전용으로 공유
+    THEMES = MappingProxyType({
+        name: MappingProxyType(theme) for name, theme in THEMES.items()
+    })
+    DEFAULT_STYLES = MappingProxyType(DEFAULT_STYLES)
+    
     # 애플리케이션 설정
     APP_NAME = "학교 시간표 위젯"
     APP_VERSION = "1.0.0"
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+패키지 지연 내보내기 유틸리티
+- 패키지 __init__에서 이름 -> 하위 모듈 매핑만 선언하면 처음 접근할 때 해당 모듈을 임포트 (PEP 562 모듈 __getattr__)
+- 무거운 하위 모듈(GUI 스택 등)을 패키지 임포트만으로 불러오지 않기 위해 사용
+
+사용 예:
+    __getattr__, __all__ = lazy_exports(__name__, {"Widget": ".widget"})
+"""
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(module_name: str, mapping: Dict[str, str]) -> Tuple[Callable[[str], object], List[str]]:
+    """패키지용 모듈 __getattr__과 __all__ 생성
+
+    Args:
+        module_name: 패키지 이름 (패키지 __init__의 __name__, 상대 모듈 경로의 기준)
+        mapping: 내보낼 이름 -> 정의된 모듈 경로 (상대 경로 가능)
+
+    Returns:
+        (__getattr__, __all__)
+    """
+    def __getattr__(name):
+        if name in mapping:
+            module = importlib.import_module(mapping[name], module_name)
+            return getattr(module, name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__, list(mapping)
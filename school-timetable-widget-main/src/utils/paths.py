@@ -20,31 +20,58 @@ APP_DISPLAY_NAME = "학교시간표위젯" # UI 표시용 이름
 APP_NAME = "SchoolTimetableWidget" # 내부 식별자, 폴더명, 레지스트리 키 등에 사용될 영문 이름
 APP_AUTHOR = "TimeTableDev" # 개발자/회사 이름
 
+# 데이터 디렉토리 재정의 환경 변수
+DATA_DIR_ENV = 'SCHOOL_TIMETABLE_DATA_DIR'
+
+# 리소스 기준 경로 (최초 resource_path 호출 시 한 번만 계산)
+_resource_base_path = None
+
+def _get_resource_base_path():
+    """리소스 기준 경로 반환 (PyInstaller 임시 폴더 또는 src 디렉토리)"""
+    global _resource_base_path
+    if _resource_base_path is None:
+        try:
+            # PyInstaller에서 생성된 임시 폴더
+            _resource_base_path = sys._MEIPASS
+            logger.debug(f"PyInstaller 환경에서 리소스 경로 사용: {_resource_base_path}")
+        except Exception:
+            # 일반 실행 시 현재 스크립트 경로
+            _resource_base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            logger.debug(f"일반 환경에서 리소스 경로 사용: {_resource_base_path}")
+    return _resource_base_path
+
 def resource_path(relative_path):
     """
     패키지 리소스 경로를 얻기 위한 헬퍼 함수
     PyInstaller로 패키징된 애플리케이션에서도 리소스에 접근할 수 있게 함
     """
-    try:
-        # PyInstaller에서 생성된 임시 폴더
-        base_path = sys._MEIPASS
-        logger.debug(f"PyInstaller 환경에서 리소스 경로 사용: {base_path}")
-    except Exception:
-        # 일반 실행 시 현재 스크립트 경로
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        logger.debug(f"일반 환경에서 리소스 경로 사용: {base_path}")
-    
-    full_path = os.path.join(base_path, relative_path)
-    logger.debug(f"리소스 경로 반환: {full_path}")
-    return full_path
+    return os.path.join(_get_resource_base_path(), relative_path)
 
-def get_data_directory():
+_APP_ICON_UNRESOLVED = object()
+_app_icon_path = _APP_ICON_UNRESOLVED
+
+def get_app_icon_path():
+    """
+    애플리케이션 아이콘 경로 반환 (app_icon.ico, icon.ico 순으로 확인, 없으면 None)
+    리소스는 실행 중 바뀌지 않으므로 최초 확인 결과를 재사용한다.
+    """
+    global _app_icon_path
+    if _app_icon_path is _APP_ICON_UNRESOLVED:
+        _app_icon_path = None
+        for candidate in ("assets/app_icon.ico", "assets/icon.ico"):
+            path = resource_path(candidate)
+            if os.path.exists(path):
+                _app_icon_path = path
+                break
+    return _app_icon_path
+
+def _resolve_data_directory():
     """
-    애플리케이션 데이터 저장 디렉토리 반환
+    애플리케이션 데이터 저장 디렉토리 결정
     appdirs 라이브러리를 사용해 OS에 맞는 표준 경로 제공
     """
     # 환경변수가 설정되어 있으면 그것을 우선 사용
-    env_dir = os.environ.get('SCHOOL_TIMETABLE_DATA_DIR')
+    env_dir = os.environ.get(DATA_DIR_ENV)
     if env_dir and os.path.exists(env_dir):
         logger.debug(f"환경변수에서 데이터 디렉토리 사용: {env_dir}")
         return env_dir
@@ -68,6 +95,66 @@ def get_data_directory():
     
     return data_dir
 
+class ResolvedPaths:
+    """
+    데이터 디렉토리 기준으로 한 번 계산된 파일/디렉토리 경로 모음
+    - 반복 조회 시 파일시스템 호출 없이 속성만 반환
+    - 하위 디렉토리(backups, logs)는 처음 요청될 때 한 번만 생성
+    """
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.time_settings_file = os.path.join(data_dir, "time_settings.json")
+        self.timetable_file = os.path.join(data_dir, "timetable_data.json")
+        self.style_settings_file = os.path.join(data_dir, "style_settings.json")
+        self.widget_settings_file = os.path.join(data_dir, "widget_settings.json")
+        self.notification_settings_file = os.path.join(data_dir, "notification_settings.json")
+        self.settings_store_file = os.path.join(data_dir, "settings_store.json")
+        self._backup_dir = os.path.join(data_dir, "backups")
+        self._log_dir = os.path.join(data_dir, "logs")
+        self._cache_dir = os.path.join(data_dir, "cache")
+        self._created_dirs = set()
+    
+    def _ensure_dir(self, path):
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
+    
+    @property
+    def backup_dir(self):
+        """백업 디렉토리 (최초 접근 시 생성)"""
+        return self._ensure_dir(self._backup_dir)
+    
+    @property
+    def log_dir(self):
+        """로그 디렉토리 (최초 접근 시 생성)"""
+        return self._ensure_dir(self._log_dir)
+    
+    @property
+    def cache_dir(self):
+        """렌더링 캐시 등 재생성 가능한 데이터 디렉토리 (최초 접근 시 생성)"""
+        return self._ensure_dir(self._cache_dir)
+
+# 캐시된 경로 및 계산 당시의 환경 변수 값
+_resolved_paths = None
+_resolved_env_value = None
+
+def get_resolved_paths():
+    """
+    캐시된 ResolvedPaths 반환
+    SCHOOL_TIMETABLE_DATA_DIR 환경 변수가 바뀐 경우에만 다시 계산한다.
+    """
+    global _resolved_paths, _resolved_env_value
+    env_value = os.environ.get(DATA_DIR_ENV)
+    if _resolved_paths is None or env_value != _resolved_env_value:
+        _resolved_paths = ResolvedPaths(_resolve_data_directory())
+        _resolved_env_value = env_value
+    return _resolved_paths
+
+def get_data_directory():
+    """애플리케이션 데이터 저장 디렉토리 반환"""
+    return get_resolved_paths().data_dir
+
 def get_config_directory():
     """애플리케이션 설정 저장 디렉토리 반환"""
     config_dir = appdirs.user_config_dir(APP_NAME, APP_AUTHOR) # 내부 식별용 APP_NAME 사용
@@ -82,9 +169,7 @@ def get_cache_directory():
 
 def get_log_directory():
     """로그 파일 저장 디렉토리 반환"""
-    log_dir = os.path.join(get_data_directory(), "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    return log_dir
+    return get_resolved_paths().log_dir
 
 def ensure_data_directory_exists():
     """데이터 디렉토리가 존재하는지 확인하고 없으면 생성"""
@@ -94,26 +179,28 @@ def ensure_data_directory_exists():
 
 def get_settings_file_path():
     """교시별 시간 설정 파일 경로 반환"""
-    return os.path.join(get_data_directory(), "time_settings.json")
+    return get_resolved_paths().time_settings_file
 
 def get_timetable_file_path():
     """시간표 데이터 파일 경로 반환"""
-    return os.path.join(get_data_directory(), "timetable_data.json")
+    return get_resolved_paths().timetable_file
 
 def get_style_settings_file_path():
     """스타일 설정 파일 경로 반환"""
-    return os.path.join(get_data_directory(), "style_settings.json")
+    return get_resolved_paths().style_settings_file
 
 def get_widget_settings_file_path():
     """위젯 위치 설정 파일 경로 반환"""
-    return os.path.join(get_data_directory(), "widget_settings.json")
+    return get_resolved_paths().widget_settings_file
 
 def get_notification_settings_file_path():
     """알림 설정 파일 경로 반환"""
-    return os.path.join(get_data_directory(), "notification_settings.json")
+    return get_resolved_paths().notification_settings_file
+
+def get_settings_store_file_path():
+    """통합 설정 저장소 파일 경로 반환"""
+    return get_resolved_paths().settings_store_file
 
 def get_backup_directory():
     """백업 파일 저장 디렉토리 반환"""
-    backup_dir = os.path.join(get_data_directory(), "backups")
-    os.makedirs(backup_dir, exist_ok=True)
-    return backup_dir
+    return get_resolved_paths().backup_dir
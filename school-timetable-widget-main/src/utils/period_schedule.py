@@ -0,0 +1,157 @@
+"""
+교시 시간 인덱스 모듈
+- 교시별 시작/종료 시각을 자정 기준 분 단위 정수 배열(array('i'))로 정렬하여 보관하는 불변 일정
+- 현재 교시(period_at), 다음/이전 경계(next_boundary/previous_boundary)를 이진 탐색으로 O(log n) 조회
+- 컴파일 시 겹치는 교시, 시작/종료가 뒤바뀐 교시, 시간 설정이 없는 교시를 검사하여 문제 목록으로 보관
+- 교시 구간은 [시작, 종료) 반열림 구간 (앞 교시 종료 시각에 다음 교시가 시작해도 겹치지 않음)
+"""
+import bisect
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from PyQt5 import QtCore
+
+MINUTES_PER_DAY = 24 * 60
+
+# 경계 종류
+BOUNDARY_START = "start"
+BOUNDARY_END = "end"
+
+# 검사 문제 종류
+ISSUE_OVERLAP = "overlap"    # 앞 교시가 끝나기 전에 시작
+ISSUE_EMPTY = "empty"        # 종료 시각이 시작 시각보다 이르거나 같음
+ISSUE_MISSING = "missing"    # 시간 설정이 없는 교시
+
+
+class Boundary(NamedTuple):
+    """교시 시작 또는 종료 경계"""
+    minute: int
+    period: int
+    kind: str
+
+
+class ScheduleIssue(NamedTuple):
+    """컴파일 시 발견한 시간 설정 문제"""
+    kind: str
+    period: int
+    message: str
+
+
+def minute_of_day(time: QtCore.QTime) -> int:
+    """QTime -> 자정 기준 분 (초 이하는 버림)"""
+    return time.hour() * 60 + time.minute()
+
+
+def format_minute(minute: int) -> str:
+    """자정 기준 분 -> 'HH:mm'"""
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def schedule_signature(time_ranges: Dict[int, Dict[str, QtCore.QTime]],
+                       period_count: int) -> Tuple[Tuple[int, int, int], ...]:
+    """일정을 다시 컴파일해야 하는지 판단하는 값 ((교시, 시작 분, 종료 분) 목록, 시간이 없으면 -1)"""
+    signature = []
+    for period in range(1, period_count + 1):
+        time_range = time_ranges.get(period) or {}
+        start, end = time_range.get("start"), time_range.get("end")
+        if start is None or end is None or not start.isValid() or not end.isValid():
+            signature.append((period, -1, -1))
+        else:
+            signature.append((period, minute_of_day(start), minute_of_day(end)))
+    return tuple(signature)
+
+
+class PeriodSchedule:
+    """정렬된 교시 구간 인덱스 (불변, compile_schedule로 생성)"""
+
+    __slots__ = (
+        "_starts", "_ends", "_periods", "_boundary_minutes", "_boundaries",
+        "_ranges", "signature", "issues"
+    )
+
+    def __init__(self, signature: Tuple[Tuple[int, int, int], ...]):
+        # 시작 분 기준으로 정렬한 유효 교시 구간
+        entries = sorted((start, end, period) for period, start, end in signature if 0 <= start < end)
+        self._starts = array('i', (start for start, _, _ in entries))
+        self._ends = array('i', (end for _, end, _ in entries))
+        self._periods = array('i', (period for _, _, period in entries))
+        self._ranges: Dict[int, Tuple[int, int]] = {period: (start, end) for start, end, period in entries}
+
+        # 모든 경계 (같은 분이면 종료가 시작보다 먼저)
+        boundaries = sorted(
+            [(end, 0, period) for start, end, period in entries]
+            + [(start, 1, period) for start, end, period in entries]
+        )
+        self._boundary_minutes = array('i', (minute for minute, _, _ in boundaries))
+        self._boundaries = tuple(
+            Boundary(minute, period, BOUNDARY_END if order == 0 else BOUNDARY_START)
+            for minute, order, period in boundaries
+        )
+
+        self.signature = signature
+        self.issues: Tuple[ScheduleIssue, ...] = tuple(_validate(signature, entries))
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    @property
+    def periods(self) -> Tuple[int, ...]:
+        """시간이 유효한 교시 (시작 시각 순)"""
+        return tuple(self._periods)
+
+    def range_of(self, period: int) -> Optional[Tuple[int, int]]:
+        """교시의 (시작 분, 종료 분), 없거나 유효하지 않으면 None"""
+        return self._ranges.get(period)
+
+    def period_at(self, minute: int) -> Optional[int]:
+        """해당 시각에 진행 중인 교시 (없으면 None)"""
+        index = bisect.bisect_right(self._starts, minute) - 1
+        if index >= 0 and minute < self._ends[index]:
+            return self._periods[index]
+        return None
+
+    def next_boundary(self, minute: int) -> Optional[Boundary]:
+        """해당 시각 이후(초과) 첫 경계 (오늘 남은 경계가 없으면 None)"""
+        index = bisect.bisect_right(self._boundary_minutes, minute)
+        return self._boundaries[index] if index < len(self._boundaries) else None
+
+    def previous_boundary(self, minute: int) -> Optional[Boundary]:
+        """해당 시각 이전(이하) 마지막 경계 (없으면 None)"""
+        index = bisect.bisect_right(self._boundary_minutes, minute) - 1
+        return self._boundaries[index] if index >= 0 else None
+
+    def next_start(self, minute: int) -> Optional[Boundary]:
+        """해당 시각 이후(초과) 처음 시작하는 교시 경계"""
+        index = bisect.bisect_right(self._starts, minute)
+        if index >= len(self._starts):
+            return None
+        return Boundary(self._starts[index], self._periods[index], BOUNDARY_START)
+
+
+def _validate(signature, entries) -> List[ScheduleIssue]:
+    issues = []
+    for period, start, end in signature:
+        if start < 0:
+            issues.append(ScheduleIssue(ISSUE_MISSING, period, f"{period}교시 시간이 설정되지 않았습니다."))
+        elif end <= start:
+            issues.append(ScheduleIssue(
+                ISSUE_EMPTY, period,
+                f"{period}교시 종료 시각({format_minute(end)})이 시작 시각({format_minute(start)})보다 늦지 않습니다."
+            ))
+    # 시작 순으로 정렬된 구간에서 앞 구간 중 가장 늦게 끝나는 시각보다 먼저 시작하면 겹침
+    latest_end, latest_period = -1, None
+    for start, end, period in entries:
+        if start < latest_end:
+            issues.append(ScheduleIssue(
+                ISSUE_OVERLAP, period,
+                f"{period}교시({format_minute(start)}~{format_minute(end)})가 "
+                f"{latest_period}교시와 겹칩니다."
+            ))
+        if end > latest_end:
+            latest_end, latest_period = end, period
+    return issues
+
+
+def compile_schedule(time_ranges: Dict[int, Dict[str, QtCore.QTime]], period_count: int) -> PeriodSchedule:
+    """교시 시간 설정(SettingsManager.time_ranges)을 정렬된 인덱스로 컴파일"""
+    return PeriodSchedule(schedule_signature(time_ranges, period_count))
@@ -9,10 +9,17 @@ from PyQt5 import QtCore
 from utils.paths import (
     get_timetable_file_path, get_settings_file_path, 
     get_style_settings_file_path, get_widget_settings_file_path,
-    get_backup_directory
+    get_backup_directory, get_settings_store_file_path, get_data_directory,
+    get_resolved_paths
 )
 from utils.config import Config
 from utils.exceptions import DataError, ConfigError
+from utils.startup_profiler import StartupProfiler
+from utils.period_schedule import PeriodSchedule, schedule_signature, minute_of_day
+from utils.settings_store import (
+    SettingsStore, SECTION_STYLE, SECTION_TIME, SECTION_TIMETABLE,
+    SECTION_WIDGET, SECTION_NOTIFICATION
+)
 
 # 로거 설정
 # logger = logging.getLogger(__name__) # 클래스 내부에서 self.logger 사용 예정
@@ -76,6 +83,7 @@ class SettingsManager:
         self.header_font_size = Config.DEFAULT_STYLES.get("header_font_size", Config.DEFAULT_STYLES["font_size"])
         self.cell_font_family = Config.DEFAULT_STYLES.get("cell_font_family", Config.DEFAULT_STYLES["font_family"])
         self.cell_font_size = Config.DEFAULT_STYLES.get("cell_font_size", Config.DEFAULT_STYLES["font_size"])
+        self.cell_text_auto_shrink = Config.DEFAULT_STYLES["cell_text_auto_shrink"]
         
         # 위젯 위치 및 크기 기본값
         self.widget_position = {"x": Config.DEFAULT_WINDOW_POSITION[0], "y": Config.DEFAULT_WINDOW_POSITION[1]}
@@ -84,6 +92,14 @@ class SettingsManager:
         self.widget_screen_info = None  # 멀티모니터 스크린 정보 (기본값)
         self.cell_size_ratio = None  # 셀 크기 비율 (width/height) - None이면 자동 계산
         
+        # 시간표 그리드 크기 (요일 수, 교시 수)
+        self.day_count = len(Config.DAYS_OF_WEEK_KR)
+        self.period_count = Config.NUMBER_OF_CLASSES
+        
+        # 현재 교시 남은 시간 표시 여부 및 갱신 간격 (초)
+        self.show_period_countdown = True
+        self.countdown_interval_seconds = Config.DEFAULT_COUNTDOWN_INTERVAL_SECONDS
+        
         # 기본 시간 설정 (config에서 가져옴)
         self.time_ranges = {}
         for period, time_info in Config.DEFAULT_TIME_RANGES.items():
@@ -94,10 +110,15 @@ class SettingsManager:
                 "start": QtCore.QTime(start_hour, start_min),
                 "end": QtCore.QTime(end_hour, end_min)
             }
+        # 교시 시간 인덱스 (시간 설정이 실제로 바뀔 때만 다시 컴파일, schedule 프로퍼티 참고)
+        self._schedule: Optional[PeriodSchedule] = None
         
-        # 시간표 데이터 초기화
+        # 시간표 데이터 초기화 (요일/교시 정수 인덱스 조회용 표 포함)
         self.timetable_data = {}
-        
+        self._subject_table = self._build_subject_table(self.timetable_data)
+        # (시간표 표, 요일 수, 교시 수, 수업 요일) - class_weekdays 프로퍼티 참고
+        self._class_weekdays_cache = None
+
         # 알림 설정
         self.notification_enabled = True
         self.next_period_warning = True
@@ -106,28 +127,103 @@ class SettingsManager:
         # 부팅시 자동실행 옵션
         self.auto_start_enabled = False
         
+        # 업데이트 확인 주기 및 마지막 확인 시각 (epoch 초)
+        self.update_check_interval_hours = Config.UPDATE_CHECK_INTERVAL_HOURS
+        self.last_update_check = None
+        
+        # 통합 설정 저장소 (사용하지 않으면 None, 파일별 레이아웃 사용)
+        self._store = self._open_settings_store()
+        
         # 설정 불러오기
         self.load_all_settings()
+    
+    @staticmethod
+    def is_settings_store_enabled() -> bool:
+        """통합 설정 저장소 사용 여부 (환경 변수가 Config 기본값보다 우선)"""
+        env_value = os.environ.get(Config.SETTINGS_STORE_ENV)
+        if env_value is not None:
+            return env_value.strip().lower() in ("1", "true", "yes", "on")
+        return Config.USE_SETTINGS_STORE
+    
+    def _open_settings_store(self) -> Optional[SettingsStore]:
+        """통합 설정 저장소 준비 (최초 사용 시 기존 파일별 레이아웃에서 마이그레이션)"""
+        if not self.is_settings_store_enabled():
+            return None
+        
+        store = SettingsStore(get_settings_store_file_path())
+        try:
+            if not store.exists():
+                store.migrate_from_legacy(get_data_directory())
+            return store
+        except Exception as e:
+            self.logger.error(f"통합 설정 저장소 준비 실패, 파일별 설정을 사용합니다: {e}")
+            return None
+    
+    def _load_settings_store(self) -> None:
+        """통합 설정 저장소 파일을 한 번 읽어 모든 섹션 적재"""
+        try:
+            self._store.load()
+        except json.JSONDecodeError as e:
+            # 손상된 저장소는 백업 후 기존 파일별 레이아웃에서 다시 마이그레이션
+            self.logger.error(f"통합 설정 저장소 파일 형식 오류: {e}")
+            self._backup_corrupted_file(self._store.file_path, "settings_store_backup")
+            self._store.sections = {}
+            self._store.migrate_from_legacy(get_data_directory())
+        except FileNotFoundError:
+            # 실행 중 저장소 파일이 삭제된 경우 다시 마이그레이션
+            self._store.sections = {}
+            self._store.migrate_from_legacy(get_data_directory())
+        except ConfigError as e:
+            self.logger.error(f"{e.message} ({e.details}) 파일별 설정을 사용합니다.")
+            self._store = None
+    
+    def read_settings_section(self, section: str, file_path: str) -> Optional[Any]:
+        """설정 섹션 읽기 (통합 저장소 또는 기존 개별 파일)
+        
+        Args:
+            section: 통합 저장소의 섹션 이름
+            file_path: 기존 레이아웃의 개별 파일 경로
+            
+        Returns:
+            설정 데이터 또는 None (저장된 설정 없음)
+        """
+        if self._store is not None:
+            return self._store.get_section(section)
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def write_settings_section(self, section: str, file_path: str, data: Any) -> None:
+        """설정 섹션 저장 (통합 저장소 또는 기존 개별 파일)"""
+        if self._store is not None:
+            self._store.set_section(section, data)
+            return
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
         
     def load_all_settings(self) -> None:
         """모든 설정 불러오기"""
-        self.load_style_settings()
-        self.load_time_settings()
-        self.load_timetable_data()
-        self.load_widget_settings()
+        with StartupProfiler.get_instance().phase("load_all_settings"):
+            if self._store is not None:
+                self._load_settings_store()
+            self.load_style_settings()
+            self.load_time_settings()
+            self.load_timetable_data()
+            self.load_widget_settings()
+            self._fill_missing_time_ranges()
+            self.rebuild_schedule()
     
     # Style Settings
     def load_style_settings(self):
         """저장된 스타일 설정 불러오기"""
         file_path = get_style_settings_file_path()
-        
-        if not os.path.exists(file_path):
-            self.logger.warning(f"스타일 설정 파일이 존재하지 않습니다: {file_path}")
-            return
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                style_settings = json.load(f)
+            style_settings = self.read_settings_section(SECTION_STYLE, file_path)
+            if style_settings is None:
+                self.logger.warning(f"스타일 설정 파일이 존재하지 않습니다: {file_path}")
+                return
             
             # 저장된 설정 적용
             self.header_bg_color = style_settings.get("header_bg_color", self.header_bg_color)
@@ -150,6 +246,7 @@ class SettingsManager:
             self.header_font_size = style_settings.get("header_font_size", self.font_size)
             self.cell_font_family = style_settings.get("cell_font_family", self.font_family)
             self.cell_font_size = style_settings.get("cell_font_size", self.font_size)
+            self.cell_text_auto_shrink = style_settings.get("cell_text_auto_shrink", self.cell_text_auto_shrink)
             
             # 테마 설정 로드
             self.theme = style_settings.get("theme", self.theme)
@@ -163,33 +260,37 @@ class SettingsManager:
         except Exception as e:
             self.logger.error(f"스타일 설정 로드 실패: {e}")
             # 오류가 발생해도 기본 스타일은 유지
+    def get_style_settings(self):
+        """현재 스타일 설정을 저장 형식의 딕셔너리로 반환"""
+        return {
+            "header_bg_color": self.header_bg_color,
+            "header_text_color": self.header_text_color,
+            "cell_bg_color": self.cell_bg_color,
+            "cell_text_color": self.cell_text_color,
+            "current_period_color": self.current_period_color,
+            "border_color": self.border_color,
+            "header_opacity": self.header_opacity,
+            "cell_opacity": self.cell_opacity,
+            "current_period_opacity": self.current_period_opacity,
+            "border_opacity": self.border_opacity,
+            "font_family": self.font_family,
+            "font_size": self.font_size,
+            # 헤더 및 셀 폰트 설정 추가
+            "header_font_family": self.header_font_family,
+            "header_font_size": self.header_font_size,
+            "cell_font_family": self.cell_font_family,
+            "cell_font_size": self.cell_font_size,
+            "cell_text_auto_shrink": self.cell_text_auto_shrink,
+            "theme": self.theme
+        }
+    
     def save_style_settings(self):
         """스타일 설정 저장"""
         try:
-            style_settings = {
-                "header_bg_color": self.header_bg_color,
-                "header_text_color": self.header_text_color,
-                "cell_bg_color": self.cell_bg_color,
-                "cell_text_color": self.cell_text_color,
-                "current_period_color": self.current_period_color,
-                "border_color": self.border_color,
-                "header_opacity": self.header_opacity,
-                "cell_opacity": self.cell_opacity,
-                "current_period_opacity": self.current_period_opacity,
-                "border_opacity": self.border_opacity,
-                "font_family": self.font_family,
-                "font_size": self.font_size,
-                # 헤더 및 셀 폰트 설정 추가
-                "header_font_family": self.header_font_family,
-                "header_font_size": self.header_font_size,
-                "cell_font_family": self.cell_font_family,
-                "cell_font_size": self.cell_font_size,
-                "theme": self.theme
-            }
+            style_settings = self.get_style_settings()
             
             file_path = get_style_settings_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(style_settings, f, ensure_ascii=False, indent=2)
+            self.write_settings_section(SECTION_STYLE, file_path, style_settings)
             self.logger.info("스타일 설정을 성공적으로 저장했습니다.")
         except Exception as e:
             self.logger.error(f"스타일 설정 저장 오류: {e}")
@@ -235,10 +336,8 @@ class SettingsManager:
         """저장된 시간 설정 불러오기"""
         try:
             file_path = get_settings_file_path()
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    time_settings = json.load(f)
-                
+            time_settings = self.read_settings_section(SECTION_TIME, file_path)
+            if time_settings is not None:
                 # 저장된 설정 적용
                 for period, time_range in time_settings.items():
                     period = int(period)  # JSON에서는 키가 문자열로 저장됨
@@ -266,29 +365,51 @@ class SettingsManager:
                 }
             
             file_path = get_settings_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(time_settings, f, ensure_ascii=False, indent=2)
+            self.write_settings_section(SECTION_TIME, file_path, time_settings)
         except Exception as e:
             self.logger.error(f"시간 설정 저장 오류: {e}")
+        # 시간이 바뀐 경우에만 교시 인덱스 다시 컴파일
+        self.rebuild_schedule()
+    
+    @property
+    def schedule(self) -> PeriodSchedule:
+        """현재 교시 시간 설정을 컴파일한 정렬 인덱스"""
+        if self._schedule is None:
+            self.rebuild_schedule()
+        return self._schedule
+    
+    def rebuild_schedule(self) -> bool:
+        """time_ranges/period_count가 바뀌었으면 교시 인덱스 다시 컴파일
+        
+        Returns:
+            다시 컴파일했는지 여부
+        """
+        signature = schedule_signature(self.time_ranges, self.period_count)
+        if self._schedule is not None and self._schedule.signature == signature:
+            return False
+        self._schedule = PeriodSchedule(signature)
+        for issue in self._schedule.issues:
+            self.logger.warning(f"교시 시간 설정 문제: {issue.message}")
+        return True
     
     # Timetable Data
     def load_timetable_data(self):
         """저장된 시간표 데이터 불러오기"""
         try:
             file_path = get_timetable_file_path()
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.timetable_data = json.load(f)
+            timetable_data = self.read_settings_section(SECTION_TIMETABLE, file_path)
+            if timetable_data is not None:
+                self.timetable_data = timetable_data
         except Exception as e:
             self.logger.error(f"시간표 데이터 로드 오류: {e}")
             self.timetable_data = {}
+        self._subject_table = self._build_subject_table(self.timetable_data)
     
     def save_timetable_data(self):
         """시간표 데이터 저장"""
         try:
             file_path = get_timetable_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.timetable_data, f, ensure_ascii=False, indent=2)
+            self.write_settings_section(SECTION_TIMETABLE, file_path, self.timetable_data)
         except Exception as e:
             self.logger.error(f"시간표 데이터 저장 오류: {e}")
     
@@ -297,14 +418,25 @@ class SettingsManager:
         """저장된 위젯 관련 설정 불러오기 (위치, 크기, 자동 시작 등)"""
         try:
             file_path = get_widget_settings_file_path() # utils.paths 사용
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    widget_settings = json.load(f)
+            widget_settings = self.read_settings_section(SECTION_WIDGET, file_path)
+            if widget_settings is not None:
                 self.widget_position = widget_settings.get("position", self.widget_position)
                 self.widget_size = widget_settings.get("size", self.widget_size)
                 self.is_position_locked = widget_settings.get("is_position_locked", False)
                 self.widget_screen_info = widget_settings.get("screen_info", None)
                 self.auto_start_enabled = widget_settings.get("auto_start_enabled", False) # 자동 시작 설정 로드
+                self.update_check_interval_hours = widget_settings.get(
+                    "update_check_interval_hours", self.update_check_interval_hours
+                )
+                self.last_update_check = widget_settings.get("last_update_check", None)
+                self.day_count, self.period_count = self._clamp_grid_dimensions(
+                    widget_settings.get("day_count", self.day_count),
+                    widget_settings.get("period_count", self.period_count)
+                )
+                self.show_period_countdown = widget_settings.get("show_period_countdown", self.show_period_countdown)
+                self.countdown_interval_seconds = self._clamp_countdown_interval(
+                    widget_settings.get("countdown_interval_seconds", self.countdown_interval_seconds)
+                )
             else:
                 # 파일이 없으면 기본값 사용 (초기화 시 설정된 값)
                 self.widget_screen_info = None
@@ -326,11 +458,16 @@ class SettingsManager:
                 "size": self.widget_size,
                 "is_position_locked": self.is_position_locked,
                 "screen_info": self.widget_screen_info,
-                "auto_start_enabled": getattr(self, 'auto_start_enabled', False)  # 자동 시작 설정 저장
+                "auto_start_enabled": getattr(self, 'auto_start_enabled', False),  # 자동 시작 설정 저장
+                "update_check_interval_hours": self.update_check_interval_hours,
+                "last_update_check": self.last_update_check,
+                "day_count": self.day_count,
+                "period_count": self.period_count,
+                "show_period_countdown": self.show_period_countdown,
+                "countdown_interval_seconds": self.countdown_interval_seconds
             }
             file_path = get_widget_settings_file_path() # utils.paths 사용
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(widget_settings, f, ensure_ascii=False, indent=2)
+            self.write_settings_section(SECTION_WIDGET, file_path, widget_settings)
             self.logger.info("위젯 설정을 성공적으로 저장했습니다.")
         except Exception as e:
             self.logger.error(f"위젯 설정 저장 오류: {e}")
@@ -365,6 +502,11 @@ class SettingsManager:
         self.logger.info(f"자동 시작 설정 변경: {enabled}")
         self.save_widget_settings() # 변경된 내용을 포함하여 모든 위젯 설정 저장
     
+    def mark_update_checked(self, timestamp: Optional[float] = None) -> None:
+        """업데이트 확인 시각을 기록하고 위젯 설정에 저장합니다."""
+        self.last_update_check = timestamp if timestamp is not None else datetime.datetime.now().timestamp()
+        self.save_widget_settings()
+    
     def toggle_position_lock(self):
         """위치 고정 상태 토글"""
         self.is_position_locked = not self.is_position_locked
@@ -384,9 +526,136 @@ class SettingsManager:
             업데이트된 시간표 데이터
         """
         self.timetable_data = updated_data
+        self._subject_table = self._build_subject_table(self.timetable_data)
         self.save_timetable_data()
         return self.timetable_data
     
+    def update_timetable_cells(self, cells: Dict[Tuple[int, int], str]) -> None:
+        """(요일 인덱스, 교시) -> 과목 값으로 시간표 일부 갱신 후 저장
+        
+        표시하지 않는 요일/교시(예: 토요일 수업을 끈 경우)의 기존 데이터는 그대로 유지한다.
+        
+        Args:
+            cells: (요일 인덱스, 교시) -> 과목 (둘 다 1부터 시작)
+        """
+        for (day_idx, period), subject in cells.items():
+            day_name = Config.ALL_DAYS_OF_WEEK_KR[day_idx - 1]
+            self.timetable_data.setdefault(day_name, {})[str(period)] = subject
+        self.update_timetable_data(self.timetable_data)
+    
+    @staticmethod
+    def _build_subject_table(timetable_data: Dict[str, Dict[str, str]]) -> Tuple[Tuple[str, ...], ...]:
+        """저장 형식(요일 이름 -> 교시 문자열 -> 과목)을 [요일 인덱스][교시] 표로 변환 (인덱스 0은 비어 있음)"""
+        table = [("",) * (Config.MAX_NUMBER_OF_CLASSES + 1)]
+        for day_name in Config.ALL_DAYS_OF_WEEK_KR:
+            day_data = timetable_data.get(day_name) or {}
+            table.append(("",) + tuple(
+                day_data.get(str(period), "") or ""
+                for period in range(1, Config.MAX_NUMBER_OF_CLASSES + 1)
+            ))
+        return tuple(table)
+    
+    def get_subject(self, day_idx: int, period: int) -> str:
+        """요일 인덱스(1=월요일)와 교시(1부터)에 해당하는 과목 반환 (범위 밖이면 빈 문자열)"""
+        if 0 < day_idx < len(self._subject_table) and 0 < period <= Config.MAX_NUMBER_OF_CLASSES:
+            return self._subject_table[day_idx][period]
+        return ""
+    
+    # 시간표 그리드 크기
+    @property
+    def day_labels(self) -> list:
+        """그리드에 표시할 요일 이름 목록"""
+        return list(Config.ALL_DAYS_OF_WEEK_KR[:self.day_count])
+    
+    @staticmethod
+    def _clamp_grid_dimensions(day_count: int, period_count: int) -> Tuple[int, int]:
+        """요일 수(월~금 또는 월~토)와 교시 수를 허용 범위로 제한"""
+        day_count = min(max(int(day_count), len(Config.DAYS_OF_WEEK_KR)), len(Config.ALL_DAYS_OF_WEEK_KR))
+        period_count = min(max(int(period_count), Config.MIN_NUMBER_OF_CLASSES), Config.MAX_NUMBER_OF_CLASSES)
+        return day_count, period_count
+    
+    @staticmethod
+    def _clamp_countdown_interval(seconds: int) -> int:
+        """남은 시간 갱신 간격을 허용 범위로 제한"""
+        return min(max(int(seconds), Config.MIN_COUNTDOWN_INTERVAL_SECONDS), Config.MAX_COUNTDOWN_INTERVAL_SECONDS)
+    
+    def set_countdown_settings(self, enabled: bool, interval_seconds: int) -> bool:
+        """현재 교시 남은 시간 표시 설정 변경 및 저장
+        
+        Returns:
+            값이 바뀌었는지 여부
+        """
+        values = (bool(enabled), self._clamp_countdown_interval(interval_seconds))
+        if values == (self.show_period_countdown, self.countdown_interval_seconds):
+            return False
+        self.show_period_countdown, self.countdown_interval_seconds = values
+        self.save_widget_settings()
+        return True
+    
+    def set_grid_dimensions(self, day_count: int, period_count: int) -> bool:
+        """시간표 그리드 크기 변경 및 저장
+        
+        Returns:
+            값이 실제로 바뀌었는지 여부
+        """
+        dimensions = self._clamp_grid_dimensions(day_count, period_count)
+        if dimensions == (self.day_count, self.period_count):
+            return False
+        self.day_count, self.period_count = dimensions
+        if self._fill_missing_time_ranges():
+            self.save_time_settings()
+        else:
+            self.rebuild_schedule()
+        self.save_widget_settings()
+        self.logger.info(f"시간표 그리드 크기 변경: {self.day_count}일 x {self.period_count}교시")
+        return True
+    
+    def day_index_for_weekday(self, weekday: int) -> Optional[int]:
+        """datetime.weekday() 값(0=월요일)을 요일 인덱스(1부터)로 변환 (표시하지 않는 요일이면 None)"""
+        return weekday + 1 if 0 <= weekday < self.day_count else None
+
+    @property
+    def class_weekdays(self) -> Tuple[int, ...]:
+        """수업이 있는 요일 (datetime.weekday() 값, 표시하는 요일/교시 중 과목이 하나라도 있는 요일)
+
+        시간표가 완전히 비어 있으면(처음 실행 등) 표시하는 모든 요일을 수업 요일로 본다.
+        시간표 표나 그리드 크기가 바뀔 때만 다시 계산한다.
+        """
+        key = (self._subject_table, self.day_count, self.period_count)
+        cached = self._class_weekdays_cache
+        if cached is not None and cached[0] is key[0] and cached[1:3] == key[1:]:
+            return cached[3]
+        weekdays = tuple(
+            weekday for weekday in range(self.day_count)
+            if any(self._subject_table[weekday + 1][1:self.period_count + 1])
+        ) or tuple(range(self.day_count))
+        self._class_weekdays_cache = key + (weekdays,)
+        return weekdays
+
+    def _fill_missing_time_ranges(self) -> bool:
+        """표시할 교시 중 시간 설정이 없는 교시에 기본 시간 지정
+        
+        기본 시간표(Config.DEFAULT_TIME_RANGES)에 없는 교시는 앞 교시 종료 후 쉬는 시간 뒤에 이어서 배치한다.
+        
+        Returns:
+            새로 지정한 교시가 있는지 여부
+        """
+        filled = False
+        for period in range(1, self.period_count + 1):
+            if period in self.time_ranges:
+                continue
+            default = Config.DEFAULT_TIME_RANGES.get(period)
+            if default is not None:
+                start = QtCore.QTime.fromString(default["start"], "HH:mm")
+                end = QtCore.QTime.fromString(default["end"], "HH:mm")
+            else:
+                previous = self.time_ranges.get(period - 1, {}).get("end", QtCore.QTime(9, 0))
+                start = previous.addSecs(Config.DEFAULT_BREAK_MINUTES * 60)
+                end = start.addSecs(Config.DEFAULT_PERIOD_MINUTES * 60)
+            self.time_ranges[period] = {"start": start, "end": end}
+            filled = True
+        return filled
+    
     def get_current_period(self, current_time: QtCore.QTime) -> Optional[int]:
         """현재 시간에 해당하는 교시 반환
         
@@ -394,14 +663,9 @@ class SettingsManager:
             current_time: 현재 시간 (QTime 객체)
             
         Returns:
-            교시 번호 (1-7) 또는 None
+            교시 번호 (1-period_count) 또는 None
         """
-        for period, time_range in self.time_ranges.items():
-            start_time = time_range["start"]
-            end_time = time_range["end"]
-            if start_time <= current_time <= end_time:
-                return period
-        return None
+        return self.schedule.period_at(minute_of_day(current_time))
 
     def _backup_corrupted_file(self, file_path, backup_prefix="corrupted_backup"):
         """손상된 설정 파일을 백업합니다."""
@@ -428,14 +692,8 @@ class SettingsManager:
             (성공 여부, 백업 경로 또는 오류 메시지)
         """
         try:
-            # 데이터 디렉토리 확인
-            from utils.paths import ensure_data_directory_exists, get_data_directory
-            data_dir = ensure_data_directory_exists()
-            
-            # 백업 디렉토리 생성
-            backup_dir = os.path.join(data_dir, "backups")
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
+            # 백업 디렉토리 (캐시된 경로, 최초 접근 시 생성)
+            backup_dir = get_resolved_paths().backup_dir
             
             # 현재 시간 가져오기 (백업 설명에 사용)
             now = datetime.datetime.now()
@@ -458,10 +716,14 @@ class SettingsManager:
                 ("notification_settings.json", get_notification_settings_file_path()),  # 수정된 함수 사용
             ]
             
-            # 파일 복사
-            for backup_filename, source_path in files_to_backup:
-                if os.path.exists(source_path):
-                    shutil.copy2(source_path, os.path.join(backup_path, backup_filename))
+            if self._store is not None:
+                # 통합 저장소 사용 시 기존 파일별 레이아웃으로 내보내 백업 호환성 유지
+                self._store.export_legacy(backup_path)
+            else:
+                # 파일 복사
+                for backup_filename, source_path in files_to_backup:
+                    if os.path.exists(source_path):
+                        shutil.copy2(source_path, os.path.join(backup_path, backup_filename))
             
             # 백업 설명 파일 생성
             description = f"시간표 백업 - {now.strftime('%Y년 %m월 %d일 %H:%M:%S')}"
@@ -485,8 +747,7 @@ class SettingsManager:
         """
         try:
             # 데이터 디렉토리
-            from utils.paths import get_data_directory
-            backup_path = os.path.join(get_data_directory(), "backups", backup_name)
+            backup_path = os.path.join(get_resolved_paths().backup_dir, backup_name)
             
             if not os.path.exists(backup_path):
                 return False, f"백업을 찾을 수 없습니다: {backup_name}"
@@ -500,16 +761,21 @@ class SettingsManager:
                 ("notification_settings.json", get_notification_settings_file_path()),
             ]
             
-            # 파일 복사
-            for backup_filename, target_path in files_to_restore:
-                source_path = os.path.join(backup_path, backup_filename)
-                if os.path.exists(source_path):
-                    # 대상 파일 경로의 디렉토리 확인
-                    target_dir = os.path.dirname(target_path)
-                    if not os.path.exists(target_dir):
-                        os.makedirs(target_dir)
-                    # 파일 복원
-                    shutil.copy2(source_path, target_path)
+            if self._store is not None:
+                # 통합 저장소 사용 시 백업(파일별 레이아웃)의 섹션을 저장소로 가져옴
+                self._store.import_legacy(backup_path)
+                self._store.save()
+            else:
+                # 파일 복사
+                for backup_filename, target_path in files_to_restore:
+                    source_path = os.path.join(backup_path, backup_filename)
+                    if os.path.exists(source_path):
+                        # 대상 파일 경로의 디렉토리 확인
+                        target_dir = os.path.dirname(target_path)
+                        if not os.path.exists(target_dir):
+                            os.makedirs(target_dir)
+                        # 파일 복원
+                        shutil.copy2(source_path, target_path)
             
             # 설정 다시 로드
             self.load_all_settings()
@@ -527,11 +793,7 @@ class SettingsManager:
             백업 정보 딕셔너리 리스트
         """
         try:
-            from utils.paths import get_data_directory
-            backup_dir = os.path.join(get_data_directory(), "backups")
-            
-            if not os.path.exists(backup_dir):
-                return []
+            backup_dir = get_resolved_paths().backup_dir
             
             # 디렉토리만 찾기
             backups = []
@@ -585,9 +847,7 @@ class SettingsManager:
             (성공 여부, 성공 메시지 또는 오류 메시지)
         """
         try:
-            from utils.paths import get_data_directory
-            backup_dir = os.path.join(get_data_directory(), "backups")
-            backup_path = os.path.join(backup_dir, backup_name)
+            backup_path = os.path.join(get_resolved_paths().backup_dir, backup_name)
             
             if not os.path.exists(backup_path):
                 return False, f"백업을 찾을 수 없습니다: {backup_name}"
@@ -626,12 +886,7 @@ class SettingsManager:
             if not zipfile.is_zipfile(file_path):
                 return False, "유효한 ZIP 파일이 아닙니다."
             
-            from utils.paths import get_data_directory, ensure_data_directory_exists
-            data_dir = ensure_data_directory_exists()
-            backup_dir = os.path.join(data_dir, "backups")
-            
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
+            backup_dir = get_resolved_paths().backup_dir
             
             # 백업 이름 설정
             if not backup_name:
@@ -0,0 +1,148 @@
+"""
+통합 설정 저장소 모듈
+- 스타일/시간/시간표/위젯/알림 설정을 하나의 JSON 파일에 섹션별로 저장
+- 버전 헤더 포함, 임시 파일 + os.replace로 원자적 저장
+- 기존 파일별 레이아웃(legacy)에서 자동 마이그레이션 및 백업용 내보내기 지원
+"""
+import copy
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from utils.exceptions import ConfigError
+
+logger = logging.getLogger(__name__)
+
+# 저장소 파일 형식 버전 (형식이 호환되지 않게 바뀔 때만 증가)
+SETTINGS_STORE_VERSION = 1
+
+# 섹션 이름
+SECTION_STYLE = "style"
+SECTION_TIME = "time"
+SECTION_TIMETABLE = "timetable"
+SECTION_WIDGET = "widget"
+SECTION_NOTIFICATION = "notification"
+
+# 섹션 이름 -> 기존 파일별 레이아웃의 파일 이름
+LEGACY_SECTION_FILES = {
+    SECTION_STYLE: "style_settings.json",
+    SECTION_TIME: "time_settings.json",
+    SECTION_TIMETABLE: "timetable_data.json",
+    SECTION_WIDGET: "widget_settings.json",
+    SECTION_NOTIFICATION: "notification_settings.json",
+}
+
+
+def atomic_write_json(file_path: str, data: Any) -> None:
+    """JSON 데이터를 같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 교체"""
+    directory = os.path.dirname(file_path) or "."
+    fd, temp_path = tempfile.mkstemp(
+        prefix=os.path.basename(file_path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class SettingsStore:
+    """단일 파일 설정 저장소 클래스"""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.sections: Dict[str, Any] = {}
+
+    def exists(self) -> bool:
+        """저장소 파일 존재 여부"""
+        return os.path.exists(self.file_path)
+
+    def load(self) -> None:
+        """저장소 파일을 한 번 읽어 모든 섹션을 메모리에 적재
+
+        Raises:
+            json.JSONDecodeError: 파일이 손상된 경우
+            ConfigError: 지원하지 않는 형식 버전인 경우
+        """
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        version = data.get("version") if isinstance(data, dict) else None
+        if not isinstance(version, int) or version > SETTINGS_STORE_VERSION:
+            raise ConfigError(
+                "지원하지 않는 설정 저장소 형식입니다.",
+                f"version={version}, 지원 버전={SETTINGS_STORE_VERSION}"
+            )
+        self.sections = data.get("sections", {})
+
+    def save(self) -> None:
+        """모든 섹션을 버전 헤더와 함께 원자적으로 저장"""
+        atomic_write_json(self.file_path, {
+            "version": SETTINGS_STORE_VERSION,
+            "sections": self.sections,
+        })
+
+    def get_section(self, name: str) -> Optional[Any]:
+        """섹션 데이터 사본 반환 (없으면 None)"""
+        if name not in self.sections:
+            return None
+        return copy.deepcopy(self.sections[name])
+
+    def set_section(self, name: str, data: Any, save: bool = True) -> None:
+        """섹션 데이터 교체 후 저장"""
+        self.sections[name] = copy.deepcopy(data)
+        if save:
+            self.save()
+
+    def import_legacy(self, source_dir: str) -> int:
+        """기존 파일별 레이아웃에서 섹션을 읽어 옴 (저장은 하지 않음)
+
+        Returns:
+            읽어 온 섹션 수
+        """
+        imported = 0
+        for section, file_name in LEGACY_SECTION_FILES.items():
+            legacy_path = os.path.join(source_dir, file_name)
+            if not os.path.exists(legacy_path):
+                continue
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    self.sections[section] = json.load(f)
+                imported += 1
+            except Exception as e:
+                logger.error(f"기존 설정 파일 읽기 실패 ('{legacy_path}'): {e}")
+        return imported
+
+    def migrate_from_legacy(self, source_dir: str) -> int:
+        """기존 파일별 레이아웃을 통합 저장소로 마이그레이션하고 저장
+
+        Returns:
+            마이그레이션된 섹션 수
+        """
+        imported = self.import_legacy(source_dir)
+        self.save()
+        logger.info(f"기존 설정 파일 {imported}개를 통합 설정 저장소로 마이그레이션했습니다: {self.file_path}")
+        return imported
+
+    def export_legacy(self, target_dir: str) -> int:
+        """모든 섹션을 기존 파일별 레이아웃으로 내보내기 (백업 호환용)
+
+        Returns:
+            내보낸 섹션 수
+        """
+        exported = 0
+        for section, file_name in LEGACY_SECTION_FILES.items():
+            if section not in self.sections:
+                continue
+            atomic_write_json(os.path.join(target_dir, file_name), self.sections[section])
+            exported += 1
+        return exported
@@ -0,0 +1,120 @@
+"""
+시작 단계 시간 측정 모듈
+- time.perf_counter_ns 기반으로 시작 과정의 각 단계(phase) 소요 시간 측정
+- 실행 1회당 JSON 레코드 1줄을 로그 디렉토리의 startup_timing.jsonl에 기록
+- SCHOOL_TIMETABLE_STARTUP_TIMING=1 환경 변수 설정 시 측정 결과를 표준 오류로 출력
+"""
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import datetime
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 측정 기준 시각 (이 모듈이 처음 임포트된 시점, main.py에서 가장 먼저 임포트)
+_ORIGIN_NS = time.perf_counter_ns()
+
+STARTUP_TIMING_FILE_NAME = "startup_timing.jsonl"
+STARTUP_TIMING_ENV = "SCHOOL_TIMETABLE_STARTUP_TIMING"
+
+# 모든 단계가 기록되면 레코드를 자동으로 기록
+EXPECTED_PHASES = (
+    "setup_environment",
+    "load_all_settings",
+    "init_ui",
+    "run",
+    "first_adjust_cell_sizes",
+    "first_paint",
+)
+
+
+def _ns_to_ms(ns: int) -> float:
+    return round(ns / 1_000_000, 3)
+
+
+class StartupProfiler:
+    """시작 단계 시간 측정 클래스"""
+
+    # 싱글톤 인스턴스
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = StartupProfiler()
+        return cls._instance
+
+    def __init__(self, origin_ns: Optional[int] = None):
+        self.origin_ns = origin_ns if origin_ns is not None else _ORIGIN_NS
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.finished = False
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """단계 소요 시간 기록 (같은 이름은 처음 한 번만 기록)"""
+        if self.finished or name in self.phases:
+            return
+        self.phases[name] = {
+            "start_ms": _ns_to_ms(start_ns - self.origin_ns),
+            "duration_ms": _ns_to_ms(end_ns - start_ns),
+        }
+        if all(phase in self.phases for phase in EXPECTED_PHASES):
+            self.finish()
+
+    def mark(self, name: str) -> None:
+        """시작 기준 시각부터 현재까지를 하나의 시점으로 기록 (duration 0)"""
+        now = time.perf_counter_ns()
+        self.record(name, now, now)
+
+    def is_recorded(self, name: str) -> bool:
+        """해당 단계가 이미 기록되었는지 여부"""
+        return name in self.phases
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록의 소요 시간을 단계로 기록"""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start_ns, time.perf_counter_ns())
+
+    def build_record(self) -> Dict:
+        """현재까지의 측정 결과로 JSON 레코드 생성"""
+        try:
+            from PyQt5.QtCore import QT_VERSION_STR
+        except ImportError:
+            QT_VERSION_STR = None
+        return {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "version": os.environ.get("SCHOOL_TIMETABLE_VERSION"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "total_ms": _ns_to_ms(time.perf_counter_ns() - self.origin_ns),
+            "phases": self.phases,
+        }
+
+    def finish(self) -> None:
+        """측정을 종료하고 레코드를 기록 (한 번만 수행)"""
+        if self.finished:
+            return
+        self.finished = True
+        record = self.build_record()
+        line = json.dumps(record, ensure_ascii=False)
+
+        if os.environ.get(STARTUP_TIMING_ENV):
+            print(f"[startup-timing] {line}", file=sys.stderr)
+
+        try:
+            from utils.paths import get_log_directory
+            file_path = os.path.join(get_log_directory(), STARTUP_TIMING_FILE_NAME)
+            with open(file_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        except Exception as e:
+            logger.warning(f"시작 시간 측정 결과 기록 실패: {e}")
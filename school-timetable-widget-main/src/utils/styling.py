@@ -1,13 +1,45 @@
 """
 테마/스타일 관리 가이드라인
 - 테마 정의 및 기본값: utils/config.py (THEMES, DEFAULT_STYLES)
-- 스타일 생성 함수: utils/styling.py (generate_header_style 등)
+- 스타일 생성 함수: utils/styling.py (역할(ROLE_*)별 CellStyle을 만드는 generate_grid_styles,
+  설정 값 조합별 캐시 get_compiled_grid_styles)
 - 테마/스타일 관련 코드는 반드시 위 두 파일만 수정
 - 테마 프리셋 추가 시 config.py의 THEMES, styling.py의 get_theme_presets()만 수정
 - settings_manager.py 등에서는 import config, import styling만 사용
 """
 
-from PyQt5.QtGui import QColor
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont
+
+# 직접 그리는 시간표 그리드(gui/timetable_grid.py)의 공통 치수 (기존 스타일시트와 동일)
+GRID_BORDER_RADIUS = 4
+GRID_PADDING = 2
+
+# 그리드 항목 역할
+ROLE_HEADER = "header"
+ROLE_CELL = "cell"
+ROLE_CURRENT = "current"
+ROLE_DRAG = "drag"
+
+# 마우스 호버 시 배경/테두리에 더할 불투명도 (0-255, 0이면 호버 강조 없음)
+HOVER_ADDITIONAL_OPACITY = 50
+
+def hover_role(role):
+    """역할의 호버 변형 이름 (컴파일된 스타일에 함께 들어 있음)"""
+    return f"{role}:hover"
+
+
+class CellStyle(NamedTuple):
+    """그리드 항목 하나를 그리는 데 필요한 스타일 (스타일시트 대신 직접 그리기용)"""
+    background: QColor
+    text_color: QColor
+    font: QFont
+    border_color: Optional[QColor] = None
+    border_width: int = 0
+    border_style: int = Qt.SolidLine
 
 def hex_to_rgba(hex_color, opacity):
     """HEX 색상 코드와 불투명도를 RGBA 형식으로 변환
@@ -22,96 +54,124 @@ def hex_to_rgba(hex_color, opacity):
     color = QColor(hex_color)
     return f"rgba({color.red()}, {color.green()}, {color.blue()}, {opacity / 255})"
 
-def generate_header_style(bg_color, text_color, font_family, font_size):
-    """헤더 스타일 생성
-    
-    Args:
-        bg_color: 배경색 (rgba 형식)
-        text_color: 텍스트 색상 (HEX 형식)
-        font_family: 폰트 패밀리
-        font_size: 폰트 크기
-    
-    Returns:
-        스타일시트 문자열
-    """
-    return f"""
-        background-color: {bg_color}; 
-        color: {text_color}; 
-        border-radius: 4px;
-        font-family: '{font_family}';
-        font-size: {font_size}pt;
-        padding: 2px;
-    """
+def hex_to_qcolor(hex_color, opacity=255):
+    """HEX 색상 코드와 불투명도(0-255)를 QColor로 변환"""
+    color = QColor(hex_color)
+    color.setAlpha(int(opacity))
+    return color
+
+def _make_font(font_family, font_size, bold=False):
+    font = QFont(font_family)
+    font.setPointSizeF(float(font_size))
+    font.setBold(bold)
+    return font
 
-def generate_cell_style(bg_color, text_color, border_color, font_family, font_size):
-    """셀 스타일 생성
+def _with_hover_opacity(color, additional_opacity=HOVER_ADDITIONAL_OPACITY):
+    """알파 값에 additional_opacity를 더한 색상 사본 (0-255 범위, 255에서 포화)"""
+    if color is None:
+        return None
+    hover = QColor(color)
+    hover.setAlpha(min(color.alpha() + additional_opacity, 255))
+    return hover
+
+def generate_hover_variant(style):
+    """스타일의 호버 변형 (배경/테두리 불투명도 증가)"""
+    return style._replace(
+        background=_with_hover_opacity(style.background),
+        border_color=_with_hover_opacity(style.border_color),
+    )
+
+def generate_grid_styles(settings):
+    """시간표 그리드 역할별 스타일 생성 (헤더, 셀, 현재 교시, 드래그 중 요일 헤더와 각 호버 변형)
     
     Args:
-        bg_color: 배경색 (rgba 형식)
-        text_color: 텍스트 색상 (HEX 형식)
-        border_color: 테두리 색상 (rgba 형식)
-        font_family: 폰트 패밀리
-        font_size: 폰트 크기
+        settings: 스타일 속성(header_bg_color 등)을 가진 객체 (SettingsManager)
     
     Returns:
-        스타일시트 문자열
-    """
-    return f"""
-        background-color: {bg_color}; 
-        color: {text_color}; 
-        border: 1px solid {border_color};
-        border-radius: 4px;
-        font-family: '{font_family}';
-        font-size: {font_size}pt;
-        padding: 2px;
+        역할(ROLE_*) 및 호버 변형(hover_role(ROLE_*)) -> CellStyle 딕셔너리
     """
+    header_bg = hex_to_qcolor(settings.header_bg_color, settings.header_opacity)
+    header_text = QColor(settings.header_text_color)
+    cell_text = QColor(settings.cell_text_color)
+    border = hex_to_qcolor(settings.border_color, settings.border_opacity)
+    styles = {
+        ROLE_HEADER: CellStyle(
+            header_bg, header_text,
+            _make_font(settings.header_font_family, settings.header_font_size)
+        ),
+        ROLE_CELL: CellStyle(
+            hex_to_qcolor(settings.cell_bg_color, settings.cell_opacity), cell_text,
+            _make_font(settings.cell_font_family, settings.cell_font_size),
+            border, 1
+        ),
+        ROLE_CURRENT: CellStyle(
+            hex_to_qcolor(settings.current_period_color, settings.current_period_opacity), cell_text,
+            _make_font(settings.cell_font_family, settings.cell_font_size, bold=True),
+            border, 2
+        ),
+        # 드래그 중 요일 헤더 (헤더 배경에 점선 테두리)
+        ROLE_DRAG: CellStyle(
+            header_bg, header_text,
+            _make_font(settings.font_family, settings.font_size),
+            border, 1, Qt.DashLine
+        ),
+    }
+    # 호버 변형은 컴파일 시 함께 만들어 두고, 호버 중에는 역할만 바꿔 재사용
+    styles.update({hover_role(role): generate_hover_variant(style) for role, style in list(styles.items())})
+    return styles
 
-def generate_current_style(bg_color, text_color, border_color, font_family, font_size):
-    """현재 교시 강조 스타일 생성
-    
-    Args:
-        bg_color: 배경색 (rgba 형식)
-        text_color: 텍스트 색상 (HEX 형식)
-        border_color: 테두리 색상 (rgba 형식)
-        font_family: 폰트 패밀리
-        font_size: 폰트 크기
+# 그리드 스타일에 영향을 주는 설정 속성 (값이 같으면 컴파일된 스타일을 재사용)
+GRID_STYLE_ATTRIBUTES = (
+    "header_bg_color", "header_text_color", "cell_bg_color", "cell_text_color",
+    "current_period_color", "border_color",
+    "header_opacity", "cell_opacity", "current_period_opacity", "border_opacity",
+    "font_family", "font_size",
+    "header_font_family", "header_font_size", "cell_font_family", "cell_font_size",
+)
+
+
+class CompiledGridStyles(NamedTuple):
+    """컴파일된 그리드 스타일 (version은 스타일 설정 값 조합마다 고유)"""
+    version: int
+    styles: Dict[str, CellStyle]
+
+
+class GridStyleCache:
+    """스타일 설정 값 조합 -> 컴파일된 그리드 스타일 캐시
     
-    Returns:
-        스타일시트 문자열
-    """
-    return f"""
-        background-color: {bg_color}; 
-        color: {text_color}; 
-        border: 2px solid {border_color};
-        border-radius: 4px;
-        font-family: '{font_family}';
-        font-size: {font_size}pt;
-        padding: 2px;
-        font-weight: bold;
+    설정 미리보기에서 값을 오가며 바꿔도 같은 조합은 다시 만들지 않도록 최근 몇 개를 보관한다.
     """
-
-def generate_drag_style(bg_color, text_color, border_color, font_family, font_size):
-    """드래그 모드 스타일 생성
     
-    Args:
-        bg_color: 배경색 (rgba 형식)
-        text_color: 텍스트 색상 (HEX 형식)
-        border_color: 테두리 색상 (rgba 형식)
-        font_family: 폰트 패밀리
-        font_size: 폰트 크기
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._next_version = 1
+        self.hits = 0
+        self.misses = 0
     
-    Returns:
-        스타일시트 문자열
-    """
-    return f"""
-        background-color: {bg_color}; 
-        color: {text_color}; 
-        border: 1px dashed {border_color};
-        border-radius: 4px;
-        font-family: '{font_family}';
-        font-size: {font_size}pt;
-        padding: 2px;
-    """
+    def get(self, settings) -> CompiledGridStyles:
+        """설정 객체의 현재 스타일 값에 해당하는 컴파일된 스타일 반환"""
+        key = tuple(getattr(settings, name) for name in GRID_STYLE_ATTRIBUTES)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return compiled
+        
+        self.misses += 1
+        compiled = CompiledGridStyles(self._next_version, generate_grid_styles(settings))
+        self._next_version += 1
+        self._entries[key] = compiled
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compiled
+
+
+_grid_style_cache = GridStyleCache()
+
+def get_compiled_grid_styles(settings) -> CompiledGridStyles:
+    """공용 캐시에서 컴파일된 그리드 스타일 반환 (GridStyleCache 참고)"""
+    return _grid_style_cache.get(settings)
 
 def get_widget_style(bg_color, fg_color, transparency=0.8):
     """위젯 전체 스타일 생성 (tkinter 호환)
@@ -185,20 +245,3 @@ def get_theme_presets():
             "border_opacity": 255
         }
     }
-
-def generate_hover_style(base_style, additional_opacity=50):
-    """마우스 호버 시 적용할 스타일 생성 (불투명도 증가)"""
-    # base_style에서 opacity 값을 추출
-    import re
-    
-    # rgba 패턴에서 투명도 추출
-    pattern = r'rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)'
-    
-    def opacity_replace(match):
-        r, g, b, a = match.groups()
-        new_a = min(float(a) + (additional_opacity / 255), 1.0)
-        return f'rgba({r}, {g}, {b}, {new_a})'
-    
-    # 모든 rgba 패턴에서 투명도 증가
-    hover_style = re.sub(pattern, opacity_replace, base_style)
-    return hover_style
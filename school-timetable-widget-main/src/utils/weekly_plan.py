@@ -0,0 +1,167 @@
+"""
+주간 교시 전환 계획 모듈
+- 한 주의 모든 (요일, 시각, 이벤트) 전환을 월요일 자정 기준 분 단위로 정렬해 두는 불변 계획
+- 교시 시간, 예고 시간, 수업이 있는 요일이 바뀔 때만 다시 만들고 매주 그대로 반복
+- 과목이 하나도 없는 요일(주말, 수업 없는 날)은 계획에서 빠지므로 그 사이에는 깨어날 일이 없음
+- 전환마다 그 직후 진행 중인 교시를 미리 계산해 두어 현재 교시 조회가 O(1)
+- WeeklyPlanCursor: 위치 찾기(seek)만 이진 탐색, 이후 전환 소비(advance)는 O(1)이며 주 끝에서 다음 주로 넘어감
+"""
+import bisect
+import datetime
+from array import array
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+from utils.period_schedule import PeriodSchedule, MINUTES_PER_DAY
+
+# 이벤트 종류 (같은 분이면 이 순서로 발생)
+EVENT_PERIOD_ENDED = "period_ended"
+EVENT_PERIOD_STARTED = "period_started"
+EVENT_WARNING = "warning"
+_EVENT_ORDER = {EVENT_PERIOD_ENDED: 0, EVENT_PERIOD_STARTED: 1, EVENT_WARNING: 2}
+
+
+class Transition(NamedTuple):
+    """한 주 중 한 시각의 교시 전환"""
+    week_minute: int    # 월요일 자정 기준 분
+    kind: str
+    period: int
+
+    @property
+    def weekday(self) -> int:
+        """datetime.weekday() 값 (0=월요일)"""
+        return self.week_minute // MINUTES_PER_DAY
+
+    @property
+    def minute(self) -> int:
+        """자정 기준 분"""
+        return self.week_minute % MINUTES_PER_DAY
+
+
+def week_start_of(now: datetime.datetime) -> datetime.datetime:
+    """now가 속한 주의 월요일 자정"""
+    return datetime.datetime.combine(now.date() - datetime.timedelta(days=now.weekday()), datetime.time())
+
+
+def _week_minute_of(now: datetime.datetime) -> int:
+    return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+
+class WeeklyPlan:
+    """정렬된 주간 교시 전환 목록 (불변, build_weekly_plan으로 생성)"""
+
+    __slots__ = ("transitions", "_week_minutes", "_period_after", "class_weekdays", "day_count",
+                 "warning_minutes", "key")
+
+    def __init__(self, schedule: PeriodSchedule, class_weekdays: Tuple[int, ...], day_count: int,
+                 warning_minutes: Optional[int] = None):
+        day_events = []
+        for period in schedule.periods:
+            start, end = schedule.range_of(period)
+            day_events.append((start, EVENT_PERIOD_STARTED, period))
+            day_events.append((end, EVENT_PERIOD_ENDED, period))
+            if warning_minutes and start - warning_minutes >= 0:
+                day_events.append((start - warning_minutes, EVENT_WARNING, period))
+        day_events.sort(key=lambda event: (event[0], _EVENT_ORDER[event[1]], event[2]))
+
+        self.transitions: Tuple[Transition, ...] = tuple(
+            Transition(weekday * MINUTES_PER_DAY + minute, kind, period)
+            for weekday in sorted(class_weekdays)
+            for minute, kind, period in day_events
+        )
+        self._week_minutes = array('i', (transition.week_minute for transition in self.transitions))
+
+        # 각 전환 직후 진행 중인 교시 (0은 없음, 예고는 진행 중인 교시를 바꾸지 않음)
+        period_after = array('i')
+        active = 0
+        for transition in self.transitions:
+            if transition.kind == EVENT_PERIOD_STARTED:
+                active = transition.period
+            elif transition.kind == EVENT_PERIOD_ENDED and active == transition.period:
+                active = 0
+            period_after.append(active)
+        self._period_after = period_after
+
+        self.class_weekdays = tuple(sorted(class_weekdays))
+        self.day_count = day_count
+        self.warning_minutes = warning_minutes
+        # 계획을 다시 만들어야 하는지 판단하는 값
+        self.key = (schedule.signature, self.class_weekdays, day_count, warning_minutes)
+
+    def __len__(self) -> int:
+        return len(self.transitions)
+
+    def index_after(self, week_minute: int) -> int:
+        """해당 시각 이후(초과) 첫 전환의 위치 (없으면 len(self))"""
+        return bisect.bisect_right(self._week_minutes, week_minute)
+
+    def period_after(self, index: int) -> Optional[int]:
+        """index 위치 전환 직후 진행 중인 교시 (없으면 None)"""
+        return self._period_after[index] or None
+
+    def day_index(self, weekday: int) -> Optional[int]:
+        """datetime.weekday() 값을 요일 인덱스(1=월요일)로 변환 (표시하지 않는 요일이면 None)"""
+        return weekday + 1 if 0 <= weekday < self.day_count else None
+
+
+def build_weekly_plan(schedule: PeriodSchedule, class_weekdays: Iterable[int], day_count: int,
+                      warning_minutes: Optional[int] = None) -> WeeklyPlan:
+    """교시 인덱스를 수업이 있는 요일마다 펼쳐 주간 계획 생성
+
+    Args:
+        schedule: 하루 교시 인덱스
+        class_weekdays: 전환을 만들 요일 (0=월요일, SettingsManager.class_weekdays)
+        day_count: 그리드에 표시하는 요일 수
+        warning_minutes: 교시 시작 n분 전 예고 (None이면 예고 없음)
+    """
+    return WeeklyPlan(schedule, tuple(class_weekdays), day_count, warning_minutes)
+
+
+class WeeklyPlanCursor:
+    """주간 계획에서 다음에 발생할 전환 위치 (주 단위로 무한히 반복)"""
+
+    __slots__ = ("plan", "index", "week_start")
+
+    def __init__(self, plan: WeeklyPlan, now: datetime.datetime):
+        self.plan = plan
+        self.index = 0
+        self.week_start = week_start_of(now)
+        self.seek(now)
+
+    def seek(self, now: datetime.datetime) -> None:
+        """now 이후(초과 분) 첫 전환으로 이동 (이미 지난 전환은 건너뜀)"""
+        self.week_start = week_start_of(now)
+        self.index = self.plan.index_after(_week_minute_of(now))
+        if self.index >= len(self.plan):
+            self._next_week()
+
+    def _next_week(self) -> None:
+        self.index = 0
+        self.week_start += datetime.timedelta(days=7)
+
+    @property
+    def next_transition(self) -> Optional[Transition]:
+        """다음 전환 (계획이 비어 있으면 None)"""
+        return self.plan.transitions[self.index] if self.plan.transitions else None
+
+    @property
+    def next_time(self) -> Optional[datetime.datetime]:
+        """다음 전환 시각 (계획이 비어 있으면 None)"""
+        transition = self.next_transition
+        if transition is None:
+            return None
+        return self.week_start + datetime.timedelta(minutes=transition.week_minute)
+
+    def advance(self) -> Transition:
+        """다음 전환을 소비하고 반환 (O(1))"""
+        transition = self.plan.transitions[self.index]
+        self.index += 1
+        if self.index >= len(self.plan):
+            self._next_week()
+        return transition
+
+    @property
+    def current_period(self) -> Optional[int]:
+        """마지막으로 지난 전환 직후 진행 중인 교시 (index 0이면 지난주 마지막 전환 기준)"""
+        if not self.plan.transitions:
+            return None
+        return self.plan.period_after(self.index - 1)
@@ -0,0 +1,16 @@
+"""
+테스트 공통 설정
+- 그리드 뷰 등 위젯 테스트를 위해 화면 없이(offscreen) QApplication을 한 번만 생성
+  (다른 테스트 모듈의 QCoreApplication.instance()도 이 인스턴스를 사용)
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtWidgets
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,41 @@
+"""
+레이아웃 패스 스케줄러(LayoutScheduler) 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5 import QtCore
+
+from gui.layout_scheduler import LayoutScheduler, REASON_RESIZE, REASON_SCREEN, REASON_STYLE
+
+app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def test_invalidations_coalesce_into_one_pass():
+    passes = []
+    scheduler = LayoutScheduler(passes.append)
+
+    for reason in (REASON_RESIZE, REASON_RESIZE, REASON_STYLE):
+        scheduler.invalidate(reason)
+    assert scheduler.flush()
+    assert not scheduler.flush()  # 보류 중인 이유가 없으면 실행하지 않음
+
+    assert passes == [frozenset({REASON_RESIZE, REASON_STYLE})]
+    assert (scheduler.requested_count, scheduler.executed_count) == (3, 1)
+
+def test_suspended_requests_run_once_on_resume():
+    passes = []
+    scheduler = LayoutScheduler(passes.append, frame_interval_ms=0)
+
+    scheduler.suspend()
+    scheduler.invalidate(REASON_RESIZE)
+    scheduler.invalidate(REASON_SCREEN)
+    assert not scheduler.flush()
+
+    scheduler.resume()
+    # 다음 이벤트 루프 반복에서 실행됨
+    QtCore.QCoreApplication.processEvents()
+    assert passes == [frozenset({REASON_RESIZE, REASON_SCREEN})]
+    assert scheduler.pending_reasons == frozenset()
@@ -0,0 +1,33 @@
+"""
+경로 캐시(ResolvedPaths) 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import paths
+
+def test_resolved_paths_cached_until_env_changes(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(first))
+    assert paths.get_timetable_file_path() == os.path.join(str(first), "timetable_data.json")
+
+    # 반복 조회 시에는 파일시스템 호출이 없어야 함
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시된 경로 조회 중 파일시스템 호출 발생")
+    with monkeypatch.context() as m:
+        m.setattr(os.path, "exists", fail)
+        m.setattr(os, "makedirs", fail)
+        assert paths.get_data_directory() == str(first)
+        assert paths.get_style_settings_file_path().startswith(str(first))
+
+    # 환경 변수가 바뀌면 다시 계산
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(second))
+    assert paths.get_data_directory() == str(second)
+    assert os.path.isdir(paths.get_backup_directory())
@@ -0,0 +1,50 @@
+"""
+교시 시간 인덱스(PeriodSchedule) 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5 import QtCore
+
+from utils.period_schedule import (
+    compile_schedule, BOUNDARY_END, BOUNDARY_START, ISSUE_EMPTY, ISSUE_MISSING, ISSUE_OVERLAP
+)
+
+def make_ranges(*ranges):
+    return {
+        period: {"start": QtCore.QTime.fromString(start, "HH:mm"), "end": QtCore.QTime.fromString(end, "HH:mm")}
+        for period, (start, end) in enumerate(ranges, start=1)
+    }
+
+def test_lookups_use_half_open_ranges():
+    schedule = compile_schedule(make_ranges(("09:00", "09:50"), ("09:50", "10:40"), ("11:00", "11:50")), 3)
+    assert schedule.issues == ()
+
+    assert schedule.period_at(8 * 60 + 59) is None
+    assert schedule.period_at(9 * 60) == 1
+    assert schedule.period_at(9 * 60 + 50) == 2  # 앞 교시 종료 시각에 다음 교시 시작
+    assert schedule.period_at(10 * 60 + 45) is None  # 쉬는 시간
+    assert schedule.period_at(12 * 60) is None
+
+    # 같은 분이면 종료 경계가 시작 경계보다 먼저
+    assert schedule.next_boundary(9 * 60) == (9 * 60 + 50, 1, BOUNDARY_END)
+    assert schedule.previous_boundary(9 * 60 + 50) == (9 * 60 + 50, 2, BOUNDARY_START)
+    assert schedule.next_boundary(11 * 60 + 50) is None
+    assert schedule.previous_boundary(8 * 60) is None
+    assert schedule.next_start(10 * 60) == (11 * 60, 3, BOUNDARY_START)
+    assert schedule.range_of(3) == (11 * 60, 11 * 60 + 50)
+    assert schedule.range_of(4) is None
+
+def test_overlaps_and_missing_periods_reported():
+    ranges = make_ranges(("09:00", "09:50"), ("09:40", "10:30"), ("11:00", "10:50"))
+    schedule = compile_schedule(ranges, 4)
+
+    assert [(issue.kind, issue.period) for issue in schedule.issues] == [
+        (ISSUE_EMPTY, 3), (ISSUE_MISSING, 4), (ISSUE_OVERLAP, 2)
+    ]
+    # 유효하지 않은 교시는 조회에서 제외
+    assert schedule.periods == (1, 2)
+    assert schedule.period_at(10 * 60 + 55) is None
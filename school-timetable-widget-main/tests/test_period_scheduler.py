@@ -0,0 +1,136 @@
+"""
+교시 전환 이벤트 스케줄러(PeriodEventScheduler)와 주간 계획 단위 테스트
+"""
+import datetime
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5 import QtCore
+
+from core.clock_monitor import ClockDriftMonitor
+from core.period_scheduler import PeriodEventScheduler
+from utils.period_schedule import compile_schedule
+from utils.weekly_plan import build_weekly_plan
+
+app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def make_scheduler(now, class_weekdays=range(5)):
+    clock = [now]
+    scheduler = PeriodEventScheduler(clock=lambda: clock[0])
+    events = []
+    scheduler.period_started.connect(lambda period: events.append(("started", period)))
+    scheduler.period_ended.connect(lambda period: events.append(("ended", period)))
+    scheduler.warning.connect(lambda period, minutes: events.append(("warning", period, minutes)))
+    scheduler.day_changed.connect(lambda date: events.append(("day", date)))
+    scheduler.resynced.connect(lambda: events.append(("resynced",)))
+    time_ranges = {
+        1: {"start": QtCore.QTime(9, 0), "end": QtCore.QTime(9, 50)},
+        2: {"start": QtCore.QTime(9, 50), "end": QtCore.QTime(10, 40)},
+    }
+    scheduler.load(build_weekly_plan(compile_schedule(time_ranges, 2), class_weekdays, 5, warning_minutes=5))
+    return scheduler, clock, events
+
+def test_one_wakeup_per_event_slot():
+    scheduler, clock, events = make_scheduler(datetime.datetime(2024, 3, 4, 8, 0))
+    # 다음 이벤트(1교시 예고 08:55)까지 한 번에 예약
+    assert abs(scheduler.next_wakeup_msec - 55 * 60 * 1000) < 1000
+
+    clock[0] = datetime.datetime(2024, 3, 4, 8, 55)
+    assert scheduler.dispatch_due() == 1
+    for minute in (9 * 60, 9 * 60 + 45):
+        clock[0] = datetime.datetime(2024, 3, 4, minute // 60, minute % 60)
+        scheduler.dispatch_due()
+    # 같은 분의 종료/시작은 한 번 깨어날 때 순서대로 발생
+    clock[0] = datetime.datetime(2024, 3, 4, 9, 50, 0, 5000)
+    assert scheduler.dispatch_due() == 2
+
+    assert events == [
+        ("warning", 1, 5), ("started", 1), ("warning", 2, 5), ("ended", 1), ("started", 2)
+    ]
+    assert scheduler.wakeup_count == 4
+
+def test_weekend_skipped_in_one_wakeup():
+    # 금요일(2024-03-08) 마지막 교시가 끝난 뒤에는 월요일 첫 예고까지 한 번에 예약
+    scheduler, clock, events = make_scheduler(datetime.datetime(2024, 3, 8, 11, 0))
+    assert scheduler.current_period is None
+    assert abs(scheduler.next_wakeup_msec - ((2 * 24 + 21) * 60 + 55) * 60 * 1000) < 1000
+
+    clock[0] = datetime.datetime(2024, 3, 11, 8, 55)
+    assert scheduler.dispatch_due() == 1
+    # 날짜 변경은 새 날의 첫 전환 직전에 함께 발생
+    assert events == [("day", datetime.date(2024, 3, 11)), ("warning", 1, 5)]
+    assert scheduler.wakeup_count == 1
+    assert scheduler.current_day_idx == 1
+
+def test_empty_days_folded_and_state_from_cursor():
+    # 화요일(1)은 과목이 없어 계획에서 빠짐
+    scheduler, clock, events = make_scheduler(datetime.datetime(2024, 3, 4, 9, 55), class_weekdays=(0, 2))
+    assert scheduler.current_period == 2
+    assert scheduler.plan.class_weekdays == (0, 2)
+
+    clock[0] = datetime.datetime(2024, 3, 4, 10, 40)
+    scheduler.dispatch_due()
+    assert scheduler.current_period is None
+    # 다음 전환은 수요일 1교시 예고
+    assert abs(scheduler.next_wakeup_msec - ((24 + 22) * 60 + 15) * 60 * 1000) < 1000
+
+    # 화요일 중간에 다시 위치를 찾아도 진행 중인 교시 없음
+    clock[0] = datetime.datetime(2024, 3, 5, 9, 30)
+    scheduler.load(scheduler.plan)
+    assert scheduler.current_period is None
+    assert scheduler.current_day_idx == 2
+
+def test_late_wakeup_after_suspend_resyncs_without_replay():
+    scheduler, clock, events = make_scheduler(datetime.datetime(2024, 3, 4, 8, 0))
+    # 08:55 예고 전에 절전, 10:00에 복귀 (예고/1교시 시작/종료를 재생하지 않음)
+    clock[0] = datetime.datetime(2024, 3, 4, 10, 0)
+    assert scheduler.dispatch_due() == 0
+    assert events == [("resynced",)]
+    assert scheduler.current_period == 2
+    assert abs(scheduler.next_wakeup_msec - 40 * 60 * 1000) < 1000
+
+def test_clock_monitor_detects_wall_clock_jumps():
+    wall = [datetime.datetime(2024, 3, 4, 9, 0)]
+    monotonic = [100.0]
+    monitor = ClockDriftMonitor(clock=lambda: wall[0], monotonic=lambda: monotonic[0])
+    jumps = []
+    monitor.clock_jumped.connect(jumps.append)
+
+    # 정상 진행 (오차 범위 내)
+    wall[0] += datetime.timedelta(seconds=60.5)
+    monotonic[0] += 60
+    assert monitor.check() is None
+
+    # 절전 (Linux 등): 단조 시계는 멈춰 있고 벽시계만 30분 진행
+    wall[0] += datetime.timedelta(minutes=30)
+    monotonic[0] += 1
+    assert monitor.check() == 30 * 60 - 1
+    # 시간대 변경/시각 되돌림
+    wall[0] -= datetime.timedelta(hours=1)
+    assert monitor.check() == -3600
+    assert jumps == [30 * 60 - 1, -3600]
+    assert monitor.jump_count == 2
+
+def test_resume_before_next_transition_restarts_countdown():
+    # Windows 절전: 단조 시계도 절전 중 흐르므로 벽시계 차이는 없고 확인 타이머 지연으로만 감지
+    scheduler, clock, events = make_scheduler(datetime.datetime(2024, 3, 4, 9, 10))
+    monotonic = [100.0]
+    monitor = ClockDriftMonitor(clock=lambda: clock[0], monotonic=lambda: monotonic[0])
+    monitor.stalled.connect(lambda delay: scheduler.resync())
+    monitor.start()
+    assert abs(scheduler.next_wakeup_msec - 35 * 60 * 1000) < 1000
+
+    # 09:10에 절전, 다음 전환(09:45 예고) 전인 09:30에 복귀
+    clock[0] = datetime.datetime(2024, 3, 4, 9, 30)
+    monotonic[0] += 20 * 60
+    assert monitor.check() is None
+    monitor.stop()
+    assert monitor.stall_count == 1
+
+    # 지난 전환이 없으므로 이벤트 없이 커서만 다시 맞추고 resynced로 남은 시간 표시를 다시 시작
+    assert events == [("resynced",)]
+    assert scheduler.current_period == 1
+    assert abs(scheduler.next_wakeup_msec - 15 * 60 * 1000) < 1000
@@ -5,6 +5,7 @@ import os
 import sys
 import pytest
 import json
+from PyQt5 import QtCore
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -56,3 +57,58 @@ def test_save_and_load_widget_position_with_screen_info(tmp_path, monkeypatch):
     with open(get_widget_settings_file_path(), encoding="utf-8") as f:
         data = json.load(f)
         assert data["screen_info"] == screen_info
+
+def test_grid_dimensions_and_subject_lookup(tmp_path, monkeypatch):
+    """요일/교시 수 저장 및 복원, 정수 인덱스 과목 조회 테스트"""
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(tmp_path))
+    SettingsManager._instance = None
+    sm = SettingsManager.get_instance()
+    assert (sm.day_count, sm.period_count) == (5, 7)
+
+    # 토요일 + 9교시로 변경
+    assert sm.set_grid_dimensions(6, 9)
+    assert not sm.set_grid_dimensions(6, 9)
+    assert sm.day_labels == ['월', '화', '수', '목', '금', '토']
+    assert sm.day_index_for_weekday(5) == 6
+    assert sm.day_index_for_weekday(6) is None
+    # 기본 시간이 없는 8, 9교시는 앞 교시 뒤에 이어서 배치
+    assert sm.time_ranges[8]["start"].toString("HH:mm") == "17:00"
+    assert sm.time_ranges[9]["end"].toString("HH:mm") == "18:50"
+    # 교시 인덱스는 교시 수 변경 시 다시 컴파일되고, 시간이 그대로면 재사용
+    assert sm.schedule.range_of(9) == (18 * 60, 18 * 60 + 50)
+    assert not sm.rebuild_schedule()
+    assert sm.get_current_period(QtCore.QTime(18, 10)) == 9
+
+    # 시간표가 비어 있으면 표시하는 모든 요일이 수업 요일
+    assert sm.class_weekdays == (0, 1, 2, 3, 4, 5)
+    sm.update_timetable_cells({(6, 9): "과학", (1, 1): "국어"})
+    assert sm.class_weekdays == (0, 5)
+    assert sm.get_subject(6, 9) == "과학"
+    assert sm.get_subject(1, 2) == ""
+    assert sm.get_subject(7, 1) == ""
+    assert sm.timetable_data["토"]["9"] == "과학"
+
+    SettingsManager._instance = None
+    sm2 = SettingsManager.get_instance()
+    assert (sm2.day_count, sm2.period_count) == (6, 9)
+    assert sm2.get_subject(1, 1) == "국어"
+    # 범위를 벗어난 값은 제한됨
+    assert sm2.set_grid_dimensions(0, 99)
+    assert (sm2.day_count, sm2.period_count) == (5, 10)
+    # 표시하지 않는 토요일은 수업 요일에서 제외
+    assert sm2.class_weekdays == (0,)
+
+def test_countdown_settings_saved_and_clamped(tmp_path, monkeypatch):
+    """현재 교시 남은 시간 표시 설정 저장/복원 및 갱신 간격 범위 제한 테스트"""
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(tmp_path))
+    SettingsManager._instance = None
+    sm = SettingsManager.get_instance()
+    assert sm.show_period_countdown and sm.countdown_interval_seconds == 60
+
+    assert sm.set_countdown_settings(False, 1)
+    assert not sm.set_countdown_settings(False, 10)
+    assert sm.countdown_interval_seconds == 10
+
+    SettingsManager._instance = None
+    sm2 = SettingsManager.get_instance()
+    assert (sm2.show_period_countdown, sm2.countdown_interval_seconds) == (False, 10)
@@ -0,0 +1,69 @@
+"""
+통합 설정 저장소(SettingsStore) 단위 테스트
+"""
+import os
+import sys
+import json
+import pytest
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.settings_store import SettingsStore, SETTINGS_STORE_VERSION, LEGACY_SECTION_FILES
+from utils.settings_manager import SettingsManager
+from utils.exceptions import ConfigError
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+def test_migrate_and_export_legacy_layout(tmp_path):
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    _write_json(legacy_dir / "timetable_data.json", {"월": {"1": "국어"}})
+    _write_json(legacy_dir / "style_settings.json", {"header_bg_color": "#123456"})
+
+    store = SettingsStore(str(tmp_path / "settings_store.json"))
+    assert store.migrate_from_legacy(str(legacy_dir)) == 2
+
+    # 버전 헤더와 함께 한 파일에 저장됨
+    with open(store.file_path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["version"] == SETTINGS_STORE_VERSION
+    assert data["sections"]["timetable"] == {"월": {"1": "국어"}}
+
+    # 다시 읽기 및 파일별 레이아웃으로 내보내기
+    store2 = SettingsStore(store.file_path)
+    store2.load()
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    assert store2.export_legacy(str(export_dir)) == 2
+    with open(export_dir / LEGACY_SECTION_FILES["style"], encoding="utf-8") as f:
+        assert json.load(f) == {"header_bg_color": "#123456"}
+    # 임시 파일이 남지 않아야 함
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+
+def test_newer_store_version_is_rejected(tmp_path):
+    path = tmp_path / "settings_store.json"
+    _write_json(path, {"version": SETTINGS_STORE_VERSION + 1, "sections": {}})
+    with pytest.raises(ConfigError):
+        SettingsStore(str(path)).load()
+
+def test_settings_manager_uses_store(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(tmp_path))
+    monkeypatch.setenv('SCHOOL_TIMETABLE_SETTINGS_STORE', '1')
+    # 기존 레이아웃 파일은 최초 실행 시 자동 마이그레이션
+    _write_json(tmp_path / "timetable_data.json", {"화": {"2": "수학"}})
+
+    SettingsManager._instance = None
+    sm = SettingsManager.get_instance()
+    assert sm.timetable_data == {"화": {"2": "수학"}}
+    sm.header_bg_color = "#abcdef"
+    sm.save_style_settings()
+
+    SettingsManager._instance = None
+    sm2 = SettingsManager.get_instance()
+    assert sm2.header_bg_color == "#abcdef"
+    # 스타일은 개별 파일이 아닌 통합 저장소에만 기록됨
+    assert not (tmp_path / "style_settings.json").exists()
+    SettingsManager._instance = None
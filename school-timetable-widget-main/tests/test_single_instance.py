@@ -0,0 +1,63 @@
+"""
+단일 인스턴스 잠금/서버(SingleInstanceServer) 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5 import QtCore
+
+from core.single_instance import (
+    SingleInstanceServer, COMMAND_RELOAD, get_launch_command, get_lock_file_path,
+    send_command_to_running_instance
+)
+from utils import paths
+
+app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def test_second_launch_hands_off_instead_of_taking_over(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(tmp_path))
+    first = SingleInstanceServer()
+    received = []
+    first.command_received.connect(received.append)
+    assert first.acquire("show")
+    assert os.path.exists(get_lock_file_path())
+
+    # 잠금을 가진 인스턴스가 있으면 소켓을 지우거나 서버를 열지 않고 명령만 전달
+    second = SingleInstanceServer()
+    assert not second.acquire(COMMAND_RELOAD)
+    assert not second.server.isListening()
+    for _ in range(20):
+        app.processEvents()
+    assert received == [COMMAND_RELOAD]
+    assert first.server.isListening()
+
+    # 종료 후에는 다음 실행이 인스턴스가 됨
+    first.close()
+    third = SingleInstanceServer()
+    assert third.acquire("show")
+    third.close()
+
+def test_fast_path_before_setup_environment_reaches_server(tmp_path, monkeypatch):
+    # 일반 실행: 데이터 디렉토리 환경 변수 없이 OS 표준 경로(appdirs) 사용
+    monkeypatch.delenv('SCHOOL_TIMETABLE_DATA_DIR', raising=False)
+    monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path))
+    monkeypatch.setattr(paths, "_resolved_paths", None)
+    monkeypatch.setattr(paths, "_resolved_env_value", None)
+
+    # 첫 실행: setup_environment가 환경 변수를 설정한 뒤 서버 시작
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', paths.ensure_data_directory_exists())
+    server = SingleInstanceServer()
+    received = []
+    server.command_received.connect(received.append)
+    assert server.acquire("show")
+
+    # 두 번째 실행: main.py의 빠른 경로는 setup_environment 이전(환경 변수 없음)에 실행됨
+    monkeypatch.delenv('SCHOOL_TIMETABLE_DATA_DIR')
+    assert send_command_to_running_instance(get_launch_command(["main.py", "--reload"]))
+    for _ in range(20):
+        app.processEvents()
+    assert received == [COMMAND_RELOAD]
+    server.close()
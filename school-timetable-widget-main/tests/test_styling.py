@@ -0,0 +1,47 @@
+"""
+그리드 스타일 캐시(GridStyleCache) 단위 테스트
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.config import Config
+from utils.styling import GridStyleCache, HOVER_ADDITIONAL_OPACITY, ROLE_CELL, ROLE_CURRENT, hover_role
+
+def make_settings(**overrides):
+    values = dict(Config.DEFAULT_STYLES)
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+def test_compiled_styles_reused_per_settings_version():
+    cache = GridStyleCache(max_entries=2)
+    settings = make_settings()
+
+    first = cache.get(settings)
+    assert cache.get(settings) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # 값이 바뀌면 새 버전, 원래 값으로 돌아오면 이전 버전 재사용
+    settings.current_period_opacity = 100
+    changed = cache.get(settings)
+    assert changed.version != first.version
+    assert changed.styles[ROLE_CURRENT].background.alpha() == 100
+    settings.current_period_opacity = Config.DEFAULT_STYLES["current_period_opacity"]
+    assert cache.get(settings) is first
+
+    # 최대 개수를 넘으면 가장 오래된 항목부터 제거
+    cache.get(make_settings(cell_opacity=1))
+    cache.get(make_settings(cell_opacity=2))
+    assert cache.get(settings).version not in (first.version, changed.version)
+
+def test_hover_variants_compiled_with_styles():
+    styles = GridStyleCache().get(make_settings(cell_opacity=100, border_opacity=250)).styles
+
+    hover = styles[hover_role(ROLE_CELL)]
+    assert hover.background.alpha() == 100 + HOVER_ADDITIONAL_OPACITY
+    assert hover.border_color.alpha() == 255  # 최대 255
+    assert hover.font == styles[ROLE_CELL].font
+    assert styles[ROLE_CELL].background.alpha() == 100  # 원래 스타일은 그대로
@@ -0,0 +1,95 @@
+"""
+직접 그리는 시간표 그리드(TimetableGridView) 단위 테스트 (offscreen, conftest.py 참고)
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from PyQt5 import QtCore, QtGui
+
+from gui.timetable_grid import TimetableGridView, MIN_SHRINK_POINT_SIZE, _shrink_font_to_fit
+from utils.config import Config
+from utils.styling import GridStyleCache
+
+# 스타일 버전은 캐시마다 1부터 매기므로 테스트 전체에서 하나만 사용
+style_cache = GridStyleCache()
+
+def compile_styles(**overrides):
+    return style_cache.get(SimpleNamespace(**dict(Config.DEFAULT_STYLES, **overrides)))
+
+def make_view():
+    compiled = compile_styles()
+    view = TimetableGridView(("월", "화", "수"), 3)
+    view.set_styles(compiled.styles, compiled.version)
+    view.resize(300, 200)
+    view.set_cell_texts({(period, day): f"과목{period}{day}" for period in range(1, 4) for day in range(1, 4)})
+    # 다시 그리는 영역 기록
+    view.updated_regions = []
+    view.update = lambda *args: view.updated_regions.append(args[0] if args else None)
+    return view, compiled
+
+def test_identical_texts_and_styles_dirty_nothing():
+    view, compiled = make_view()
+    texts = {(period, day): view.cell_text(period, day) for period in range(1, 4) for day in range(1, 4)}
+
+    assert view.set_cell_texts(texts) == 0
+    assert view.set_styles(compiled.styles, compiled.version) == 0
+    assert view.set_current_cell(None, None) == 0
+    assert view.updated_regions == []
+
+def test_changing_one_cell_repaints_only_that_section():
+    view, _ = make_view()
+    texts = {(period, day): view.cell_text(period, day) for period in range(1, 4) for day in range(1, 4)}
+    texts[(2, 3)] = "수학"
+
+    assert view.set_cell_texts(texts) == 1
+    assert view.updated_regions == [QtGui.QRegion(view.cell_rect(2, 3))]
+
+def test_text_layouts_reused_across_paints():
+    view, _ = make_view()
+    cache = view.text_layout_cache
+    view.grab()
+    misses, hits = cache.misses, cache.hits
+    assert misses > 0
+
+    # 같은 크기/폰트로 다시 그리면 배치를 다시 계산하지 않음
+    view.grab()
+    assert cache.misses == misses
+    assert cache.hits >= hits + misses
+
+def test_auto_shrink_fits_long_text():
+    font = QtGui.QFont()
+    font.setPointSizeF(12)
+    size = QtCore.QSize(60, 30)
+
+    assert _shrink_font_to_fit("국어", font, size).pointSizeF() == 12
+    shrunk = _shrink_font_to_fit("아주 긴 과목 이름 " * 4, font, size)
+    assert MIN_SHRINK_POINT_SIZE <= shrunk.pointSizeF() < 12
+
+def test_background_layer_rebuilt_only_for_style_or_size_changes():
+    view, _ = make_view()
+    view.grab()
+    assert view.background_rebuild_count == 1
+
+    # 호버/현재 교시/남은 시간은 배경 레이어 위에만 그림
+    view.set_hovered_section((1, 1))
+    view.grab()
+    view.set_current_cell(2, 2)
+    view.set_current_progress(30, 0.4)
+    view.grab()
+    view.set_current_progress(29, 0.42)
+    view.set_hovered_section(None)
+    view.grab()
+    assert view.background_rebuild_count == 1
+
+    # 스타일 또는 크기가 바뀌면 다시 그림
+    changed = compile_styles(cell_opacity=200)
+    view.set_styles(changed.styles, changed.version)
+    view.grab()
+    assert view.background_rebuild_count == 2
+    view.resize(320, 220)
+    view.grab()
+    assert view.background_rebuild_count == 3
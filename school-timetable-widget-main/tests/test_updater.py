@@ -0,0 +1,27 @@
+"""
+Updater 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.updater import Updater, is_update_check_due
+
+def test_is_newer_version():
+    assert Updater.is_newer_version("v1.2.0", "1.1.9")
+    assert not Updater.is_newer_version("v1.0.0", "1.0.0")
+
+def test_is_update_check_due_respects_interval():
+    now = 1_000_000.0
+    # 확인 기록이 없으면 항상 확인
+    assert is_update_check_due(None, 24, now=now)
+    # 주기 이내이면 건너뜀
+    assert not is_update_check_due(now - 3600, 24, now=now)
+    # 주기가 지나면 확인
+    assert is_update_check_due(now - 24 * 3600, 24, now=now)
+    # 주기 0이면 매번 확인
+    assert is_update_check_due(now, 0, now=now)
+    # 시계가 뒤로 간 경우에도 확인
+    assert is_update_check_due(now + 60, 24, now=now)
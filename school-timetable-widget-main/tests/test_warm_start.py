@@ -0,0 +1,25 @@
+"""
+웜 스타트 캐시 키 단위 테스트
+"""
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gui.warm_start import compute_render_key
+
+def test_render_key_changes_with_inputs():
+    style = {"cell_bg_color": "#FFFFFF", "cell_font_size": 10}
+    timetable = {"월": {"1": "국어"}}
+    key = compute_render_key(style, timetable, (400, 300))
+
+    # 같은 입력이면 같은 키 (딕셔너리 순서와 무관)
+    assert key == compute_render_key(dict(reversed(list(style.items()))), timetable, (400, 300))
+
+    # 스타일, 시간표, 크기, 그리드 크기 중 하나라도 바뀌면 다른 키
+    assert key != compute_render_key({**style, "cell_font_size": 11}, timetable, (400, 300))
+    assert key != compute_render_key(style, {"월": {"1": "수학"}}, (400, 300))
+    assert key != compute_render_key(style, timetable, (401, 300))
+    assert key != compute_render_key(style, timetable, (400, 300), (6, 7))
+    assert key != compute_render_key(style, timetable, (400, 300), (5, 8))
@@ -0,0 +1,56 @@
+"""
+현재 교시 남은 시간 표시(Widget 카운트다운) 테스트 (offscreen, conftest.py 참고)
+"""
+import datetime
+import os
+import sys
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gui.widget import Widget
+from utils.settings_manager import SettingsManager
+
+def test_countdown_follows_clock_and_stops_at_period_boundary(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHOOL_TIMETABLE_DATA_DIR', str(tmp_path))
+    SettingsManager._instance = None
+    sm = SettingsManager.get_instance()
+    sm.set_countdown_settings(True, 60)
+
+    # 월요일 1교시(기본 09:00-09:50) 진행 중
+    clock = [datetime.datetime(2024, 3, 4, 9, 10)]
+    # app_manager를 넘기면 알림/시계 감시 시작(start_period_tracking)을 예약하지 않음
+    widget = Widget(settings_manager=sm, app_manager=object(), clock=lambda: clock[0])
+    widget.sync_period_scheduler()
+    widget.update_current_period(force_notify=True)
+    grid = widget.grid_view
+    assert widget.current_period == 1
+    assert grid.current_progress == (40, 0.2)
+    assert widget.countdown_timer.isActive()
+
+    # 갱신 타이머가 깨어날 때마다 같은 시계로 다시 계산 (남은 분은 올림)
+    clock[0] = datetime.datetime(2024, 3, 4, 9, 30, 30)
+    widget.update_countdown()
+    assert grid.current_progress[0] == 20
+
+    # 교시 종료 시각: 표시를 지우고 더 이상 예약하지 않음 (교시 전환은 스케줄러가 처리)
+    clock[0] = datetime.datetime(2024, 3, 4, 9, 50)
+    widget.update_countdown()
+    assert grid.current_progress is None
+    assert not widget.countdown_timer.isActive()
+    widget.period_scheduler.dispatch_due()
+    assert widget.current_period is None
+
+    # 설정 대화상자와 같은 경로로 표시를 끄면 다음 교시에도 표시하지 않음
+    clock[0] = datetime.datetime(2024, 3, 4, 10, 0)
+    widget.period_scheduler.dispatch_due()
+    assert widget.current_period == 2
+    assert grid.current_progress == (50, 0.0)
+    assert sm.set_countdown_settings(False, 60)
+    widget.restart_countdown()
+    assert grid.current_progress is None
+    assert not widget.countdown_timer.isActive()
+
+    widget.period_scheduler.stop()
+    widget.deleteLater()
+    SettingsManager._instance = None
@@ -0,0 +1,324 @@
+"""
+시작 성능 회귀 벤치마크 스크립트
+사용법: python tools/bench_startup.py [옵션]
+
+- src/main.py를 QT_QPA_PLATFORM=offscreen, 임시 SCHOOL_TIMETABLE_DATA_DIR로 반복 실행
+- 네트워크는 접속할 수 없는 프록시로 막아 업데이트 확인이 결과에 영향을 주지 않게 함
+- -X importtime 출력과 시작 단계 측정 레코드("[startup-timing] {...}")를 파싱
+- 첫 페인트까지의 시간과 최대 메모리(RSS, psutil)의 p50/p95 보고
+- 저장된 기준(baseline) JSON과 비교하여 임계값 이상 느려지면 종료 코드 1 반환
+"""
+import sys
+import os
+import json
+import argparse
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import psutil
+
+# 프로젝트 루트 경로
+PROJECT_ROOT = Path(__file__).parent.parent
+MAIN_SCRIPT = PROJECT_ROOT / 'src' / 'main.py'
+
+STARTUP_TIMING_PREFIX = "[startup-timing] "
+IMPORT_TIME_PREFIX = "import time:"
+
+# 비교 대상 지표 (이름 -> 설명)
+METRICS = {
+    "first_paint_ms": "첫 페인트까지 시간 (ms, 프로세스 내 측정)",
+    "warm_start_paint_ms": "웜 스타트 이미지 표시까지 시간 (ms)",
+    "wall_ms": "프로세스 시작부터 측정 완료까지 (ms)",
+    "import_ms": "모듈 임포트 시간 합계 (ms, -X importtime)",
+    "peak_rss_mb": "최대 메모리 사용량 (MB)",
+}
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """선형 보간 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * (p / 100.0)
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def parse_import_time(lines: List[str]) -> Dict[str, float]:
+    """-X importtime 출력에서 최상위 모듈별 누적 임포트 시간(ms) 추출"""
+    modules = {}
+    for line in lines:
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        parts = line[len(IMPORT_TIME_PREFIX):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 줄
+        cumulative_us = int(parts[1].strip())
+        name = parts[2].rstrip('\n')
+        # 들여쓰기가 없는 줄이 최상위 임포트
+        if not name.startswith(' ' * 2):
+            modules[name.strip()] = modules.get(name.strip(), 0.0) + cumulative_us / 1000.0
+    return modules
+
+
+def parse_startup_record(lines: List[str]) -> Optional[Dict]:
+    """표준 오류 출력에서 시작 단계 측정 레코드 추출"""
+    for line in lines:
+        if line.startswith(STARTUP_TIMING_PREFIX):
+            return json.loads(line[len(STARTUP_TIMING_PREFIX):])
+    return None
+
+
+def phase_end_ms(record: Dict, name: str) -> Optional[float]:
+    """단계의 종료 시각 (측정 기준 시각부터 ms)"""
+    phase = record.get("phases", {}).get(name)
+    if not phase:
+        return None
+    return phase["start_ms"] + phase["duration_ms"]
+
+
+def build_environment(data_dir: str) -> Dict[str, str]:
+    """벤치마크용 실행 환경 변수"""
+    env = dict(os.environ)
+    env.update({
+        "QT_QPA_PLATFORM": "offscreen",
+        "SCHOOL_TIMETABLE_DATA_DIR": data_dir,
+        "SCHOOL_TIMETABLE_STARTUP_TIMING": "1",
+        # 네트워크 차단: 접속할 수 없는 프록시로 모든 HTTP(S) 요청이 즉시 실패하도록 함
+        "HTTP_PROXY": "http://127.0.0.1:9",
+        "HTTPS_PROXY": "http://127.0.0.1:9",
+        "NO_PROXY": "",
+        "PYTHONUNBUFFERED": "1",
+    })
+    env.pop("no_proxy", None)
+    return env
+
+
+def run_once(data_dir: str, timeout: float, import_time: bool) -> Dict:
+    """위젯을 한 번 실행하여 측정값 수집"""
+    command = [sys.executable]
+    if import_time:
+        command += ["-X", "importtime"]
+    command.append(str(MAIN_SCRIPT))
+
+    stderr_lines: List[str] = []
+    record_seen = threading.Event()
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        cwd=str(PROJECT_ROOT),
+        env=build_environment(data_dir),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='replace',
+    )
+
+    def read_stderr():
+        for line in process.stderr:
+            stderr_lines.append(line)
+            if line.startswith(STARTUP_TIMING_PREFIX):
+                record_seen.set()
+
+    reader = threading.Thread(target=read_stderr, daemon=True)
+    reader.start()
+
+    # 측정 레코드가 나올 때까지 메모리 사용량 샘플링
+    peak_rss = 0
+    ps_process = psutil.Process(process.pid)
+    while not record_seen.is_set() and process.poll() is None:
+        if time.perf_counter() - start > timeout:
+            break
+        try:
+            peak_rss = max(peak_rss, ps_process.memory_info().rss)
+        except psutil.Error:
+            break
+        record_seen.wait(0.01)
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    # 종료 (SIGTERM → 정상 종료 처리, 응답이 없으면 강제 종료)
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    reader.join(timeout=5)
+
+    record = parse_startup_record(stderr_lines)
+    if record is None:
+        tail = ''.join(stderr_lines[-20:])
+        raise RuntimeError(f"시작 측정 레코드를 찾지 못했습니다 (종료 코드 {process.returncode}).\n{tail}")
+
+    imports = parse_import_time(stderr_lines)
+    return {
+        "first_paint_ms": phase_end_ms(record, "first_paint"),
+        "warm_start_paint_ms": phase_end_ms(record, "warm_start_paint"),
+        "wall_ms": wall_ms,
+        "import_ms": sum(imports.values()) if imports else None,
+        "peak_rss_mb": peak_rss / (1024 * 1024) if peak_rss else None,
+        "imports": imports,
+        "record": record,
+    }
+
+
+def run_benchmark(runs: int, timeout: float, import_time: bool, warm: bool) -> List[Dict]:
+    """여러 번 실행하여 측정값 목록 반환
+
+    warm이 True이면 하나의 데이터 디렉토리를 재사용 (첫 실행은 캐시 생성용으로 제외)
+    """
+    results = []
+    shared_dir = tempfile.mkdtemp(prefix="timetable-bench-") if warm else None
+    try:
+        total = runs + 1 if warm else runs
+        for index in range(total):
+            data_dir = shared_dir or tempfile.mkdtemp(prefix="timetable-bench-")
+            try:
+                result = run_once(data_dir, timeout, import_time)
+            finally:
+                if not shared_dir:
+                    shutil.rmtree(data_dir, ignore_errors=True)
+            if warm and index == 0:
+                continue
+            results.append(result)
+            print(
+                f"  실행 {len(results)}/{runs}: 첫 페인트 {format_value(result['first_paint_ms'])} ms, "
+                f"RSS {format_value(result['peak_rss_mb'])} MB",
+                file=sys.stderr
+            )
+    finally:
+        if shared_dir:
+            shutil.rmtree(shared_dir, ignore_errors=True)
+    return results
+
+
+def summarize(results: List[Dict]) -> Dict:
+    """지표별 p50/p95 요약"""
+    summary = {"runs": len(results), "metrics": {}, "slowest_imports_ms": {}}
+    for name in METRICS:
+        values = [r[name] for r in results if r.get(name) is not None]
+        if values:
+            summary["metrics"][name] = {
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+            }
+
+    # 최상위 임포트별 중앙값 (느린 순 10개)
+    per_module: Dict[str, List[float]] = {}
+    for result in results:
+        for module, ms in result.get("imports", {}).items():
+            per_module.setdefault(module, []).append(ms)
+    medians = {module: percentile(values, 50) for module, values in per_module.items()}
+    for module in sorted(medians, key=medians.get, reverse=True)[:10]:
+        summary["slowest_imports_ms"][module] = round(medians[module], 3)
+    return summary
+
+
+def compare_with_baseline(summary: Dict, baseline: Dict, threshold_percent: float) -> List[str]:
+    """기준보다 임계값 이상 느려진 지표 목록 반환"""
+    regressions = []
+    for name, current in summary["metrics"].items():
+        base = baseline.get("metrics", {}).get(name)
+        if not base:
+            continue
+        for stat in ("p50", "p95"):
+            if not base.get(stat):
+                continue
+            limit = base[stat] * (1 + threshold_percent / 100.0)
+            if current[stat] > limit:
+                change = (current[stat] / base[stat] - 1) * 100
+                regressions.append(
+                    f"{name} {stat}: {current[stat]:.1f} (기준 {base[stat]:.1f}, +{change:.1f}%)"
+                )
+    return regressions
+
+
+def format_value(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_summary(summary: Dict) -> None:
+    print(f"\n실행 횟수: {summary['runs']}")
+    print(f"{'지표':<22}{'p50':>10}{'p95':>10}")
+    for name, stats in summary["metrics"].items():
+        print(f"{name:<22}{format_value(stats['p50']):>10}{format_value(stats['p95']):>10}")
+    if summary["slowest_imports_ms"]:
+        print("\n느린 최상위 임포트 (중앙값, ms):")
+        for module, ms in summary["slowest_imports_ms"].items():
+            print(f"  {module:<40}{ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='시작 성능 회귀 벤치마크',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예제:
+  # 10회 실행 후 결과 출력
+  python tools/bench_startup.py
+
+  # 현재 결과를 기준으로 저장
+  python tools/bench_startup.py --runs 20 --save-baseline tools/startup_baseline.json
+
+  # 기준과 비교 (p50/p95가 10% 이상 느려지면 종료 코드 1)
+  python tools/bench_startup.py --baseline tools/startup_baseline.json --threshold 10
+
+  # 웜 스타트 측정 (데이터 디렉토리를 재사용하여 캐시가 있는 상태로 실행)
+  python tools/bench_startup.py --warm
+        """
+    )
+    parser.add_argument('--runs', type=int, default=10, help='실행 횟수 (기본값: 10)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='실행당 제한 시간(초) (기본값: 30)')
+    parser.add_argument('--warm', action='store_true', help='데이터 디렉토리를 재사용하여 웜 스타트 측정')
+    parser.add_argument('--no-importtime', action='store_true', help='-X importtime 없이 실행 (측정 오버헤드 제거)')
+    parser.add_argument('--baseline', help='비교할 기준 JSON 파일 경로')
+    parser.add_argument('--threshold', type=float, default=10.0, help='회귀 판정 임계값 (%%, 기본값: 10)')
+    parser.add_argument('--save-baseline', help='결과를 기준 JSON으로 저장할 경로')
+    parser.add_argument('--output', help='요약 결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs는 1 이상이어야 합니다.")
+
+    print(f"시작 벤치마크: {args.runs}회 실행 ({'웜' if args.warm else '콜드'} 스타트)", file=sys.stderr)
+    try:
+        results = run_benchmark(args.runs, args.timeout, not args.no_importtime, args.warm)
+    except RuntimeError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 2
+
+    summary = summarize(results)
+    summary["mode"] = "warm" if args.warm else "cold"
+    print_summary(summary)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("mode", summary["mode"]) != summary["mode"]:
+            print(f"\n경고: 기준은 {baseline.get('mode')} 스타트 결과입니다.", file=sys.stderr)
+        regressions = compare_with_baseline(summary, baseline, args.threshold)
+        if regressions:
+            print(f"\n성능 회귀 감지 (임계값 {args.threshold}%):")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\n기준 대비 회귀 없음 (임계값 {args.threshold}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())